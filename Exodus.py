@@ -22,21 +22,51 @@
 
 import os
 import sys
+import argparse
+import contextlib
+import fnmatch
+import asyncio
 import threading
 import logging
 import re
 import shutil
+import socket
+import sqlite3
 import configparser
+import csv
+import json
+import hashlib
+import heapq
+import multiprocessing
+import time
 import getpass
+from collections import Counter, deque, namedtuple
 import subprocess
 import pandas as pd
-from datetime import datetime
-from ftplib import FTP
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from datetime import datetime, timedelta
+from ftplib import FTP, error_perm, error_reply, error_temp
 from pathlib import Path
-from pythonping import ping
+from pythonping import executor, payload_provider
 import openpyxl
 import traceback
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QMutex, Qt, QTimer, QUrl, QSize
+from PyQt5.QtCore import (
+    QObject,
+    pyqtSignal,
+    pyqtSlot,
+    Qt,
+    QTimer,
+    QUrl,
+    QSize,
+    QAbstractTableModel,
+    QModelIndex,
+)
 from PyQt5.QtGui import (
     QIcon,
     QPixmap,
@@ -45,6 +75,7 @@ from PyQt5.QtGui import (
     QColor,
     QImage,
     QPalette,
+    QPainter,
 )
 from PyQt5.QtWidgets import (
     QApplication,
@@ -72,20 +103,43 @@ from PyQt5.QtWidgets import (
     QTextEdit,
     QTableWidgetItem,
     QStyledItemDelegate,
-    QSpacerItem,
-    QSizePolicy,
     QStyle,
     QStyleOptionButton,
+    QStyleOptionProgressBar,
+    QTableView,
+    QHeaderView,
     QListWidgetItem,
     QProgressDialog,
     QToolButton,
     QAbstractItemView,
-    QProgressBar,
     QStatusBar,
+    QSpinBox,
+    QDoubleSpinBox,
+    QInputDialog,
 )
 
 TotalRobots = 0
 ThreadCount = 0
+THREAD_COUNTS = [1, 5, 10, 20, 30, 50, 100, 150, 180]  # Choices of simultaneous backups
+
+# Default reachability sweep settings, overridden by Exodus.cfg
+PING_COUNT = 4
+PING_TIMEOUT = 0.8
+PING_PARALLEL = 64
+PING_PAYLOAD_SIZE = 16  # Random bytes a reply has to echo back to count for a probe
+TRANSFER_RETRIES = 3  # Reconnects after a dropped FTP session before giving up on a robot
+RETRY_BACKOFF = 2.0  # Seconds before the first reconnect, doubled for every further attempt
+HOST_TIMEOUT = 1800  # Seconds the asyncio engine gives the backup of one robot
+PROGRESS_INTERVAL = 0.1  # Seconds between the progress snapshots sent to the GUI
+SCHEDULE_RETRY_MINUTES = 5  # Delay of a scheduled run while the previous run of the project is busy
+# Auto concurrency, see ConcurrencyController
+AUTO_CONCURRENCY = 10  # Start of the first Auto run, later runs start where the last one settled
+AUTO_INTERVAL = 10.0  # Seconds of transfers measured before every adjustment
+AUTO_STEP = 2  # Backups added while throughput keeps growing
+AUTO_MAX_ERROR_RATE = 0.05  # Dropped sessions per session opened that count as congestion
+AUTO_MAX_LATENCY = 2.0  # Login slower than this times the best seen counts as congestion
+AUTO_LATENCY_FLOOR = 0.5  # Seconds, logins faster than this never count as congestion
+FTP_IDLE_TIMEOUT = 30.0  # Seconds a logged-in robot session is kept for reuse
 
 
 def resource_path(relative_path):
@@ -108,6 +162,757 @@ def resource_path(relative_path):
     return full_path
 
 
+def exodus_home():
+    # Folder holding the projects and the application settings
+    return os.path.join("C:\\Users", getpass.getuser(), "Documents", "Exodus")
+
+
+PROJECT_STORE_EXTENSION = ".exodb"  # Projects kept in a ProjectStore
+PROJECT_FILE_FILTER = "Project Files (*.ini *.exodb)"
+
+
+def file_sha256(path):
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def load_app_settings():
+    """
+    Reads the application settings from Exodus.cfg in the Exodus folder.
+
+    :return: A ConfigParser with a [Settings] section, empty if the file is missing.
+    """
+    config = configparser.ConfigParser()
+    try:
+        config.read(os.path.join(exodus_home(), "Exodus.cfg"))
+    except Exception as e:
+        print(f"Error reading settings: {str(e)}")
+    if "Settings" not in config:
+        config["Settings"] = {}
+    return config
+
+
+def save_app_settings(config):
+    """
+    Writes the application settings back to Exodus.cfg.
+
+    :param config: The ConfigParser returned by load_app_settings.
+    :return: None
+    """
+    try:
+        os.makedirs(exodus_home(), exist_ok=True)
+        with open(os.path.join(exodus_home(), "Exodus.cfg"), "w") as configfile:
+            config.write(configfile)
+    except Exception as e:
+        print(f"Error saving settings: {str(e)}")
+
+
+# One entry of a remote directory listing, size and modify are None when unknown
+RemoteEntry = namedtuple("RemoteEntry", ["name", "is_dir", "size", "modify"])
+
+UNIX_LIST_REGEX = re.compile(
+    r"^([\-dlbcps])\S{9}\S*\s+\d+\s+\S+(?:\s+\S+)?\s+(\d+)\s+"
+    r"(\w{3}\s+\d{1,2}\s+[\d:]{4,5})\s(.+)$"
+)
+DOS_LIST_REGEX = re.compile(
+    r"^(\d{2}-\d{2}-\d{2,4}\s+\d{1,2}:\d{2}(?:[AaPp][Mm])?)\s+(<DIR>|\d+)\s+(.+)$"
+)
+
+
+def entry_from_mlsd(name, facts):
+    """
+    Builds a RemoteEntry from one MLSD line, skipping the current and parent directory.
+
+    :param name: The entry name.
+    :param facts: The dictionary of MLSD facts (type, size, modify).
+    :return: A RemoteEntry, or None for "." and "..".
+    """
+    entry_type = facts.get("type", "file").lower()
+    if entry_type in ("cdir", "pdir") or name in (".", ".."):
+        return None
+    size = facts.get("size")
+    return RemoteEntry(
+        name,
+        entry_type == "dir",
+        int(size) if size and size.isdigit() else None,
+        facts.get("modify"),
+    )
+
+
+def parse_list_line(line):
+    """
+    Parses one line of a LIST reply in Unix or DOS format.
+
+    :param line: The listing line.
+    :return: A RemoteEntry, or None if the line is not understood.
+    """
+    match = UNIX_LIST_REGEX.match(line)
+    if match:
+        name = match.group(4)
+        if match.group(1) == "l" and " -> " in name:
+            name = name.split(" -> ")[0]
+        if name in (".", ".."):
+            return None
+        return RemoteEntry(
+            name, match.group(1) == "d", int(match.group(2)), match.group(3)
+        )
+    match = DOS_LIST_REGEX.match(line)
+    if match:
+        is_dir = match.group(2) == "<DIR>"
+        return RemoteEntry(
+            match.group(3),
+            is_dir,
+            None if is_dir else int(match.group(2)),
+            match.group(1),
+        )
+    return None
+
+
+def parse_mlsd_line(line):
+    """
+    Splits one MLSD line into its name and facts, like ftplib.FTP.mlsd does.
+
+    :param line: The listing line, e.g. "type=file;size=1024; PROG.TP".
+    :return: A (name, facts) tuple.
+    """
+    facts_found, _, name = line.rstrip("\r\n").partition(" ")
+    facts = {}
+    for fact in facts_found[:-1].split(";"):
+        key, _, value = fact.partition("=")
+        facts[key.lower()] = value
+    return name, facts
+
+
+# One file of a robot backup: directory parts below the root, name, size and modify time
+ManifestEntry = namedtuple("ManifestEntry", ["parts", "name", "size", "modify"])
+
+
+class ManifestProgress:
+    """
+    Tracks the progress of a manifest download by bytes received.
+    Falls back to counting files when the listing did not give every size.
+    """
+
+    def __init__(self, manifest):
+        self.total_files = len(manifest)
+        self.done_files = 0
+        self.done_bytes = 0
+        self.finished_bytes = 0  # Listed sizes of the finished files
+        if all(entry.size is not None for entry in manifest):
+            self.total_bytes = sum(entry.size for entry in manifest)
+        else:
+            self.total_bytes = 0
+
+    def add_bytes(self, count):
+        self.done_bytes += count
+
+    def file_done(self, entry):
+        # Settle on the listed size, so a transfer that restarted or resumed does not
+        # leave its extra or missing bytes in the count of the following files
+        self.done_files += 1
+        self.finished_bytes += entry.size or 0
+        self.done_bytes = self.finished_bytes
+
+    def percent(self):
+        if self.total_bytes:
+            return min(100, int(self.done_bytes * 100 / self.total_bytes))
+        return min(100, int(self.done_files * 100 / max(self.total_files, 1)))
+
+
+class TransferStats:
+    """
+    Counters of all running backups, read and reset by the ConcurrencyController
+    every measuring interval. Safe to update from any thread.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.bytes = 0
+        self.sessions = 0
+        self.errors = 0
+        self.login_time = 0.0
+
+    def add_bytes(self, count):
+        with self.lock:
+            self.bytes += count
+
+    def add_session(self, login_time):
+        with self.lock:
+            self.sessions += 1
+            self.login_time += login_time
+
+    def add_error(self):
+        with self.lock:
+            self.errors += 1
+
+    def take(self):
+        """
+        :return: (bytes, sessions, errors, mean login time) since the last call.
+        """
+        with self.lock:
+            sample = (
+                self.bytes,
+                self.sessions,
+                self.errors,
+                self.login_time / self.sessions if self.sessions else None,
+            )
+            self.reset()
+            return sample
+
+
+REPORTS_FOLDER = "Reports"
+FileTiming = namedtuple("FileTiming", ["robot", "path", "bytes", "seconds"])
+
+
+class RunTelemetry:
+    """
+    Timings of the robots and files of a backup run, kept in memory until the run
+    report is written. Safe to update from any thread.
+    """
+
+    ROBOT_FIELDS = [
+        "robot",
+        "host",
+        "group",
+        "status",
+        "error",
+        "started",
+        "duration_s",
+        "connect_s",
+        "listing_s",
+        "transfer_s",
+        "files",
+        "bytes",
+        "retries",
+    ]
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.robots = {}  # Robot name -> record with the ROBOT_FIELDS
+        self.running = {}  # Robot name -> time.monotonic() of the start
+        self.files = []
+        self.started = datetime.now()
+
+    def begin_run(self):
+        """
+        Starts a new run, unless backups of the current one are still running, e.g.
+        the robots of a scheduled backup. Those all end up in the same report.
+        """
+        with self.lock:
+            if self.running:
+                return
+            self.robots = {}
+            self.files = []
+            self.started = datetime.now()
+
+    def robot_started(self, robot_name, ftp_host, group):
+        with self.lock:
+            self.running[robot_name] = time.monotonic()
+            self.robots[robot_name] = {
+                "robot": robot_name,
+                "host": ftp_host,
+                "group": group or robot_group(ftp_host),
+                "status": "Running",
+                "error": "",
+                "started": datetime.now().isoformat(timespec="seconds"),
+                "duration_s": 0.0,
+                "connect_s": 0.0,
+                "listing_s": 0.0,
+                "transfer_s": 0.0,
+                "files": 0,
+                "bytes": 0,
+                "retries": 0,
+            }
+
+    def add(self, robot_name, field, value):
+        # connect_s, listing_s or retries of a robot, summed over its attempts
+        with self.lock:
+            record = self.robots.get(robot_name)
+            if record:
+                record[field] += value
+
+    def file_done(self, robot_name, path, size, seconds):
+        with self.lock:
+            record = self.robots.get(robot_name)
+            if record:
+                record["files"] += 1
+                record["bytes"] += size
+                record["transfer_s"] += seconds
+            self.files.append(FileTiming(robot_name, path, size, seconds))
+
+    def robot_finished(self, robot_name, status, error):
+        with self.lock:
+            started = self.running.pop(robot_name, None)
+            record = self.robots.get(robot_name)
+            if record:
+                record["status"] = status
+                record["error"] = error
+                if started is not None:
+                    record["duration_s"] = time.monotonic() - started
+
+    def is_empty(self):
+        with self.lock:
+            return not self.robots
+
+    def records(self):
+        with self.lock:
+            return [dict(record) for record in self.robots.values()]
+
+    def summary(self, count=10):
+        """
+        :param count: Number of robots and cells to list.
+        :return: A dictionary with the slowest robots and the slowest cells, a cell
+            being the VLAN or subnet of the robots, see robot_group.
+        """
+        with self.lock:
+            robots = [dict(record) for record in self.robots.values()]
+        cells = {}
+        for record in robots:
+            cell = cells.setdefault(
+                record["group"],
+                {
+                    "group": record["group"],
+                    "robots": 0,
+                    "failed": 0,
+                    "duration_s": 0.0,
+                    "connect_s": 0.0,
+                    "bytes": 0,
+                    "retries": 0,
+                },
+            )
+            cell["robots"] += 1
+            cell["failed"] += record["status"] not in ("Completed", "Running")
+            cell["duration_s"] += record["duration_s"]
+            cell["connect_s"] += record["connect_s"]
+            cell["bytes"] += record["bytes"]
+            cell["retries"] += record["retries"]
+        for cell in cells.values():
+            # Mean per robot, so large and small cells compare
+            cell["duration_s"] /= cell["robots"]
+            cell["connect_s"] /= cell["robots"]
+        return {
+            "slowest_robots": sorted(
+                robots, key=lambda record: record["duration_s"], reverse=True
+            )[:count],
+            "slowest_cells": sorted(
+                cells.values(), key=lambda cell: cell["duration_s"], reverse=True
+            )[:count],
+        }
+
+    def write_report(self, folder):
+        """
+        Writes the run report to folder: a JSON file with every robot, file and the
+        summary, and a CSV file with one line per robot.
+
+        :param folder: The Reports folder of the project.
+        :return: The path of the JSON report.
+        """
+        os.makedirs(folder, exist_ok=True)
+        name = "Exodus_run_" + self.started.strftime("%Y-%m-%d_%HH_%MM")
+        with self.lock:
+            robots = [
+                {
+                    field: round(value, 3) if isinstance(value, float) else value
+                    for field, value in record.items()
+                }
+                for record in self.robots.values()
+            ]
+            files = list(self.files)
+        report = {
+            "started": self.started.isoformat(timespec="seconds"),
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "robots": robots,
+            "files": [
+                timing._replace(seconds=round(timing.seconds, 4))._asdict()
+                for timing in files
+            ],
+            "summary": self.summary(),
+        }
+        json_path = os.path.join(folder, name + ".json")
+        with open(json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        with open(os.path.join(folder, name + ".csv"), "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.ROBOT_FIELDS)
+            writer.writeheader()
+            writer.writerows(robots)
+        return json_path
+
+
+BACKUP_MANIFEST = "Exodus_manifest.json"
+BACKUP_FOLDER_REGEX = re.compile(r"^(.+)_\d{4}-\d{2}-\d{2}_\d{2}H_\d{2}M$")
+
+
+def manifest_key(entry):
+    return "/".join(entry.parts + (entry.name,))
+
+
+def robot_md_folder(robot_folder):
+    return os.path.join(robot_folder, "md")
+
+
+BACKUP_CHECKPOINT = "Exodus_checkpoint.txt"
+
+# Errors of a dropped or stalled session, worth reconnecting for. Other OS errors come
+# from the local disk or an unreachable host and fail the backup at once
+RETRYABLE_ERRORS = (
+    socket.timeout,
+    asyncio.TimeoutError,
+    ConnectionError,
+    EOFError,
+    error_temp,
+    error_reply,
+)
+
+
+def load_checkpoint(robot_folder):
+    """
+    Reads the files an interrupted backup already finished.
+
+    :param robot_folder: The folder of the backup.
+    :return: A set of manifest keys, empty if the backup has no checkpoint.
+    """
+    try:
+        with open(os.path.join(robot_folder, BACKUP_CHECKPOINT), "r") as f:
+            return {line.rstrip("\n") for line in f if line.strip()}
+    except OSError:
+        return set()
+
+
+def record_checkpoint(robot_folder, entry):
+    # One line per finished file, appended so a crash loses at most the current file
+    with open(os.path.join(robot_folder, BACKUP_CHECKPOINT), "a") as f:
+        f.write(manifest_key(entry) + "\n")
+
+
+def resume_offset(entry, local_file_path):
+    """
+    :return: The number of bytes of a partly downloaded file that can be kept,
+        0 if the file has to be downloaded from the start.
+    """
+    if entry.size is None or not os.path.exists(local_file_path):
+        return 0
+    offset = os.path.getsize(local_file_path)
+    return offset if 0 < offset < entry.size else 0
+
+
+def detach_linked_file(local_file_path):
+    # A hard linked file shares its data with an archived copy or a store object, it is
+    # removed before anything is written to that path so the archive stays intact
+    try:
+        if os.stat(local_file_path).st_nlink > 1:
+            os.unlink(local_file_path)
+    except FileNotFoundError:
+        pass
+
+
+def finish_backup(robot_folder, robot_name, ftp_host, manifest):
+    write_backup_manifest(robot_folder, robot_name, ftp_host, manifest)
+    checkpoint_path = os.path.join(robot_folder, BACKUP_CHECKPOINT)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+
+def discard_empty_backup(robot_folder):
+    # A backup that failed before finishing any file holds nothing worth keeping
+    if os.path.exists(robot_folder) and not os.path.exists(
+        os.path.join(robot_folder, BACKUP_CHECKPOINT)
+    ):
+        shutil.rmtree(robot_folder)
+
+
+def write_backup_manifest(robot_folder, robot_name, ftp_host, manifest):
+    """
+    Saves the manifest of a finished backup next to its md folder, so the next
+    incremental backup of the robot can tell which files are unchanged.
+
+    :param robot_folder: The folder of the backup.
+    :param robot_name: The name of the robot.
+    :param ftp_host: The IP address of the robot.
+    :param manifest: The ManifestEntry tuples that were backed up.
+    :return: None
+    """
+    data = {
+        "robot": robot_name,
+        "host": ftp_host,
+        "files": {
+            manifest_key(entry): [entry.size, entry.modify] for entry in manifest
+        },
+    }
+    with open(os.path.join(robot_folder, BACKUP_MANIFEST), "w") as f:
+        json.dump(data, f)
+
+
+def load_backup_manifest(previous_backup):
+    """
+    Reads the manifest written by write_backup_manifest.
+
+    :param previous_backup: The folder of a previous backup, or the manifest of a
+        backup kept in the deduplicated archive store.
+    :return: A dictionary of file key -> (size, modify, path of the previous copy),
+        empty if there is no manifest.
+    """
+    try:
+        if previous_backup.endswith(".json"):
+            store = BackupStore.from_manifest(previous_backup)
+            objects = store.load_manifest(previous_backup)["files"]
+            with open(store.object_path(objects[BACKUP_MANIFEST][0]), "r") as f:
+                files = json.load(f).get("files", {})
+            return {
+                key: (size, modify, store.object_path(objects["md/" + key][0]))
+                for key, (size, modify) in files.items()
+                if "md/" + key in objects
+            }
+        with open(os.path.join(previous_backup, BACKUP_MANIFEST), "r") as f:
+            files = json.load(f).get("files", {})
+        md_folder = robot_md_folder(previous_backup)
+        return {
+            key: (size, modify, os.path.join(md_folder, *key.split("/")))
+            for key, (size, modify) in files.items()
+        }
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def find_previous_backups(archive_folder):
+    """
+    Finds the most recent archived backup of every robot.
+
+    :param archive_folder: The Archive folder of the project.
+    :return: A dictionary of robot name -> backup folder (or store manifest),
+        only backups with a manifest are returned.
+    """
+    previous_backups = {}
+    store = BackupStore(archive_folder)
+    revisions = set(store.revisions())
+    for folder in os.listdir(archive_folder):
+        if folder.startswith("Rev") and folder[3:].isdigit():
+            revisions.add(int(folder[3:]))
+    for rev_number in sorted(revisions, reverse=True):
+        rev_folder = os.path.join(archive_folder, f"Rev{rev_number}")
+        candidates = []
+        if os.path.isdir(rev_folder):
+            for folder in os.listdir(rev_folder):
+                robot_folder = os.path.join(rev_folder, folder)
+                if os.path.exists(os.path.join(robot_folder, BACKUP_MANIFEST)):
+                    candidates.append((folder, robot_folder))
+        for folder in store.backups(rev_number):
+            candidates.append((folder, store.manifest_path(rev_number, folder)))
+        for folder, previous_backup in sorted(candidates, reverse=True):
+            match = BACKUP_FOLDER_REGEX.match(folder)
+            if match and match.group(1) not in previous_backups:
+                previous_backups[match.group(1)] = previous_backup
+    return previous_backups
+
+
+ARCHIVE_INDEX = "Archive.ini"
+LATEST_FOLDER = "Latest"
+
+
+def read_archive_index(archive_folder):
+    """
+    Reads the latest revision number from the archive index file.
+
+    :param archive_folder: The Archive folder of the project.
+    :return: The latest revision number, 0 for an empty archive.
+    """
+    config = configparser.ConfigParser()
+    if config.read(os.path.join(archive_folder, ARCHIVE_INDEX)) and config.has_option(
+        "Archive", "LatestRevision"
+    ):
+        return config.getint("Archive", "LatestRevision")
+
+    # Archive made by an older version without index, scan it once
+    latest_rev = max(BackupStore(archive_folder).revisions(), default=0)
+    for folder in os.listdir(archive_folder):
+        if folder.startswith("Rev") and folder[3:].isdigit():
+            latest_rev = max(latest_rev, int(folder[3:]))
+    return latest_rev
+
+
+def write_archive_index(archive_folder, latest_rev):
+    config = configparser.ConfigParser()
+    config["Archive"] = {"LatestRevision": str(latest_rev)}
+    index_path = os.path.join(archive_folder, ARCHIVE_INDEX)
+    with open(index_path + ".tmp", "w") as configfile:
+        config.write(configfile)
+    os.replace(index_path + ".tmp", index_path)
+
+
+def rotate_backups(main_folder, archive_folder):
+    """
+    Archives the previous generation of backups with a single rename of the
+    Latest folder into the next RevN slot.
+
+    :param main_folder: The backup folder of the project.
+    :param archive_folder: The Archive folder of the project.
+    :return: The new revision number, or None if there was nothing to archive.
+    """
+    latest_folder = os.path.join(main_folder, LATEST_FOLDER)
+    os.makedirs(archive_folder, exist_ok=True)
+    os.makedirs(latest_folder, exist_ok=True)
+
+    # Robot backups made before the Latest folder existed sit next to it, adopt them.
+    # Anything else in the backup folder (run reports, folders of the user) stays put
+    for folder in os.listdir(main_folder):
+        folder_path = os.path.join(main_folder, folder)
+        if BACKUP_FOLDER_REGEX.match(folder) and os.path.isdir(folder_path):
+            os.rename(folder_path, os.path.join(latest_folder, folder))
+
+    if not os.listdir(latest_folder):
+        return None
+
+    next_rev = read_archive_index(archive_folder) + 1
+    while os.path.exists(os.path.join(archive_folder, f"Rev{next_rev}")):
+        next_rev += 1
+    os.rename(latest_folder, os.path.join(archive_folder, f"Rev{next_rev}"))
+    write_archive_index(archive_folder, next_rev)
+    os.makedirs(latest_folder)
+    return next_rev
+
+
+def reuse_unchanged_file(entry, previous, local_file_path):
+    """
+    Links the previous copy of a file instead of downloading it again when its
+    size and modify time are the same as in the previous backup.
+
+    :param entry: The ManifestEntry of the file.
+    :param previous: The manifest of the previous backup, see load_backup_manifest.
+    :param local_file_path: Where the file belongs in the new backup.
+    :return: True if the file was reused, False if it has to be downloaded.
+    """
+    if entry.size is None or entry.modify is None:
+        return False
+    old = previous.get(manifest_key(entry))
+    if not old or [old[0], old[1]] != [entry.size, entry.modify]:
+        return False
+    source = old[2]
+    if not os.path.isfile(source) or os.path.getsize(source) != entry.size:
+        return False
+    # Left over from an interrupted attempt, linking or copying onto it would fail
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(local_file_path)
+    try:
+        os.link(source, local_file_path)  # Hard link, no extra disk space
+    except OSError:
+        try:
+            shutil.copy2(source, local_file_path)
+        except OSError:
+            return False  # Pruned from the archive meanwhile, download it
+    return True
+
+
+def split_host(ftp_host):
+    """
+    :param ftp_host: The address of a robot, optionally with a port, e.g. "10.0.0.5:2121".
+    :return: (host, port), port 21 if none is given.
+    """
+    host, _, port = ftp_host.partition(":")
+    return host, int(port) if port else 21
+
+
+def matches_extension(item, selected_extensions):
+    """
+    Checks a file name against the extensions selected in the Main tab.
+    Files without an extension are always backed up.
+
+    :param item: The file name.
+    :param selected_extensions: "." for all files, otherwise a list such as [".tp", ".va"].
+    :return: True if the file should be backed up.
+    """
+    if selected_extensions == "." or "." not in item:
+        return True
+    extension = "." + item.split(".")[1]
+    return extension in selected_extensions
+
+
+def robot_group(ip_address, vlan=None):
+    """
+    Groups robots by the link they share for the concurrency and bandwidth limits.
+
+    :param ip_address: The IP address of the robot.
+    :param vlan: The VLAN the robot was imported from, if known.
+    :return: The VLAN, otherwise the /24 subnet of the robot, e.g. "10.20.30.0/24".
+    """
+    if vlan:
+        return vlan.upper()
+    parts = split_host(ip_address)[0].split(".")
+    return ".".join(parts[:3]) + ".0/24" if len(parts) == 4 else ip_address
+
+
+def load_group_limits(project_file_path):
+    """
+    Reads the [GroupLimits] section of a project, one "max backups, bytes per second"
+    entry per group, 0 for no limit. The DEFAULT entry applies to every group
+    without its own entry.
+
+    :return: A dictionary of group -> (max backups, bytes per second).
+    """
+    if is_project_store(project_file_path):
+        return ProjectStore(project_file_path).group_limits()
+    config = configparser.ConfigParser()
+    config.read(project_file_path)
+    limits = {}
+    if config.has_section("GroupLimits"):
+        for group, value in config.items("GroupLimits"):
+            try:
+                max_backups, bytes_per_second = (int(part) for part in value.split(","))
+            except ValueError:
+                continue
+            limits[group.upper()] = (max_backups, bytes_per_second)
+    return limits
+
+
+def save_group_limits(project_file_path, limits):
+    if is_project_store(project_file_path):
+        ProjectStore(project_file_path).set_group_limits(limits)
+        return
+    config = configparser.ConfigParser()
+    config.read(project_file_path)
+    config.remove_section("GroupLimits")
+    if limits:
+        config["GroupLimits"] = {
+            group: f"{max_backups}, {bytes_per_second}"
+            for group, (max_backups, bytes_per_second) in limits.items()
+        }
+    with open(project_file_path, "w") as configfile:
+        config.write(configfile)
+
+
+class TokenBucket:
+    """
+    Bytes per second budget shared by the transfers of a group. Callers reserve the
+    bytes they received and sleep for the returned time, which paces the group as a
+    whole to the rate.
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.capacity = rate  # Up to one second of burst
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, count):
+        """
+        :param count: Number of bytes transferred.
+        :return: Seconds the caller has to wait before transferring more.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= count
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
 class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
     def __init__(self):
         super().__init__()
@@ -172,19 +977,22 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
 
             self.mainleft_layout = QVBoxLayout()
 
-            self.info_box = QTableWidget()
-            self.info_box.setStyleSheet("QTableWidget { border-radius: 10px; }")
+            self.robot_model = RobotTableModel(self)
+            self.info_box = QTableView()
+            self.info_box.setModel(self.robot_model)
+            self.info_box.setStyleSheet("QTableView { border-radius: 10px; }")
 
-            self.info_box.setColumnCount(3)
-            self.info_box.setColumnWidth(0, 100)
-            self.info_box.setColumnWidth(1, 150)
+            self.info_box.setColumnWidth(RobotTableModel.NAME, 100)
+            self.info_box.setColumnWidth(RobotTableModel.IP, 150)
             self.info_box.verticalHeader().setVisible(False)
-            self.info_box.setGridStyle(False)
-            self.info_box.setSelectionMode(QTableWidget.NoSelection)
-            self.info_box.setEditTriggers(QTableWidget.NoEditTriggers)
+            self.info_box.verticalHeader().setDefaultSectionSize(24)
+            self.info_box.setShowGrid(False)
+            self.info_box.setSelectionMode(QAbstractItemView.NoSelection)
+            self.info_box.setEditTriggers(QAbstractItemView.NoEditTriggers)
             self.info_box.setFocusPolicy(Qt.NoFocus)
-            self.info_box.setHorizontalHeaderLabels(
-                ["Robot Name", "IP Address", "Status"]
+            self.info_box.setAlternatingRowColors(True)
+            self.info_box.setItemDelegateForColumn(
+                RobotTableModel.STATUS, StatusBadgeDelegate(self.info_box)
             )
 
             self.mainleft_layout.addWidget(self.info_box)
@@ -192,7 +1000,8 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
             self.mainright_layout = QVBoxLayout()
             selection_group_box = QGroupBox("Simultaneous Backups")
             selection_group_box.setToolTip(
-                "Number of Robots that can be set for backup at the same time\n Higher number will speed up the backup process."
+                "Number of Robots that can be set for backup at the same time\n Higher number will speed up the backup process.\n"
+                " Can be changed while backups are running."
             )
             selection_group_box.setFixedSize(200, 60)
             selection_group_boxlayout = QVBoxLayout()
@@ -206,8 +1015,14 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
             self.thread_count_combobox.setEditable(False)
             self.thread_count_combobox.setFixedSize(100, 20)
             self.thread_count_combobox = QComboBox()
-            thread_counts = [1, 5, 10, 20, 30, 50, 100, 150, 180]
-            self.thread_count_combobox.addItems([str(count) for count in thread_counts])
+            self.thread_count_combobox.addItems([str(count) for count in THREAD_COUNTS])
+            self.thread_count_combobox.addItem("Auto")
+            self.thread_count_combobox.setItemData(
+                len(THREAD_COUNTS),
+                "Tunes the simultaneous backups from the measured throughput,\n"
+                "dropped connections and login times during the backup",
+                Qt.ToolTipRole,
+            )
             self.thread_count_combobox.setCurrentIndex(2)  # Default to 10 threads
             self.thread_count_combobox.currentIndexChanged.connect(
                 self.update_thread_count
@@ -286,8 +1101,17 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
                 self.extension_checkboxes_layout
             )
             backupButton_group_box = QGroupBox()
-            backupButton_group_box.setFixedSize(200, 40)
+            backupButton_group_box.setFixedSize(200, 65)
             backupButton_group_boxlayout = QVBoxLayout()
+            self.incremental_checkbox = QCheckBox("Incremental Backup", self)
+            self.incremental_checkbox.setToolTip(
+                "Only download files that changed since the last backup of each robot.\n"
+                "Unchanged files are linked from the previous backup."
+            )
+            self.incremental_checkbox.setChecked(
+                load_app_settings()["Settings"].getboolean("Incremental", fallback=False)
+            )
+            backupButton_group_boxlayout.addWidget(self.incremental_checkbox)
             self.backup_button = QPushButton("Initiate Backups")
             self.backup_button.setStatusTip("Open Project to start backups")
 
@@ -351,8 +1175,10 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
             self.completed_group_box = QGroupBox("Completed Backups")
             self.completed_layout = QVBoxLayout()
             self.completed_group_box.setFixedWidth(300)
-            self.completed_list_widget = QListWidget()
-            self.completed_layout.addWidget(self.completed_list_widget)
+            self.completed_model = BackupStatusModel(self)
+            self.completed_view = self.create_status_view(self.completed_model)
+            self.completed_view.setColumnHidden(BackupStatusModel.PROGRESS, True)
+            self.completed_layout.addWidget(self.completed_view)
             self.completed_group_box.setLayout(self.completed_layout)
             self.left_layout.addWidget(self.completed_group_box)
             self.project_layout.addLayout(self.left_layout)
@@ -360,8 +1186,12 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
             self.scheduled_group_box = QGroupBox("Scheduled and Running Backups")
             self.scheduled_layout = QVBoxLayout()
             self.scheduled_group_box.setFixedWidth(385)
-            self.scheduled_list_widget = QListWidget()
-            self.scheduled_layout.addWidget(self.scheduled_list_widget)
+            self.scheduled_model = BackupStatusModel(self)
+            self.scheduled_view = self.create_status_view(self.scheduled_model)
+            self.scheduled_view.setItemDelegateForColumn(
+                BackupStatusModel.PROGRESS, ProgressBarDelegate(self.scheduled_view)
+            )
+            self.scheduled_layout.addWidget(self.scheduled_view)
             self.scheduled_group_box.setLayout(self.scheduled_layout)
             self.right_layout.addWidget(self.scheduled_group_box)
 
@@ -383,7 +1213,33 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
             self.project_layout.addLayout(self.right_layout)
 
             self.worker = Worker()
-            self.worker.progress_signal.connect(self.update_progress)
+            self.worker.progress_signal.connect(self.update_progress_snapshot)
+
+            settings = load_app_settings()["Settings"]
+            self.sweeper = ReachabilitySweeper()
+            self.sweeper.configure(
+                settings.getint("PingCount", fallback=PING_COUNT),
+                settings.getfloat("PingTimeout", fallback=PING_TIMEOUT),
+                settings.getint("PingParallel", fallback=PING_PARALLEL),
+            )
+            self.worker.set_engine(settings.getboolean("AsyncEngine", fallback=False))
+            self.worker.set_retry_policy(
+                settings.getint("TransferRetries", fallback=TRANSFER_RETRIES),
+                settings.getfloat("RetryBackoff", fallback=RETRY_BACKOFF),
+                settings.getfloat("HostTimeout", fallback=HOST_TIMEOUT),
+            )
+            self.dedup_archive = settings.getboolean("DedupArchive", fallback=False)
+            self.keep_revisions = settings.getint("KeepRevisions", fallback=0)
+            self.auto_concurrency = ConcurrencyController(self.worker)
+            self.auto_concurrency.limit_changed.connect(self.auto_concurrency_changed)
+            self.scheduler = BackupScheduler(self.worker)
+            self.scheduler.run_started.connect(self.scheduled_backup_started)
+            self.scheduler.load_folder(exodus_home())
+            self.sweeper.status_signal.connect(self.update_robot_status)
+            self.sweeper.finished_signal.connect(self.status_sweep_finished)
+            self.sweep_id = 0
+            self.status_total = 0
+            self.status_checked = 0
             self.create_menu_bar()  # Create menu bar
         except Exception as e:
             if self.logger:
@@ -405,11 +1261,38 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
     def update_thread_count(self):
 
         global Thread_count
+        if self.thread_count_combobox.currentText() == "Auto":
+            # Start where the last Auto run settled, the controller takes it from there
+            Thread_count = (
+                load_app_settings()["Settings"].getint(
+                    "AutoConcurrency", fallback=AUTO_CONCURRENCY
+                )
+            )
+            self.auto_concurrency.start(Thread_count)
+            return Thread_count
+        self.auto_concurrency.stop()
         selected_index = self.thread_count_combobox.currentIndex()
-        thread_counts = [1, 5, 10, 20, 30, 50, 100, 150, 180]
-        Thread_count = thread_counts[selected_index]
+        Thread_count = THREAD_COUNTS[selected_index]
+        self.worker.set_pool_size(Thread_count)  # Also resizes a running backup
         return Thread_count
 
+    @pyqtSlot(int)
+    def auto_concurrency_changed(self, count):
+        self.status_bar.showMessage(f"Auto: {count} simultaneous backups", 10000)
+
+    def save_auto_concurrency(self):
+        # Remembers what the Auto run settled on as the start of the next one
+        if not self.auto_concurrency.active:
+            return
+        count = self.auto_concurrency.settled()
+        self.auto_concurrency.stop()
+        config = load_app_settings()
+        config["Settings"]["AutoConcurrency"] = str(count)
+        save_app_settings(config)
+        self.status_bar.showMessage(
+            f"Auto concurrency settled on {count} simultaneous backups"
+        )
+
     def toggle_logger(self):
 
         if self.logger is None:
@@ -423,13 +1306,14 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
                 )
                 self.logger = logging.getLogger(__name__)
                 self.logger.info("Logger turned on")
-                self.update_scheduled_list("logger_on")
+                self.status_bar.showMessage(f"Logger turned on, writing {log_file_path}")
             except Exception as e:
                 print("Error occurred while setting up logger:", e)
         else:
             logging.shutdown()
             self.logger = None
             print("Logger turned off")
+            self.status_bar.showMessage("Logger turned off", 5000)
 
     def open_backup_folder(self):
 
@@ -464,6 +1348,7 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
         menubar = self.menuBar()
 
         fileMenu = menubar.addMenu("File")
+        settingsMenu = menubar.addMenu("Settings")
         helpMenu = menubar.addMenu("Help")
 
         exitAction = QAction("&Exit", self)
@@ -490,6 +1375,59 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
         aboutAction.setStatusTip("About this application")
         aboutAction.triggered.connect(self.show_about_dialog)
 
+        statusSettingsAction = QAction("&Status Check", self)
+        statusSettingsAction.setStatusTip("Ping count, timeout and parallel probes")
+        statusSettingsAction.triggered.connect(self.show_status_settings_dialog)
+
+        retrySettingsAction = QAction("Transfer Re&tries", self)
+        retrySettingsAction.setStatusTip("Reconnects and backoff after a dropped robot connection")
+        retrySettingsAction.triggered.connect(self.show_retry_settings_dialog)
+
+        asyncEngineAction = QAction("&Async Transfer Engine", self)
+        asyncEngineAction.setCheckable(True)
+        asyncEngineAction.setChecked(self.worker.use_async)
+        asyncEngineAction.setStatusTip(
+            "Run all backups from a single event loop, for very high simultaneous backup counts"
+        )
+        asyncEngineAction.toggled.connect(self.toggle_async_engine)
+
+        dedupArchiveAction = QAction("&Deduplicated Archive", self)
+        dedupArchiveAction.setCheckable(True)
+        dedupArchiveAction.setChecked(self.dedup_archive)
+        dedupArchiveAction.setStatusTip(
+            "Archive previous backups in a store that keeps every file only once"
+        )
+        dedupArchiveAction.toggled.connect(self.toggle_dedup_archive)
+
+        groupLimitsAction = QAction("&Cell Limits", self)
+        groupLimitsAction.setStatusTip(
+            "Simultaneous backups and bandwidth per VLAN or subnet of the open project"
+        )
+        groupLimitsAction.triggered.connect(self.show_group_limits_dialog)
+
+        retentionAction = QAction("Archive &Retention", self)
+        retentionAction.setStatusTip("Number of archived revisions to keep")
+        retentionAction.triggered.connect(self.show_retention_dialog)
+
+        scheduleAction = QAction("Backup &Schedule", self)
+        scheduleAction.setStatusTip("Recurring backups of the open project")
+        scheduleAction.triggered.connect(self.show_schedule_dialog)
+
+        convertProjectAction = QAction("&Convert Project", self)
+        convertProjectAction.setStatusTip(
+            "Convert an .ini project to a project database, or a project database back to .ini"
+        )
+        convertProjectAction.triggered.connect(self.show_convert_project_dialog)
+
+        runReportAction = QAction("Run Re&port", self)
+        runReportAction.setStatusTip("Slowest robots and cells of the last backup run")
+        runReportAction.triggered.connect(self.show_run_report_dialog)
+
+        restoreAction = QAction("&Restore Revision", self)
+        restoreAction.setShortcut("Ctrl+R")
+        restoreAction.setStatusTip("Browse and restore archived revisions")
+        restoreAction.triggered.connect(self.show_restore_dialog)
+
         guideAction = QAction("&Guide", self)
         guideAction.setStatusTip("User Guide")
         guideAction.triggered.connect(self.show_guide_dialog)
@@ -497,10 +1435,133 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
         fileMenu.addAction(createprojectAction)
         fileMenu.addAction(editprojectAction)
         fileMenu.addAction(OpenprojectAction)
+        fileMenu.addAction(convertProjectAction)
+        fileMenu.addAction(scheduleAction)
+        fileMenu.addAction(restoreAction)
+        fileMenu.addAction(runReportAction)
         fileMenu.addAction(exitAction)
+        settingsMenu.addAction(statusSettingsAction)
+        settingsMenu.addAction(retrySettingsAction)
+        settingsMenu.addAction(groupLimitsAction)
+        settingsMenu.addAction(asyncEngineAction)
+        settingsMenu.addAction(dedupArchiveAction)
+        settingsMenu.addAction(retentionAction)
         helpMenu.addAction(aboutAction)
         helpMenu.addAction(guideAction)
 
+    def show_status_settings_dialog(self):
+        dialog = StatusCheckSettingsDialog(
+            self.sweeper.count, self.sweeper.timeout, self.sweeper.max_in_flight
+        )
+        if dialog.exec_():
+            count, timeout, parallel = dialog.values()
+            self.sweeper.configure(count, timeout, parallel)
+            config = load_app_settings()
+            config["Settings"]["PingCount"] = str(count)
+            config["Settings"]["PingTimeout"] = str(timeout)
+            config["Settings"]["PingParallel"] = str(parallel)
+            save_app_settings(config)
+
+    def show_retry_settings_dialog(self):
+        dialog = TransferRetrySettingsDialog(
+            self.worker.retries, self.worker.retry_backoff, self.worker.host_timeout
+        )
+        if dialog.exec_():
+            retries, backoff, host_timeout = dialog.values()
+            self.worker.set_retry_policy(retries, backoff, host_timeout)
+            config = load_app_settings()
+            config["Settings"]["TransferRetries"] = str(retries)
+            config["Settings"]["RetryBackoff"] = str(backoff)
+            config["Settings"]["HostTimeout"] = str(host_timeout)
+            save_app_settings(config)
+
+    def show_group_limits_dialog(self):
+        if not hasattr(self, "project_file_path"):
+            QMessageBox.warning(self, "Error", "Please open a project first.")
+            return
+        _, robots, vlans = load_project(self.project_file_path)
+        groups = Counter(
+            robot_group(ip_address, vlans.get(robot_name))
+            for robot_name, ip_address in robots
+            if ip_address
+        )
+        dialog = GroupLimitsDialog(groups, load_group_limits(self.project_file_path))
+        if dialog.exec_():
+            limits = dialog.limits()
+            try:
+                save_group_limits(self.project_file_path, limits)
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Failed to save cell limits: {e}")
+                return
+            # Also applies to the backups already queued
+            self.worker.set_group_limits(limits)
+
+    def toggle_async_engine(self, checked):
+        self.worker.set_engine(checked)
+        config = load_app_settings()
+        config["Settings"]["AsyncEngine"] = str(checked)
+        save_app_settings(config)
+
+    def toggle_dedup_archive(self, checked):
+        self.dedup_archive = checked
+        config = load_app_settings()
+        config["Settings"]["DedupArchive"] = str(checked)
+        save_app_settings(config)
+
+    def show_retention_dialog(self):
+        keep_revisions, ok = QInputDialog.getInt(
+            self,
+            "Archive Retention",
+            "Revisions to keep (0 = keep all):",
+            self.keep_revisions,
+            0,
+            10000,
+        )
+        if ok:
+            self.keep_revisions = keep_revisions
+            config = load_app_settings()
+            config["Settings"]["KeepRevisions"] = str(keep_revisions)
+            save_app_settings(config)
+
+    def show_schedule_dialog(self):
+        if not hasattr(self, "project_file_path"):
+            QMessageBox.warning(self, "Error", "Please open a project first.")
+            return
+        jobs = self.scheduler.jobs.get(self.project_file_path) or load_schedule(
+            self.project_file_path
+        )
+        dialog = ScheduleDialog(jobs)
+        if dialog.exec_():
+            try:
+                self.scheduler.set_jobs(self.project_file_path, dialog.jobs())
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Failed to save schedule: {e}")
+
+    @pyqtSlot(str, str, list)
+    def scheduled_backup_started(self, project_file_path, job_name, robot_names):
+        global TotalRobots
+        TotalRobots += len(robot_names)
+        self.scheduled_model.add_robots(robot_names, "Scheduled")
+        self.backup_button.setEnabled(False)
+        self.status_bar.showMessage(
+            f"Scheduled backup {job_name} of "
+            f"{os.path.splitext(os.path.basename(project_file_path))[0]} started",
+            10000,
+        )
+
+    def show_restore_dialog(self):
+        if not hasattr(self, "backup_path"):
+            QMessageBox.warning(self, "Error", "Please open a project first.")
+            return
+        store = BackupStore(self.backup_path + "\\" + "Archive")
+        if not store.revisions():
+            QMessageBox.information(
+                self, "Restore Revision", "No revisions in the deduplicated archive."
+            )
+            return
+        dialog = RestoreRevisionDialog(store)
+        dialog.exec_()
+
     def showNewFileDialog(self):
         self.new_dialog = ProjectConfigEditor()
         self.new_dialog.exec_()
@@ -510,13 +1571,26 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
         self.edit_dialog.editProject()
         self.edit_dialog.exec_()
 
+    def show_convert_project_dialog(self):
+        project_file_path, _ = QFileDialog.getOpenFileName(
+            self, "Convert Project", exodus_home(), PROJECT_FILE_FILTER
+        )
+        if not project_file_path:
+            return
+        try:
+            converted = convert_project(project_file_path)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Failed to convert project: {e}")
+            return
+        QMessageBox.information(self, "Convert Project", f"Project saved as {converted}")
+
     def show_open_project_dialog(self):
         user_documents_path = os.path.join("C:\\Users", getpass.getuser(), "Documents")
         robot_backup_path = os.path.join(user_documents_path, "Exodus")
 
         if os.path.exists(robot_backup_path):
             openfile = QFileDialog.getOpenFileName(
-                self, "Open Project", robot_backup_path, "Project Files (*.ini)"
+                self, "Open Project", robot_backup_path, PROJECT_FILE_FILTER
             )
             if openfile[0]:
                 self.open_project(openfile[0])
@@ -529,21 +1603,12 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
             QMessageBox.warning(self, "Error", "Project file does not exist.")
             return
 
-        config = configparser.ConfigParser()
         try:
-            config.read(project_file_path)
+            backup_directory, robots_section, _ = load_project(project_file_path)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to read project file: {e}")
             return
 
-        backup_directory = config.get("General", "BackupDirectory", fallback="")
-        tempdir = os.path.splitext(os.path.basename(project_file_path))[0]
-        # print(backup_directory + "\\" + tempdir)
-        backup_directory = backup_directory + "\\" + tempdir
-
-        robots_section = config.items("Robots")
-        # print(robots_section)
-
         self.populate_data(backup_directory, robots_section, project_file_path)
 
         if not robots_section == []:
@@ -553,62 +1618,14 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
 
     def populate_data(self, backup_directory, robots_section, project_file_path):
         try:
-            # Initialize QProgressDialog
-            progress_dialog = QProgressDialog(
-                "Loading data...", None, 0, len(robots_section), self
-            )
-            progress_dialog.setWindowModality(Qt.WindowModal)
-            progress_dialog.setWindowTitle("Importing")
-            progress_dialog.setMinimumDuration(0)
-            progress_dialog.setValue(0)
-            progress_dialog.setCancelButton(None)
-            progress_dialog.setWindowFlags(
-                progress_dialog.windowFlags() & ~Qt.WindowCloseButtonHint
-            )  # Disable the close button
-            self.info_box.clearContents()  # Clear existing contents
-            self.info_box.setRowCount(len(robots_section))
-
-            row = 0
-            for robot_name, ip_address in robots_section:
-                if progress_dialog.wasCanceled():
-                    break
-
-                ip_item = QTableWidgetItem(ip_address)
-                ip_item.setTextAlignment(Qt.AlignCenter)  # Align the item in the center
-
-                # Create a custom widget to hold the checkbox and text
-                widget = QWidget()
-                layout = QHBoxLayout()
-                checkbox = QCheckBox()
-                label = QLabel(robot_name.upper())
-
-                layout.addWidget(checkbox)
-                spacer_item = QSpacerItem(2, 2, QSizePolicy.Fixed, QSizePolicy.Minimum)
-                layout.addItem(spacer_item)
-                layout.addWidget(label)
-                layout.setContentsMargins(0, 0, 0, 0)
-                widget.setLayout(layout)
-
-                # Set the custom widget as the cell widget in the first column
-                self.info_box.setCellWidget(row, 0, widget)
-
-                # Set the IP address as a regular item in the second column
-                self.info_box.setItem(row, 1, ip_item)
-
-                self.info_box.setAlternatingRowColors(True)
-
-                is_online = self.is_robot_alive(ip_item.text())
-                status_label = QLabel()
-                status_label.setText("Online" if is_online else "Offline")
-                status_label.setStyleSheet(
-                    f"background-color: {'#7ABA78' if is_online else '#F2613F'}; color: white; border-radius: 5px; padding: 2px 5px;"
-                )
-                self.info_box.setCellWidget(row, 2, status_label)
-
-                row += 1
-                progress_dialog.setValue(row)  # Update the progress dialog
+            # Build the table straight from the project file, status is filled in
+            # afterwards by the background sweep
+            self.sweeper.cancel()
+            self.robot_model.set_robots(robots_section)
 
             self.backup_path = backup_directory
+            self.project_file_path = project_file_path
+            self.scheduler.load_project(project_file_path)
             self.Filename.setText(os.path.basename(project_file_path))
             self.Filename.setStyleSheet(
                 "background-color: #005FB8; color: white; border-radius: 5px; font-weight: bold; padding: 5px;"
@@ -618,111 +1635,75 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
                 + "Current Project:  "
                 + os.path.splitext(os.path.basename(project_file_path))[0]
             )
-
-            progress_dialog.setValue(len(robots_section))  # Close the progress dialog
-            self.statuscheck_button.setEnabled(True)
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error populating data: {str(e)}")
             else:
                 print(f"Error populating data: {str(e)}")
-            progress_dialog.cancel()
+
+        self.check_robot_status_button()
 
     def select_robots_by_status(self):
-        # Get the status of checkboxes
+        # Select the robots that are online, unselect all others
         select_online_checked = self.selectonline_checkbox.isChecked()
-
-        # Iterate through rows in the main table
-        for row in range(self.info_box.rowCount()):
-            robot_name_widget = self.info_box.cellWidget(row, 0)
-            robot_name_checkbox = robot_name_widget.findChild(QCheckBox)
-
-            status_label = self.info_box.cellWidget(row, 2)
-            status_text = status_label.text()
-
-            # Check if the robot should be selected based on checkbox states and status
-            if (
-                select_online_checked
-                and status_text == "Online"
-                and robot_name_checkbox
-            ):
-                robot_name_checkbox.setChecked(True)
-            else:
-                robot_name_checkbox.setChecked(False)
+        self.robot_model.check_where(
+            lambda robot: select_online_checked and robot.status is True
+        )
 
     def select_all_robots(self, state):
-        # Get the state of the "Select All" checkbox
-        select_all_checked = self.selectall_checkbox.isChecked()
-
-        # Iterate through rows in the main table
-        for row in range(self.info_box.rowCount()):
-            # Find the checkbox in the first column of each row
-            checkbox_item = self.info_box.cellWidget(row, 0)
-            if isinstance(checkbox_item, QWidget):
-                checkbox = checkbox_item.findChild(QCheckBox)
-                # Check or uncheck the checkbox based on the state of the "Select All" checkbox
-                if checkbox:
-                    checkbox.setChecked(select_all_checked)
+        # Check or uncheck every robot based on the state of the "Select All" checkbox
+        self.robot_model.set_all_checked(self.selectall_checkbox.isChecked())
 
     def check_robot_status_button(self):
-        # Initialize QProgressDialog
-        progress_dialog = QProgressDialog(
-            "Checking robot status...", None, 0, self.info_box.rowCount(), self
+        # Ping every robot in the background, results are filled in as they arrive
+        # and the table stays usable while the sweep runs
+        targets = self.robot_model.targets()
+        self.robot_model.set_all_status(None)
+
+        self.status_total = len(targets)
+        self.status_checked = 0
+        self.statuscheck_button.setEnabled(False)
+        self.status_bar.showMessage(f"Checking robot status... 0/{self.status_total}")
+        self.sweep_id = self.sweeper.sweep(targets)
+
+    @pyqtSlot(int, int, bool)
+    def update_robot_status(self, sweep_id, row, is_online):
+        # Ignore late results of a sweep that has been replaced
+        if sweep_id != self.sweep_id:
+            return
+        self.set_robot_status(row, is_online)
+        self.status_checked += 1
+        self.status_bar.showMessage(
+            f"Checking robot status... {self.status_checked}/{self.status_total}"
         )
-        progress_dialog.setWindowModality(Qt.WindowModal)
-        progress_dialog.setWindowTitle("Querying Robots")
-        progress_dialog.setMinimumDuration(0)
-        progress_dialog.setCancelButton(None)
-        progress_dialog.setWindowFlags(
-            progress_dialog.windowFlags() & ~Qt.WindowCloseButtonHint
-        )  # Disable the close button
-
-        # Iterate through rows in the main table
-        for row in range(self.info_box.rowCount()):
-            if progress_dialog.wasCanceled():
-                break
-
-            robot_name_widget = self.info_box.cellWidget(row, 0)
-            robot_name_checkbox = (
-                robot_name_widget.layout().itemAt(0).widget()
-            )  # Find the checkbox
-            ip_address_item = self.info_box.item(row, 1)
-
-            if robot_name_checkbox and ip_address_item:
-                ip_address = ip_address_item.text()
-                is_online = self.is_robot_alive(ip_address)
-                status_label = QLabel()
-                status_label.setText("Online" if is_online else "Offline")
-                status_label.setStyleSheet(
-                    f"background-color: {'#7ABA78' if is_online else '#F2613F'}; color: white; border-radius: 5px; padding: 2px 5px;"
-                )
-                self.info_box.setCellWidget(row, 2, status_label)
-
-            self.info_box.setCellWidget(row, 2, status_label)
 
-            progress_dialog.setValue(row + 1)  # Update the progress dialog
+    @pyqtSlot(int)
+    def status_sweep_finished(self, sweep_id):
+        if sweep_id != self.sweep_id:
+            return
+        self.status_bar.showMessage("Robot status check completed", 5000)
+        self.statuscheck_button.setEnabled(True)
+        try:
+            record_project_run(
+                self.project_file_path,
+                statuses=[
+                    (robot.name, robot.status)
+                    for robot in self.robot_model.robots
+                    if robot.status is not None
+                ],
+            )
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error saving robot status: {str(e)}")
+            print(f"Error saving robot status: {str(e)}")
 
-        progress_dialog.setValue(self.info_box.rowCount())  # Close the progress dialog
+    def set_robot_status(self, row, is_online):
+        # is_online is None while the robot has not been checked yet
+        self.robot_model.set_status(row, is_online)
 
     def compile_robot_info(self):
         try:
-            self.robot_info = []
-            for row in range(self.info_box.rowCount()):
-                robot_name_widget = self.info_box.cellWidget(row, 0)
-                robot_name_checkbox = robot_name_widget.findChild(QCheckBox)
-                if robot_name_checkbox and robot_name_checkbox.isChecked():
-                    robot_name_label = robot_name_widget.layout().itemAt(2).widget()
-                    robot_name = (
-                        robot_name_label.text().strip()
-                        if isinstance(robot_name_label, QLabel)
-                        else ""
-                    )
-                    ip_item = self.info_box.item(row, 1)
-                    ip_address = ip_item.text()
-
-                    # Check if the robot is selected
-                    if robot_name and ip_address:
-                        self.robot_info.append((robot_name, ip_address))
+            self.robot_info = self.robot_model.checked_robots()
 
             # Print or log the compiled robot_info for verification
             # print("Compiled robot_info:", self.robot_info)
@@ -746,7 +1727,7 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
             "<h2 style='color:black;'>Exodus Robot Backup Tool</h2>"
             "<p>Author: MSVNBAPATEL</p>"
             "<p>Email: <a href='mailto:amit.patel1@magna.com'>amit.patel1@magna.com</a></p>"
-            "<p>Runtime version: 3.7</p>"
+            "<p>Runtime version: 3.8</p>"
             "</div>"
             "</div>"
             "</body></html>"
@@ -820,82 +1801,6 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
         # self.terminate_threads()
         event.accept()  # Accept the close event
 
-    def select_file(self):
-
-        self.scheduled_list_widget.clear()
-        file_dialog = QFileDialog(self)
-        file_path, _ = file_dialog.getOpenFileName(
-            self, "Select File", "", "Text files (*.txt)"
-        )
-        if file_path:
-            self.file_path = file_path
-            self.Filename.setText(os.path.basename(file_path))
-            self.Filename.setStyleSheet(
-                "background-color: #005FB8 ;color: white;"
-                " border-radius: 5px ;font-weight: bold;"
-                "padding: 5px 5px 5px 5px;"
-            )
-            try:
-                if self.logger:
-                    self.logger.info("Reading file")
-
-                self.read_robot_info(file_path)
-                self.check_robot_status()
-                if self.robot_info == []:
-                    self.backup_button.setEnabled(False)
-                else:
-                    self.backup_button.setEnabled(True)
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"Error reading file: {str(e)}")
-
-    def check_robot_status(self):
-
-        for robot_name, ip_address in self.robot_info:
-            if ip_address:
-                if not self.is_robot_alive(ip_address):
-
-                    self.remove_robot_info(robot_name)
-                    self.update_scheduled_list(
-                        f"{robot_name} - Offline - Not Scheduled"
-                    )
-                else:
-                    self.update_scheduled_list(f"{robot_name} - Online")
-
-    def is_robot_alive(self, ip_address):
-
-        try:
-            response = ping(ip_address, count=4, timeout=0.8)
-            return response.success()
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error occurred while pinging {ip_address}: {e}")
-
-            print(f"Error occurred while pinging {ip_address}: {e}")
-            return False
-
-    def remove_robot_info(self, robot_name):
-
-        self.robot_info = [
-            (name, ip) for name, ip in self.robot_info if name != robot_name
-        ]
-
-    def read_robot_info(self, file_path):
-
-        try:
-            self.robot_info = []
-            with open(file_path, "r") as file:
-                for line in file:
-                    if line.startswith("["):
-                        continue
-                    parts = line.strip().split(":")
-                    if len(parts) == 2:
-                        robot_name, ip_address = parts
-                        self.robot_info.append((robot_name, ip_address))
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error reading file: {str(e)}")
-
     def terminate_threads(self):
 
         # Call a method in your Worker class to stop all running threads
@@ -915,71 +1820,60 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
 
     def move_folders_to_archive(self, main_folder_path, archive_folder_path):
 
-        # Get a list of all folders except 'Archive'
-        folders_to_move = [
-            folder
-            for folder in os.listdir(main_folder_path)
-            if os.path.isdir(os.path.join(main_folder_path, folder))
-            and folder != "Archive"
-        ]
-
-        # Find the latest Rev folder
-        latest_rev = 0
-        for folder in os.listdir(archive_folder_path):
-            if folder.startswith("Rev") and folder[3:].isdigit():
-                rev_number = int(folder[3:])
-                if rev_number > latest_rev:
-                    latest_rev = rev_number
-
-        # Increment the latest Rev number
-        next_rev = latest_rev + 1
-
-        # Move each folder to the Archive folder
-        for folder in folders_to_move:
-            folder_path = os.path.join(main_folder_path, folder)
-            destination_path = os.path.join(
-                archive_folder_path, f"Rev{next_rev}", folder
-            )
-
-            # Create the next Rev folder if it doesn't exist
-            if not os.path.exists(os.path.join(archive_folder_path, f"Rev{next_rev}")):
-                os.makedirs(os.path.join(archive_folder_path, f"Rev{next_rev}"))
-
-            shutil.move(folder_path, destination_path)
+        # Rotate the previous backups into the next Rev folder with a single rename,
+        # everything slow (deduplication, retention) runs in the background
+        rotate_backups(main_folder_path, archive_folder_path)
+        ArchiveMaintenance(
+            archive_folder_path, self.keep_revisions, self.dedup_archive, self.logger
+        ).start()
 
     def start_backup(self):
 
         global TotalRobots
         global ThreadCount
         self.compile_robot_info()
+        if self.robot_info and (
+            self.scheduler.is_running(self.project_file_path)
+            or self.worker.has_pending(
+                os.path.join("".join(self.backup_path), LATEST_FOLDER)
+            )
+        ):
+            QMessageBox.warning(
+                self, "Error", "A backup of this project is still running."
+            )
+            return
         if not self.robot_info == []:
 
             self.tab_widget.setCurrentIndex(1)
             ThreadCount = self.update_thread_count()
-            self.worker.update_semaphore(ThreadCount)
-            self.thread_count_combobox.setEnabled(False)
             self.backup_button.setEnabled(False)
             self.open_folder_button.setEnabled(False)
             try:
                 self.backup_button.setEnabled(False)
                 # self.file_button.setEnabled(False)
-                self.scheduled_list_widget.clear()
-                self.completed_list_widget.clear()
+                self.scheduled_model.clear()
+                self.completed_model.clear()
 
+                previous_backups = {}
                 try:
                     self.main_folder = "".join(self.backup_path)
                     self.archive = self.main_folder + "\\" + "Archive"
+                    self.latest_folder = os.path.join(self.main_folder, LATEST_FOLDER)
 
-                    if not os.path.exists(self.main_folder):
-                        os.makedirs(self.main_folder, exist_ok=True)
-
-                    else:
-                        os.makedirs(self.archive, exist_ok=True)
-                        self.move_folders_to_archive(self.main_folder, self.archive)
+                    os.makedirs(self.main_folder, exist_ok=True)
+                    self.move_folders_to_archive(self.main_folder, self.archive)
+                    if self.incremental_checkbox.isChecked():
+                        previous_backups = find_previous_backups(self.archive)
                 except Exception as e:
                     if self.logger:
                         self.logger.error(f"Error creating main folder: {str(e)}")
 
+                config = load_app_settings()
+                config["Settings"]["Incremental"] = str(
+                    self.incremental_checkbox.isChecked()
+                )
+                save_app_settings(config)
+
                 selected_extensions = [
                     checkbox.text()
                     for checkbox in self.extension_checkboxes
@@ -1000,17 +1894,23 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
                         if checkbox.isChecked()
                     ]
                 # print(f"selected extension: {selected_extensions}")
+                _, _, vlans = load_project(self.project_file_path)
+                self.worker.set_group_limits(load_group_limits(self.project_file_path))
+                self.worker.telemetry.begin_run()
+                scheduled_robots = []
                 for robot_name, ip_address in self.robot_info:
                     if ip_address:
                         self.worker.queue_backup(
                             robot_name,
                             ip_address,
-                            self.main_folder,
+                            self.latest_folder,
                             selected_extensions,
+                            previous_backups.get(robot_name),
+                            robot_group(ip_address, vlans.get(robot_name)),
                         )
                         TotalRobots += 1
-                        self.addProgressBarItem(f"{robot_name}--Scheduled", 0)
-                        self.worker.start_next_backup()  # Start the next backup
+                        scheduled_robots.append(robot_name)
+                self.scheduled_model.add_robots(scheduled_robots, "Scheduled")
 
             except AttributeError:
                 print("Please select a file first.")
@@ -1023,193 +1923,770 @@ class FTPBackup(QMainWindow):  # Changed from QWidget to QMainWindow
         else:
             QMessageBox.warning(self, "Error", "Please select Robots first.")
 
-    @pyqtSlot(str, int, str, str)
+    @pyqtSlot(list)
+    def update_progress_snapshot(self, snapshot):
+        for ftp_host, progress, file_name, error in snapshot:
+            self.update_progress(ftp_host, progress, file_name, error)
+
     def update_progress(self, ftp_host, progress, file_name, error):
 
         global TotalRobots
-        item_text = f"{ftp_host} - Running: {progress}% - {file_name} {error}"
-
-        # Check if there's an existing running item for the same FTP host
-        running_item = None
-        for i in range(self.scheduled_list_widget.count()):
-            item = self.scheduled_list_widget.item(i)
-            widget = self.scheduled_list_widget.itemWidget(item)
-            if widget and f"{ftp_host} - Running" in widget.getText():
-                running_item = item
-                break
-
-        # If a running item is found, update it; otherwise, add a new one
-        if running_item:
-            # running_item.setText(item_text)
-            self.updateProgressBarItem(running_item, f"{ftp_host} - Running ", progress)
-            if "Terminated" in item_text:
-                self.remove_scheduled_list_failed(ftp_host, error)
-                TotalRobots -= 1
-        else:
-            # Check if there's an existing scheduled item for the same FTP host
-            scheduled_item = None
-            for i in range(self.scheduled_list_widget.count()):
-                item = self.scheduled_list_widget.item(i)
-                widget = self.scheduled_list_widget.itemWidget(item)
-                if widget.getText().startswith(f"{ftp_host}"):
-                    scheduled_item = item
-                    break
-
-            # If a scheduled item is found, update it; otherwise, add a new one
-            if scheduled_item and not "Terminated" in item_text:
-                self.updateProgressBarItem(scheduled_item, f"{ftp_host} - Running", 0)
-                # scheduled_item.setText(item_text)
-            elif "Terminated" in item_text and not running_item:
-                self.remove_scheduled_list_failed(ftp_host, error)
-                TotalRobots -= 1
-            else:
-                self.addProgressBarItem(item_text, progress)
-        # print(TotalRobots)
-        # Remove completed item from both scheduled and running lists
-        if progress == 100 and file_name == "Completed":
-            self.remove_scheduled_list(ftp_host)
+        if file_name == "Terminated":
+            self.scheduled_model.remove_robot(ftp_host)
+            self.completed_model.set_robot(ftp_host, "Failed", 0, error)
             TotalRobots -= 1
+        elif progress == 100 and file_name == "Completed":
+            # Remove completed item from the scheduled list
+            self.scheduled_model.remove_robot(ftp_host)
+            self.completed_model.set_robot(ftp_host, "Completed", 100)
+            TotalRobots -= 1
+        else:
+            self.scheduled_model.set_robot(ftp_host, "Running", progress)
         # print(TotalRobots)
         if TotalRobots == 0:
             self.open_folder_button.setEnabled(True)
             self.open_folder_button.setVisible(True)
-            # self.scheduled_list_widget.addItem(
-            #     "Backup - Completed"
-            # )
             self.backup_button.setEnabled(True)
             self.thread_count_combobox.setEnabled(True)
+            self.save_auto_concurrency()
+            self.save_run_report()
+            self.save_project_run()
             # self.file_button.setEnabled(False)
             try:
                 os.startfile(self.main_folder)  # For Windows
             except Exception as e:
                 print(f"Error opening folder: {str(e)}")
 
-    def addProgressBarItem(self, text, value):
-        item = QListWidgetItem(self.scheduled_list_widget)
-        progressBarItem = ProgressBarListItem(text, value)
+    def save_run_report(self):
+        if self.worker.telemetry.is_empty():
+            return
+        report_folder = os.path.join(
+            getattr(self, "main_folder", None) or "".join(self.backup_path), REPORTS_FOLDER
+        )
+        try:
+            report_path = self.worker.telemetry.write_report(report_folder)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error writing run report: {str(e)}")
+            print(f"Error writing run report: {str(e)}")
+            return
+        self.status_bar.showMessage(
+            f"Run report saved to {report_path}, see File > Run Report", 30000
+        )
 
-        item.setSizeHint(progressBarItem.sizeHint())
-        self.scheduled_list_widget.addItem(item)
-        self.scheduled_list_widget.setItemWidget(item, progressBarItem)
+    def save_project_run(self):
+        if self.worker.telemetry.is_empty() or not hasattr(self, "project_file_path"):
+            return
+        try:
+            record_project_run(self.project_file_path, telemetry=self.worker.telemetry)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error saving last backups: {str(e)}")
+            print(f"Error saving last backups: {str(e)}")
 
-        return item
+    def show_run_report_dialog(self):
+        if self.worker.telemetry.is_empty():
+            QMessageBox.information(self, "Run Report", "No backup has run yet.")
+            return
+        dialog = RunReportDialog(self.worker.telemetry.summary())
+        dialog.exec_()
+
+    def create_status_view(self, model):
+        view = QTableView()
+        view.setModel(model)
+        view.verticalHeader().setVisible(False)
+        view.verticalHeader().setDefaultSectionSize(24)
+        view.setSelectionMode(QAbstractItemView.NoSelection)
+        view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        view.setShowGrid(False)
+        view.setWordWrap(False)
+        header = view.horizontalHeader()
+        header.setSectionResizeMode(BackupStatusModel.ROBOT, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(BackupStatusModel.STATUS, QHeaderView.Stretch)
+        header.setSectionResizeMode(BackupStatusModel.PROGRESS, QHeaderView.Fixed)
+        header.resizeSection(BackupStatusModel.PROGRESS, 150)
+        return view
+
+
+class RobotRow:
+    __slots__ = ("name", "ip_address", "checked", "status")
+
+    def __init__(self, name, ip_address):
+        self.name = name
+        self.ip_address = ip_address
+        self.checked = False
+        self.status = None  # None while not checked yet, then True / False for online
+
+
+class RobotTableModel(QAbstractTableModel):
+    """
+    Table model of the robots of the open project. The name column is checkable to
+    select robots for backup and the reachability status is exposed as StatusRole,
+    so a project of any size costs one small object per robot instead of widgets.
+    """
+
+    NAME, IP, STATUS = range(3)
+    HEADERS = ("Robot Name", "IP Address", "Status")
+    StatusRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.robots = []
 
-    def updateProgressBarItem(self, item, text, value):
-        progressBarItem = self.scheduled_list_widget.itemWidget(item)
-        if progressBarItem:
-            progressBarItem.updateProgress(text, value)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.robots)
 
-    def update_completed_list(self, ftp_host):
-        # Create a QWidget as the container
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
 
-        # Create a QLabel to display the text
-        label = QLabel(f"{ftp_host} - Completed")
-        label.setStyleSheet(
-            "background-color: #7ABA78; color: white;"
-            "border-radius: 5px; padding: 2px 5px;"
-        )
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
 
-        # Add the label to the layout
-        layout.addWidget(label)
-        layout.setContentsMargins(2, 1, 2, 1)  # Remove margins if needed
-        widget.setLayout(layout)
-
-        # Create a QListWidgetItem
-        item = QListWidgetItem(self.completed_list_widget)
-
-        # Set the custom widget for the item
-        self.completed_list_widget.setItemWidget(item, widget)
-        item.setSizeHint(
-            widget.sizeHint()
-        )  # Important to ensure the item has the correct size
-
-    def update_failed_list(self, ftp_host, error):
-        # Create a QWidget as the container
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-
-        # Create a QLabel to display the text
-        label = QLabel(f"{ftp_host} - Failed Due to : {error}")
-        label.setStyleSheet(
-            "background-color: #F2613F; color: white;"
-            "border-radius: 5px; padding: 2px 5px;"
-        )
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == self.NAME:
+            return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        robot = self.robots[index.row()]
+        column = index.column()
+        if role == self.StatusRole:
+            return robot.status
+        if role == Qt.DisplayRole:
+            if column == self.NAME:
+                return robot.name
+            if column == self.IP:
+                return robot.ip_address
+            return self.status_text(robot.status)
+        if role == Qt.CheckStateRole and column == self.NAME:
+            return Qt.Checked if robot.checked else Qt.Unchecked
+        if role == Qt.TextAlignmentRole and column == self.IP:
+            return Qt.AlignCenter
+        return None
 
-        # Add the label to the layout
-        layout.addWidget(label)
-        layout.setContentsMargins(2, 1, 2, 1)  # Remove margins if needed
-        widget.setLayout(layout)
+    def setData(self, index, value, role=Qt.EditRole):
+        if index.isValid() and index.column() == self.NAME and role == Qt.CheckStateRole:
+            self.robots[index.row()].checked = value == Qt.Checked
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            return True
+        return False
 
-        # Create a QListWidgetItem
-        item = QListWidgetItem(self.completed_list_widget)
+    @staticmethod
+    def status_text(status):
+        if status is None:
+            return "Checking"
+        return "Online" if status else "Offline"
 
-        # Set the custom widget for the item
-        self.completed_list_widget.setItemWidget(item, widget)
-        item.setSizeHint(
-            widget.sizeHint()
-        )  # Important to ensure the item has the correct size
+    def set_robots(self, robots_section):
+        """
+        Replaces the robots with the (name, IP address) pairs of a project.
+        """
+        self.beginResetModel()
+        self.robots = [
+            RobotRow(robot_name.upper(), ip_address)
+            for robot_name, ip_address in robots_section
+        ]
+        self.endResetModel()
+
+    def set_status(self, row, is_online):
+        if 0 <= row < len(self.robots):
+            self.robots[row].status = is_online
+            index = self.index(row, self.STATUS)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, self.StatusRole])
+
+    def set_all_status(self, is_online):
+        for robot in self.robots:
+            robot.status = is_online
+        self.emit_column_changed(self.STATUS, [Qt.DisplayRole, self.StatusRole])
+
+    def set_all_checked(self, checked):
+        for robot in self.robots:
+            robot.checked = checked
+        self.emit_column_changed(self.NAME, [Qt.CheckStateRole])
+
+    def check_where(self, predicate):
+        for robot in self.robots:
+            robot.checked = bool(predicate(robot))
+        self.emit_column_changed(self.NAME, [Qt.CheckStateRole])
+
+    def emit_column_changed(self, column, roles):
+        if self.robots:
+            self.dataChanged.emit(
+                self.index(0, column), self.index(len(self.robots) - 1, column), roles
+            )
 
-    def update_scheduled_list(self, ftp_host):
+    def targets(self):
+        """
+        :return: (row, IP address) pairs of every robot with an IP address, for the sweep.
+        """
+        return [
+            (row, robot.ip_address)
+            for row, robot in enumerate(self.robots)
+            if robot.ip_address
+        ]
 
-        self.scheduled_list_widget.addItem(f"{ftp_host}")
+    def checked_robots(self):
+        """
+        :return: (name, IP address) pairs of the robots selected for backup.
+        """
+        return [
+            (robot.name.strip(), robot.ip_address)
+            for robot in self.robots
+            if robot.checked and robot.name.strip() and robot.ip_address
+        ]
 
-    def remove_scheduled_list(self, ftp_host):
 
-        # Also remove the corresponding running item
-        for index in range(self.scheduled_list_widget.count()):
-            item = self.scheduled_list_widget.item(index)
-            widget = self.scheduled_list_widget.itemWidget(item)
-            if widget and f"{ftp_host}" in widget.getText():
-                row = self.scheduled_list_widget.row(item)
-                self.scheduled_list_widget.takeItem(row)
-                self.update_completed_list(ftp_host)
+class StatusBadgeDelegate(QStyledItemDelegate):
+    """
+    Paints the reachability status of a robot as a coloured badge.
+    """
+
+    COLORS = {None: QColor("#A0A0A0"), True: QColor("#7ABA78"), False: QColor("#F2613F")}
+
+    def paint(self, painter, option, index):
+        status = index.data(RobotTableModel.StatusRole)
+        rect = option.rect.adjusted(1, 2, -1, -2)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.COLORS[status])
+        painter.drawRoundedRect(rect, 5, 5)
+        painter.setPen(QColor("white"))
+        painter.drawText(
+            rect.adjusted(5, 0, -5, 0),
+            Qt.AlignVCenter | Qt.AlignLeft,
+            index.data(Qt.DisplayRole),
+        )
+        painter.restore()
 
-                break
 
-    def remove_scheduled_list_failed(self, ftp_host, error):
+class BackupStatusModel(QAbstractTableModel):
+    """
+    Table model of the Status tab with one row per robot. Rows are looked up by
+    robot name through a dictionary, so updating a robot costs the same however
+    many robots are scheduled.
+    """
 
-        # Also remove the corresponding scheduled item
-        for index in range(self.scheduled_list_widget.count()):
-            item = self.scheduled_list_widget.item(index)
-            widget = self.scheduled_list_widget.itemWidget(item)
-            if widget and f"{ftp_host}" in widget.getText():
-                row = self.scheduled_list_widget.row(item)
-                self.scheduled_list_widget.takeItem(row)
-                self.update_failed_list(ftp_host, error)
+    ROBOT, STATUS, PROGRESS = range(3)
+    HEADERS = ("Robot", "Status", "Progress")
+    COLORS = {"Completed": QColor("#7ABA78"), "Failed": QColor("#F2613F")}
 
-                break
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []  # [robot name, status, progress, error]
+        self.row_of = {}  # Robot name -> row
 
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        robot_name, status, progress, error = self.rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == self.ROBOT:
+                return robot_name
+            if column == self.STATUS:
+                return f"{status} Due to : {error}" if error else status
+            return progress
+        if role == Qt.ToolTipRole and error:
+            return error
+        if role == Qt.BackgroundRole and status in self.COLORS:
+            return QBrush(self.COLORS[status])
+        if role == Qt.ForegroundRole and status in self.COLORS:
+            return QBrush(QColor("white"))
+        return None
+
+    def clear(self):
+        self.beginResetModel()
+        self.rows = []
+        self.row_of = {}
+        self.endResetModel()
+
+    def add_robots(self, robot_names, status):
+        """
+        Appends rows for robots that are not in the model yet, with a single insert.
+        """
+        new_names = []
+        for robot_name in robot_names:
+            if robot_name not in self.row_of and robot_name not in new_names:
+                new_names.append(robot_name)
+        if not new_names:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_names) - 1)
+        for robot_name in new_names:
+            self.row_of[robot_name] = len(self.rows)
+            self.rows.append([robot_name, status, 0, ""])
+        self.endInsertRows()
+
+    def set_robot(self, robot_name, status, progress=0, error=""):
+        row = self.row_of.get(robot_name)
+        if row is None:
+            self.add_robots([robot_name], status)
+            row = self.row_of[robot_name]
+        self.rows[row] = [robot_name, status, progress, error]
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def remove_robot(self, robot_name):
+        row = self.row_of.pop(robot_name, None)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[row]
+        for later_row in self.rows[row:]:
+            self.row_of[later_row[0]] -= 1
+        self.endRemoveRows()
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """
+    Paints the progress column as a progress bar, without a widget per row.
+    """
+
+    def paint(self, painter, option, index):
+        progress = index.data(Qt.DisplayRole) or 0
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(2, 3, -2, -3)
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = progress
+        bar.text = f"{progress}%"
+        bar.textVisible = True
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ProgressBar, bar, painter)
+
+
+# Robot naming conventions, compiled once for the project editor and the imports
+ROBOT_NAME_PATTERNS = {
+    "DCDL": re.compile(r"^[A-Za-z]{2}[0-9]{3}[Rr][0-9]{2}[Bb][0-9]{2}$"),  # AB123R01B01
+    "DCDL_PROCESS": re.compile(  # AB123P1R01B01
+        r"^[A-Za-z]{2}[0-9]{3}[Pp][0-9][Rr][0-9]{2}[Bb][0-9]{2}$"
+    ),
+    "ENET": re.compile(r"^[0-9]{3}[Rr][0-9]$"),  # 123R1
+    "ENET_4": re.compile(r"^[0-9]{4}[Rr][0-9]$"),  # 1234R1
+    "ENET_2": re.compile(r"^[0-9]{2}[Rr][0-9]$"),  # 12R1, ENET Matrix only
+}
+
+
+def combine_name_patterns(*kinds):
+    return re.compile(
+        "|".join(f"(?:{ROBOT_NAME_PATTERNS[kind].pattern})" for kind in kinds)
+    )
+
+
+PROJECT_ROBOT_NAME = combine_name_patterns("DCDL", "DCDL_PROCESS", "ENET", "ENET_4")
+ENET_ROBOT_NAME = combine_name_patterns("ENET", "ENET_4", "ENET_2")
+IP_ADDRESS_REGEX = re.compile(
+    r"^(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(?:25["
+    r"0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
+)
+VALIDATION_ERRORS_SHOWN = 15  # Errors listed in the message, the rest under details
+
+DCDL_KEYWORDS = ("Robot Fanuc Global", "Robot Fanuc Global (W/Vision)")
+# ENET Matrix columns (0 based) of the 5 VLAN blocks: VLAN name in row 13, robot names
+# and IP addresses from row 20. Sheets with "Code" in D18 have an extra column per block
+ENET_LAYOUTS = {
+    True: ([1, 7, 12, 17, 22], [2, 8, 13, 18, 23], [4, 9, 14, 19, 24]),
+    False: ([1, 6, 11, 16, 21], [2, 7, 12, 17, 22], [3, 8, 13, 18, 23]),
+}
+WorkbookIndex = namedtuple("WorkbookIndex", ["kind", "sheets", "vlans"])
+CANCEL_CHECK_ROWS = 500  # Rows read between two checks for cancellation
+WORKBOOK_CACHE_FOLDER = "ImportCache"
+WORKBOOK_CACHE_SIZE = 20  # Workbooks whose index is kept
+
+
+def cell_value(row, column):
+    # Rows of a read-only sheet end at the last used column of the sheet
+    return row[column] if column < len(row) else None
+
+
+def index_workbook(excel_file_path, cancel_event=None, progress=None):
+    """
+    Reads a DCDL or ENET Matrix workbook in a single streaming, read-only pass and
+    collects the robots it lists, so even large plant workbooks are never loaded
+    into memory as a whole.
+
+    :param excel_file_path: The .xlsm or .xlsx file.
+    :param cancel_event: Event that stops the import.
+    :param progress: Called with (sheet number, sheet count, sheet name) per sheet.
+    :return: A WorkbookIndex, None if cancelled. For a DCDL workbook ("DCDL") sheets
+        maps every sheet with Fanuc robots in column D to its (name, ip) rows, for an
+        ENET Matrix ("ENET") vlans maps every VLAN to its (name, ip) rows. kind is
+        None for any other workbook.
+    """
+    wb = openpyxl.load_workbook(excel_file_path, read_only=True)
+    try:
+        if "Start Here" in wb.sheetnames:
+            sheets = {}
+            for number, sheet_name in enumerate(wb.sheetnames):
+                if progress:
+                    progress(number, len(wb.sheetnames), sheet_name)
+                robots = None
+                for count, row in enumerate(
+                    wb[sheet_name].iter_rows(min_row=2, min_col=1, values_only=True)
+                ):
+                    if cancel_event and count % CANCEL_CHECK_ROWS == 0:
+                        if cancel_event.is_set():
+                            return None
+                    if cell_value(row, 3) not in DCDL_KEYWORDS:  # Keyword in column D
+                        continue
+                    if robots is None:
+                        robots = sheets[sheet_name] = []
+                    name = cell_value(row, 2)  # Name in column C
+                    ip = cell_value(row, 5)  # IP address in column F
+                    if name and ip:
+                        robots.append((name, ip))
+            return WorkbookIndex("DCDL", sheets, {})
+
+        if "WorkBook_Setup" in wb.sheetnames:
+            if progress:
+                progress(0, 1, "ENET Matrix")
+            vlans = index_enet_matrix(wb["ENET Matrix"], cancel_event)
+            return None if vlans is None else WorkbookIndex("ENET", {}, vlans)
+
+        return WorkbookIndex(None, {}, {})
+    finally:
+        wb.close()
+
+
+def index_enet_matrix(sheet, cancel_event=None):
+    """
+    :return: A dictionary of VLAN name -> [(name, ip)] of the sheet, None if cancelled.
+        A block without a VLAN name belongs to the VLAN of the block before it.
+    """
+    vlan_row = ()
+    vlan_columns, name_columns, ip_columns = ENET_LAYOUTS[False]
+    block_robots = [[] for _ in name_columns]
+    for number, row in enumerate(
+        sheet.iter_rows(min_row=1, min_col=1, values_only=True), start=1
+    ):
+        if cancel_event and number % CANCEL_CHECK_ROWS == 0 and cancel_event.is_set():
+            return None
+        if number == 13:
+            vlan_row = row
+        elif number == 18:
+            vlan_columns, name_columns, ip_columns = ENET_LAYOUTS[
+                cell_value(row, 3) == "Code"
+            ]
+        elif number >= 20:
+            for block, (name_column, ip_column) in enumerate(zip(name_columns, ip_columns)):
+                name = cell_value(row, name_column)
+                if isinstance(name, str) and ENET_ROBOT_NAME.match(name):
+                    block_robots[block].append((name, cell_value(row, ip_column)))
+
+    vlan_data = {}
+    previous_vlan_name = None
+    for block, vlan_column in enumerate(vlan_columns):
+        value = cell_value(vlan_row, vlan_column)
+        vlan_name = str(value)[:8] if value is not None else None
+        if vlan_name:
+            vlan_data.setdefault(vlan_name, [])
+            previous_vlan_name = vlan_name
+        else:
+            vlan_name = previous_vlan_name
+        if vlan_name:
+            vlan_data[vlan_name].extend(block_robots[block])
+    return vlan_data
+
+
+class WorkbookIndexCache:
+    """
+    Keeps the WorkbookIndex of recently imported workbooks in the Exodus folder, so
+    importing another sheet or VLAN of the same workbook does not read it again.
+
+    An index is stored under the SHA-256 of the workbook. A workbook whose path, size
+    and modification time are unchanged is not even hashed, a copied or touched one
+    is found by its hash. The least recently used indexes beyond max_entries are
+    removed.
+    """
+
+    lock = threading.Lock()
+    VERSION = 1  # Raise on any change to index_workbook, older indexes are read again
+
+    def __init__(self, folder, max_entries=WORKBOOK_CACHE_SIZE):
+        self.folder = folder
+        self.max_entries = max_entries
+        self.manifest_path = os.path.join(folder, "Workbooks.json")
+
+    def load_manifest(self):
+        # Workbook path -> {"size", "mtime", "sha256", "used"}
+        try:
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_manifest(self, manifest):
+        os.makedirs(self.folder, exist_ok=True)
+        with open(self.manifest_path + ".tmp", "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(self.manifest_path + ".tmp", self.manifest_path)
+
+    def entry_path(self, digest):
+        return os.path.join(self.folder, digest + ".json")
+
+    def lookup(self, excel_file_path):
+        """
+        :return: (WorkbookIndex or None on a miss, key to store the index under)
+        """
+        path = os.path.abspath(excel_file_path)
+        stat = os.stat(path)
+        with self.lock:
+            manifest = self.load_manifest()
+        known = manifest.get(path)
+        if known and known["size"] == stat.st_size and known["mtime"] == stat.st_mtime:
+            digest = known["sha256"]
+        else:
+            digest = file_sha256(path)
+        key = (path, stat.st_size, stat.st_mtime, digest)
+        try:
+            with open(self.entry_path(digest), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None, key
+        if entry.get("version") != self.VERSION:
+            return None, key
+        with self.lock:
+            self.touch(key)
+
+        def rows(mapping):
+            return {
+                name: [tuple(robot) for robot in robots] for name, robots in mapping.items()
+            }
+
+        return WorkbookIndex(entry["kind"], rows(entry["sheets"]), rows(entry["vlans"])), key
+
+    def store(self, key, index):
+        """
+        :param key: The key returned by lookup.
+        :param index: The WorkbookIndex of the workbook.
+        """
+        entry_path = self.entry_path(key[3])
+        with self.lock:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(entry_path + ".tmp", "w") as f:
+                # default=str keeps cells such as dates, which are no valid robot anyway
+                json.dump(dict(index._asdict(), version=self.VERSION), f, default=str)
+            os.replace(entry_path + ".tmp", entry_path)
+            self.touch(key)
+
+    def touch(self, key):
+        # Marks a workbook as used and evicts the least recently used ones.
+        # Must be called with lock held
+        path, size, mtime, digest = key
+        manifest = self.load_manifest()
+        manifest[path] = {"size": size, "mtime": mtime, "sha256": digest, "used": time.time()}
+        by_use = sorted(manifest, key=lambda name: manifest[name]["used"])
+        for name in by_use[: max(0, len(manifest) - self.max_entries)]:
+            del manifest[name]
+        self.save_manifest(manifest)
+        kept = {entry["sha256"] + ".json" for entry in manifest.values()}
+        for name in os.listdir(self.folder):
+            if name.endswith(".json") and name != "Workbooks.json" and name not in kept:
+                try:
+                    os.remove(os.path.join(self.folder, name))
+                except OSError:
+                    pass
 
-class ProgressBarListItem(QWidget):
-    def __init__(self, text, value, parent=None):
-        super().__init__(parent)
-        self.layout = QHBoxLayout()
 
-        self.label = QLabel(text)
-        self.progressBar = QProgressBar()
-        self.progressBar.setValue(value)
-        self.progressBar.setFixedSize(200, 15)
+class WorkbookIndexer(QObject):
+    """
+    Runs index_workbook on a background thread for the project editor, reusing the
+    index of a workbook imported before. Several workbooks are read in parallel
+    processes, a single one on the thread itself with progress per sheet.
+    """
 
-        self.layout.addWidget(self.label)
-        self.progressBarLayout = QHBoxLayout()
-        self.progressBarLayout.setContentsMargins(
-            0, 0, 0, 0
-        )  # Set left margin to adjust start position
-        self.progressBarLayout.addWidget(self.progressBar)
-        self.layout.setContentsMargins(0, 5, 0, 5)
+    progress_signal = pyqtSignal(int, int, str)  # number, count, sheet or workbook name
+    # [(workbook path, WorkbookIndex or None, error)], None if cancelled
+    finished_signal = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.cancel_event = threading.Event()
 
-        self.layout.addLayout(self.progressBarLayout)
+    def start(self, excel_file_paths):
+        thread = threading.Thread(
+            target=self.run, args=(list(excel_file_paths),), name="ExodusWorkbookIndexer"
+        )
+        thread.daemon = True
+        thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self, excel_file_paths):
+        cache = WorkbookIndexCache(os.path.join(exodus_home(), WORKBOOK_CACHE_FOLDER))
+        results = {}
+        misses = []
+        for excel_file_path in excel_file_paths:
+            index = key = None
+            try:
+                index, key = cache.lookup(excel_file_path)
+            except Exception as e:
+                print(f"Error reading import cache: {str(e)}")
+            if index is not None:
+                results[excel_file_path] = (index, "")
+            else:
+                misses.append((excel_file_path, key))
 
-        self.setLayout(self.layout)
+        if len(misses) == 1:
+            excel_file_path, key = misses[0]
+            try:
+                index = index_workbook(
+                    excel_file_path, self.cancel_event, self.progress_signal.emit
+                )
+            except Exception as e:
+                traceback.print_exc()
+                results[excel_file_path] = (None, str(e))
+            else:
+                if index is None:
+                    self.finished_signal.emit(None)
+                    return
+                results[excel_file_path] = (index, "")
+                self.store(cache, key, index)
+        elif misses:
+            pool = ProcessPoolExecutor(max_workers=min(len(misses), os.cpu_count() or 1))
+            try:
+                futures = {
+                    pool.submit(index_workbook, excel_file_path): (excel_file_path, key)
+                    for excel_file_path, key in misses
+                }
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                    if self.cancel_event.is_set():
+                        self.finished_signal.emit(None)
+                        return
+                    for future in done:
+                        excel_file_path, key = futures[future]
+                        try:
+                            index = future.result()
+                        except Exception as e:
+                            results[excel_file_path] = (None, str(e))
+                            continue
+                        results[excel_file_path] = (index, "")
+                        self.store(cache, key, index)
+                        self.progress_signal.emit(
+                            len(results), len(excel_file_paths), os.path.basename(excel_file_path)
+                        )
+            finally:
+                # Workbooks still being read are abandoned on cancel
+                pool.shutdown(wait=False, cancel_futures=True)
 
-    def updateProgress(self, text, value):
-        self.label.setText(text)
-        self.progressBar.setValue(value)
+        self.finished_signal.emit(
+            [(path,) + results[path] for path in excel_file_paths]
+        )
 
-    def getText(self):
-        return self.label.text()
+    def store(self, cache, key, index):
+        if index.kind and key:
+            try:
+                cache.store(key, index)
+            except Exception as e:
+                print(f"Error writing import cache: {str(e)}")
+
+
+def validate_robot_rows(rows):
+    """
+    Checks the robot table of a project column by column.
+
+    :param rows: (name, ip) of every row of the table, blank rows are skipped.
+    :return: (robots as {name: ip} in row order, list of every error found)
+    """
+    frame = pd.DataFrame(rows, columns=["name", "ip"], dtype=object).fillna("")
+    frame["name"] = frame["name"].astype(str).str.strip().str.upper()
+    frame["ip"] = frame["ip"].astype(str).str.strip()
+    frame = frame[(frame["name"] != "") | (frame["ip"] != "")]
+
+    bad_name = ~frame["name"].str.match(PROJECT_ROBOT_NAME)
+    bad_ip = ~frame["ip"].str.match(IP_ADDRESS_REGEX)
+    valid = ~bad_name & ~bad_ip
+    # Like the row by row check, a row only clashes with the valid rows above it
+    duplicate_name = valid & frame["name"].where(valid).duplicated()
+    unique = valid & ~duplicate_name
+    duplicate_ip = unique & frame["ip"].where(unique).duplicated()
+    unique &= ~duplicate_ip
+
+    checks = [
+        (bad_name, "Invalid name: '{name}'."),
+        (bad_ip, "Invalid IP address: '{ip}'."),
+        (duplicate_name, "Duplicate name: '{name}'."),
+        (duplicate_ip, "Duplicate IP address: '{ip}'."),
+    ]
+    errors = []
+    for row in frame[~unique].itertuples():
+        for failed, message in checks:
+            if failed[row.Index]:
+                errors.append(
+                    f"Row {row.Index + 1}: " + message.format(name=row.name, ip=row.ip)
+                )
+    robots = dict(zip(frame["name"][unique], frame["ip"][unique]))
+    return robots, errors
+
+
+def merge_imported_robots(existing, candidates, valid_name, valid_ip):
+    """
+    Merges imported robots into a project, checking every robot once.
+
+    :param existing: (name, ip) of the robots already in the project, they win conflicts.
+    :param candidates: (name, ip, vlan, source) of the imported robots, source naming
+        the workbook and sheet or VLAN the robot came from.
+    :param valid_name: Name check, ProjectConfigEditor.validateName.
+    :param valid_ip: IP address check, ProjectConfigEditor.validateIP.
+    :return: (robots to add as (name, ip, vlan), number of duplicates merged, list of
+        conflicts as text lines)
+    """
+    by_name = {}
+    by_ip = {}
+    for name, ip in existing:
+        by_name[name.upper()] = (ip, "project")
+        by_ip[ip] = (name.upper(), "project")
+    added = []
+    duplicates = 0
+    conflicts = []
+    for name, ip, vlan, source in candidates:
+        name = str(name).strip().upper()
+        ip = str(ip).strip() if ip is not None else ""
+        if not valid_name(name):
+            conflicts.append(f"{name} ({source}): invalid name")
+            continue
+        if not valid_ip(ip):
+            conflicts.append(f"{name} ({source}): invalid IP address '{ip}'")
+            continue
+        if name in by_name:
+            known_ip, known_source = by_name[name]
+            if known_ip == ip:
+                duplicates += 1
+            else:
+                conflicts.append(
+                    f"{name} ({source}): {ip} differs from {known_ip} ({known_source})"
+                )
+            continue
+        if ip in by_ip:
+            known_name, known_source = by_ip[ip]
+            conflicts.append(
+                f"{name} ({source}): {ip} is already used by {known_name} ({known_source})"
+            )
+            continue
+        by_name[name] = (ip, source)
+        by_ip[ip] = (name, source)
+        added.append((name, ip, vlan))
+    return added, duplicates, conflicts
 
 
 class ProjectConfigEditor(QDialog):
@@ -1236,7 +2713,8 @@ class ProjectConfigEditor(QDialog):
         self.import_excel_button = QPushButton("Import from Excel")
         self.import_excel_button.setToolTip(
             "Import Robot IP address and name from the Enet Matrix Excel file.\n"
-            "This function also supports DCDL files."
+            "This function also supports DCDL files. Several workbooks can be\n"
+            "selected at once, duplicate robots are merged."
         )
         self.import_excel_button.clicked.connect(self.importfromExcelDCDL)
         button_layout.addWidget(self.import_excel_button)
@@ -1248,6 +2726,8 @@ class ProjectConfigEditor(QDialog):
         self.robots_table.setColumnCount(2)
         self.robots_table.setHorizontalHeaderLabels(["Robot Name", "IP"])
         layout.addWidget(self.robots_table)
+        self.robot_vlans = {}  # Robot name -> VLAN it was imported from
+        self.group_limits = {}  # Kept as loaded, edited from the Cell Limits dialog
 
         # Add initial empty row
         self.addEmptyRow()
@@ -1297,34 +2777,27 @@ class ProjectConfigEditor(QDialog):
             QMessageBox.warning(self, "Error", "Backup directory cannot be empty.")
             return
 
-        robots = {}
-        for row in range(self.robots_table.rowCount()):
-            name_item = self.robots_table.cellWidget(row, 0)
-            ip_item = self.robots_table.cellWidget(row, 1)
-            name = name_item.text()
-            ip = ip_item.text()
-            name = name.upper()
-            # Ignore blank robot names and corresponding blank IP addresses
-            if not name.strip() and not ip.strip():
-                continue
-            if not self.validateName(name):
-                QMessageBox.warning(self, "Error", "Invalid name: '{}'.".format(name))
-                return
-            if not self.validateIP(ip):
-                QMessageBox.warning(
-                    self, "Error", "Invalid IP address: '{}'.".format(ip)
-                )
-                return
-            # Check for duplicate names and IPs
-            if name in robots:
-                QMessageBox.warning(self, "Error", "Duplicate name: '{}'.".format(name))
-                return
-            if ip in robots.values():
-                QMessageBox.warning(
-                    self, "Error", "Duplicate IP address: '{}'.".format(ip)
+        robots, errors = validate_robot_rows(
+            [
+                (
+                    self.robots_table.cellWidget(row, 0).text(),
+                    self.robots_table.cellWidget(row, 1).text(),
                 )
-                return
-            robots[name] = ip
+                for row in range(self.robots_table.rowCount())
+            ]
+        )
+        if errors:
+            # Every problem at once instead of one message per row
+            message = QMessageBox(self)
+            message.setIcon(QMessageBox.Warning)
+            message.setWindowTitle("Error")
+            text = "\n".join(errors[:VALIDATION_ERRORS_SHOWN])
+            if len(errors) > VALIDATION_ERRORS_SHOWN:
+                text += f"\n... and {len(errors) - VALIDATION_ERRORS_SHOWN} more."
+                message.setDetailedText("\n".join(errors))
+            message.setText(text)
+            message.exec_()
+            return
 
         if not project_name:  # If project name is not provided, ask for it
 
@@ -1335,7 +2808,10 @@ class ProjectConfigEditor(QDialog):
             if not os.path.exists(folder_path_project):
                 os.makedirs(folder_path_project)
             project_name, _ = QFileDialog.getSaveFileName(
-                self, "Save Project", folder_path_project, "Project Files (*.ini)"
+                self,
+                "Save Project",
+                folder_path_project,
+                "Project Files (*.ini);;Project Database (*.exodb)",
             )
             if not project_name:  # User canceled the dialog
                 QMessageBox.warning(
@@ -1343,65 +2819,66 @@ class ProjectConfigEditor(QDialog):
                 )
                 return
 
+        file_path = os.path.join(folder_path_project, project_name)
+        vlans = {
+            name: self.robot_vlans[name] for name in robots if name in self.robot_vlans
+        }
+        if is_project_store(file_path):
+            ProjectStore(file_path).save_project(
+                backup_directory, robots, vlans, self.group_limits
+            )
+            self.accept()
+            return
+
         config = configparser.ConfigParser()
         config["General"] = {"BackupDirectory": backup_directory}
         if "Robots" not in config:
             config["Robots"] = {}
         for name, ip in robots.items():
             config["Robots"][name] = ip
+        if vlans:
+            config["Vlans"] = vlans
+        if self.group_limits:
+            config["GroupLimits"] = {
+                group: f"{max_backups}, {bytes_per_second}"
+                for group, (max_backups, bytes_per_second) in self.group_limits.items()
+            }
 
-        file_path = os.path.join(folder_path_project, project_name)
         with open(file_path, "w") as configfile:
             config.write(configfile)
 
         self.accept()
 
     def validateIP(self, ip):
-        # Regular expression for validating IP address
-        ip_regex = (
-            r"^(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(?:25["
-            r"0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
-        )
-        return re.match(ip_regex, ip) is not None
+        return IP_ADDRESS_REGEX.match(ip) is not None
 
     def validateName(self, name):
-        # Regular expressions for validating robot names
-        name_regex1 = r"^[A-Za-z]{2}[0-9]{3}[Rr]{1}[0-9]{2}[Bb]{1}[0-9]{2}$"
-        name_regex2 = (
-            r"^[A-Za-z]{2}[0-9]{3}[Pp]{1}[0-9]{1}[Rr]{1}[0-9]{2}[Bb]{1}[0-9]{2}$"
-        )
-        name_regex3 = r"^[0-9]{3}[Rr]{1}[0-9]{1}$"
-        name_regex4 = r"^[0-9]{4}[Rr]{1}[0-9]{1}$"
-        return (
-            bool(re.match(name_regex1, name))
-            or bool(re.match(name_regex2, name))
-            or bool(re.match(name_regex3, name))
-            or bool(re.match(name_regex4, name))
-        )
+        return PROJECT_ROBOT_NAME.match(name) is not None
 
     def editProject(self):
         # Get the project file to edit
         project_file, _ = QFileDialog.getOpenFileName(
-            self, "Open Project", "", "Project Files (*.ini)"
+            self, "Open Project", "", PROJECT_FILE_FILTER
         )
         if not project_file:  # User canceled the dialog
             return
 
-        # Load configuration from the selected project file
-        config = configparser.ConfigParser()
-        config.read(project_file)
-
-        # Extract backup directory from the loaded configuration
-        backup_directory = config.get("General", "BackupDirectory", fallback="")
+        # Load the selected project file, .ini or project database
+        try:
+            backup_directory, robots, self.robot_vlans = read_project(project_file)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Failed to read project file: {e}")
+            return
 
         # Update UI with loaded backup directory
         self.backup_directory_label.setText("Backup Directory: " + backup_directory)
 
         # Clear existing rows from the table
         self.robots_table.setRowCount(0)
+        self.group_limits = load_group_limits(project_file)
 
         # Populate table with robots from the loaded configuration
-        for name, ip in config.items("Robots"):
+        for name, ip in robots:
             rowPosition = self.robots_table.rowCount()
             self.robots_table.insertRow(rowPosition)
 
@@ -1412,176 +2889,135 @@ class ProjectConfigEditor(QDialog):
             self.robots_table.setCellWidget(rowPosition, 1, ip_edit)
 
     def importfromExcelDCDL(self):
-        excel_file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open Excel File", "", "Excel Files (*.xlsm *.xlsx)"
+        excel_file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Open Excel Files", "", "Excel Files (*.xlsm *.xlsx)"
         )
-        if excel_file_path:
-            # Show progress dialog while opening Excel file
-            progress_dialog = QProgressDialog("Processing File...", None, 0, 0, self)
-            progress_dialog.setWindowModality(Qt.WindowModal)
-            progress_dialog.setWindowTitle("Processing Data")
-            progress_dialog.setCancelButton(None)
-            progress_dialog.setMinimumDuration(0)
-            progress_dialog.show()
-            progress_dialog.setValue(10)
-            QApplication.processEvents()
-            try:
-                # Load workbook
-                wb = openpyxl.load_workbook(excel_file_path)
-
-                # Check for "Start Here" sheet
-                if "Start Here" in wb.sheetnames:
-
-                    sheet_names = wb.sheetnames
-                    sheets_with_keyword = []
-
-                    # Find sheets with the keyword
-                    for sheet_name in sheet_names:
-                        sheet = wb[sheet_name]
-                        for row in sheet.iter_rows(
-                            min_row=2, min_col=4, max_col=4, values_only=True
-                        ):
-                            if (
-                                "Robot Fanuc Global" in row
-                                or "Robot Fanuc Global (W/Vision)" in row
-                            ):
-                                sheets_with_keyword.append(sheet_name)
-                                break
-
-                    if not sheets_with_keyword:
-                        QMessageBox.warning(
-                            self, "Warning", "No sheets contain the Robot in column D."
+        if excel_file_paths:
+            # The workbooks are read in the background, the editor stays responsive
+            self.import_progress = QProgressDialog(
+                "Processing File...", "Cancel", 0, 0, self
+            )
+            self.import_progress.setWindowModality(Qt.WindowModal)
+            self.import_progress.setWindowTitle("Processing Data")
+            self.import_progress.setMinimumDuration(0)
+            self.indexer = WorkbookIndexer()
+            self.indexer.progress_signal.connect(self.workbookIndexProgress)
+            self.indexer.finished_signal.connect(self.workbookIndexed)
+            self.import_progress.canceled.connect(self.indexer.cancel)
+            self.import_excel_button.setEnabled(False)
+            self.import_progress.show()
+            self.indexer.start(excel_file_paths)
+
+    @pyqtSlot(int, int, str)
+    def workbookIndexProgress(self, number, count, sheet_name):
+        self.import_progress.setMaximum(count)
+        self.import_progress.setValue(number)
+        self.import_progress.setLabelText(f"Reading {sheet_name}...")
+
+    @pyqtSlot(object)
+    def workbookIndexed(self, results):
+        self.import_progress.close()
+        self.import_excel_button.setEnabled(True)
+        if results is None:  # Cancelled
+            return
+        try:
+            errors = []
+            choices = {}  # Label -> (robots, VLAN or None)
+            file_names = Counter(os.path.basename(path) for path, _, _ in results)
+            for excel_file_path, index, error in results:
+                # Workbooks of the same name from different folders are told apart by path
+                workbook_name = os.path.basename(excel_file_path)
+                if file_names[workbook_name] > 1:
+                    workbook_name = excel_file_path
+                # Labels only name the workbook when several were opened
+                prefix = f"{workbook_name} / " if len(results) > 1 else ""
+                if error:
+                    errors.append(f"{workbook_name}: Failed to read Excel file: {error}")
+                elif index.kind == "DCDL":
+                    if not index.sheets:
+                        errors.append(
+                            f"{workbook_name}: No sheets contain the Robot in column D."
                         )
-                        return
-
-                    # Close the progress dialog
-                    progress_dialog.close()
-
-                    # Show custom dialog to select sheets
-                    dialog = SelectSheetsDialog(sheets_with_keyword)
-                    if dialog.exec_():
-                        selected_sheets = dialog.selectedSheets()
-                        for sheet_name in selected_sheets:
-                            sheet = wb[sheet_name]
-                            self.loadSheetDataDCDL(sheet)
-                        self.robots_table.removeRow(0)
-
-                elif "WorkBook_Setup" in wb.sheetnames:
-                    pattern1 = r"^[0-9]{3}[Rr]{1}[0-9]{1}$"
-                    pattern3 = r"^[0-9]{2}[Rr]{1}[0-9]{1}$"
-                    pattern2 = r"^[0-9]{4}[Rr]{1}[0-9]{1}$"
-                    pattern = f"{pattern1}|{pattern2}|{pattern3}"
-                    enet_sheet = wb["ENET Matrix"]
-
-                    if enet_sheet["D18"].value == "Code":
-                        vlan_cells = [
-                            enet_sheet["B13"],
-                            enet_sheet["H13"],
-                            enet_sheet["M13"],
-                            enet_sheet["R13"],
-                            enet_sheet["W13"],
-                        ]
-                        columns = {"name": [2, 8, 13, 18, 23], "ip": [4, 9, 14, 19, 24]}
-                        pass
-                    else:
-                        vlan_cells = [
-                            enet_sheet["B13"],
-                            enet_sheet["G13"],
-                            enet_sheet["L13"],
-                            enet_sheet["Q13"],
-                            enet_sheet["V13"],
-                        ]
-                        columns = {"name": [2, 7, 12, 17, 22], "ip": [3, 8, 13, 18, 23]}
-                        pass
-                    # Extract VLAN data from specified cells
-
-                    vlan_data = {}
-                    previous_vlan_name = None
-
-                    for idx, vlan_cell in enumerate(vlan_cells):
-                        # Ensure vlan_cell.value is not None
-                        if vlan_cell.value is not None:
-                            vlan_name = vlan_cell.value[:8]
-                        else:
-                            # Handle the case when vlan_cell.value is None
-                            vlan_name = None
-
-                        if vlan_name:
-                            vlan_data.setdefault(vlan_name, [])
-                            previous_vlan_name = vlan_name
-                        else:
-                            vlan_name = previous_vlan_name
-
-                        for row in enet_sheet.iter_rows(
-                            min_row=20, max_row=enet_sheet.max_row
-                        ):
-                            name = row[columns["name"][idx]].value
-                            ip = row[columns["ip"][idx]].value
-                            if name is not None:
-                                if re.match(pattern, name):
-                                    vlan_data[vlan_name].append((name, ip))
-
-                    if not vlan_data:
-                        QMessageBox.warning(
-                            self,
-                            "Warning",
-                            "No valid VLAN data found in the 'Enet matrix' sheet.",
+                    for sheet_name, robots in index.sheets.items():
+                        choices[prefix + sheet_name] = (robots, None)
+                elif index.kind == "ENET":
+                    # Filter out empty VLANs
+                    vlans = {vlan: robots for vlan, robots in index.vlans.items() if robots}
+                    if not vlans:
+                        errors.append(
+                            f"{workbook_name}: No valid VLAN data found in the "
+                            "'Enet matrix' sheet."
                         )
-                        progress_dialog.close()  # Close progress dialog if there's a warning
-                        return
-
-                    # Close the progress dialog
-                    progress_dialog.close()
-
-                    # Filter out empty values from vlan_data dictionary
-                    filtered_vlan_data = {
-                        key: value for key, value in vlan_data.items() if value
-                    }
-
-                    # Pass the filtered dictionary to the SelectVlanDialog
-                    dialog = SelectVlanDialog(filtered_vlan_data)
-                    if dialog.exec_():
-                        selected_vlan = dialog.selectedVlan()
-                        selected_robots = vlan_data[selected_vlan]
-                        for name, ip in selected_robots:
-                            if self.validateIP(ip):
-                                self.addRobotRow(name, ip)
-                        self.robots_table.removeRow(0)
+                    for vlan, robots in vlans.items():
+                        choices[prefix + vlan] = (robots, vlan)
                 else:
-                    QMessageBox.warning(
-                        self,
-                        "Error",
-                        "The Excel file does not contain a Data or file is invalid.",
+                    errors.append(
+                        f"{workbook_name}: The Excel file does not contain a Data or "
+                        "file is invalid."
                     )
-                    progress_dialog.close()
+
+            if not choices:
+                QMessageBox.warning(self, "Warning", "\n".join(errors))
+                return
+
+            if all(vlan is not None for robots, vlan in choices.values()):
+                dialog = SelectVlanDialog(choices)
+                if not dialog.exec_():
+                    return
+                selected = dialog.selectedVlans()
+            else:
+                dialog = SelectSheetsDialog(list(choices))
+                if not dialog.exec_():
                     return
+                selected = dialog.selectedSheets()
 
-            except Exception as e:
-                traceback.print_exc()
-                QMessageBox.warning(
-                    self, "Error", "Failed to read Excel file: {}".format(e)
+            candidates = [
+                (name, ip, choices[label][1], label)
+                for label in selected
+                for name, ip in choices[label][0]
+            ]
+            robots, duplicates, conflicts = merge_imported_robots(
+                self.projectRobots(), candidates, self.validateName, self.validateIP
+            )
+            # Drop the empty row of a new project
+            if self.robots_table.rowCount() and not any(
+                self.robots_table.cellWidget(0, column).text().strip()
+                for column in range(2)
+            ):
+                self.robots_table.removeRow(0)
+            for name, ip, vlan in robots:
+                self.addRobotRow(name, ip)
+                if vlan is not None:
+                    self.robot_vlans[name] = vlan
+
+            if errors or conflicts:
+                message = QMessageBox(self)
+                message.setIcon(QMessageBox.Warning)
+                message.setWindowTitle("Import")
+                message.setText(
+                    f"Imported {len(robots)} robots, {duplicates} duplicates merged.\n"
+                    f"{len(conflicts)} robots were skipped and {len(errors)} workbooks "
+                    "could not be used, see the details."
                 )
+                message.setDetailedText("\n".join(errors + conflicts))
+                message.exec_()
 
-    def loadSheetDataDCDL(self, sheet):
-        try:
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                keyword = row[3]  # Assuming keyword is in column D
-                name = row[2]  # Assuming name is in column C
-                ip = row[5]  # Assuming IP address is in column F
-                if (
-                    (
-                        keyword == "Robot Fanuc Global (W/Vision)"
-                        or keyword == "Robot Fanuc Global"
-                    )
-                    and name
-                    and ip
-                ):
-                    self.addRobotRow(name, ip)
         except Exception as e:
+            traceback.print_exc()
             QMessageBox.warning(
-                self, "Error", "Failed to load data from sheet: {}".format(e)
+                self, "Error", "Failed to read Excel file: {}".format(e)
             )
 
+    def projectRobots(self):
+        # (name, ip) of the robots already in the table
+        robots = []
+        for row in range(self.robots_table.rowCount()):
+            name = self.robots_table.cellWidget(row, 0).text().strip()
+            ip = self.robots_table.cellWidget(row, 1).text().strip()
+            if name:
+                robots.append((name, ip))
+        return robots
+
     def addRobotRow(self, name, ip):
         rowPosition = self.robots_table.rowCount()
         self.robots_table.insertRow(rowPosition)
@@ -1616,10 +3052,10 @@ class SelectSheetsDialog(QDialog):
 class SelectVlanDialog(QDialog):
     def __init__(self, vlan_data):
         super().__init__()
-        self.setWindowTitle("Select VLAN")
+        self.setWindowTitle("Select VLANs")
         layout = QVBoxLayout(self)
         self.vlan_list = QListWidget()
-        self.vlan_list.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.vlan_list.setSelectionMode(QAbstractItemView.MultiSelection)
         for vlan in vlan_data.keys():
             self.vlan_list.addItem(vlan)
         layout.addWidget(self.vlan_list)
@@ -1632,283 +3068,1290 @@ class SelectVlanDialog(QDialog):
         buttons_layout.addWidget(self.cancel_button)
         layout.addLayout(buttons_layout)
 
-    def selectedVlan(self):
-        selected_items = self.vlan_list.selectedItems()
-        if selected_items:
-            return selected_items[0].text()
-        return None
-
+    def selectedVlans(self):
+        return [item.text() for item in self.vlan_list.selectedItems()]
 
-class Worker(QObject):
-    progress_signal = pyqtSignal(str, int, str, str)
 
-    def __init__(self):
+class StatusCheckSettingsDialog(QDialog):
+    def __init__(self, count, timeout, parallel):
         super().__init__()
-        exe_dir = os.path.dirname(sys.executable)
-        log_file_path = os.path.join(exe_dir, "Exodus_log.dmp")
-        logging.basicConfig(
-            filename=log_file_path,
-            level=logging.DEBUG,
-            format="%(asctime)s - %(levelname)s - %(message)s",
+        self.setWindowTitle("Status Check Settings")
+        layout = QGridLayout(self)
+
+        self.count_spinbox = QSpinBox()
+        self.count_spinbox.setRange(1, 10)
+        self.count_spinbox.setValue(count)
+        self.count_spinbox.setToolTip(
+            "Number of pings sent before a robot is shown as offline."
         )
-        self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Started From {os.environ.get("COMPUTERNAME", "")}")
-        global ThreadCount
-        self.mutex = QMutex()
-        self.queue = []
+        layout.addWidget(QLabel("Probes per robot"), 0, 0)
+        layout.addWidget(self.count_spinbox, 0, 1)
+
+        self.timeout_spinbox = QDoubleSpinBox()
+        self.timeout_spinbox.setRange(0.1, 10.0)
+        self.timeout_spinbox.setSingleStep(0.1)
+        self.timeout_spinbox.setSuffix(" s")
+        self.timeout_spinbox.setValue(timeout)
+        self.timeout_spinbox.setToolTip("Time to wait for each ping reply.")
+        layout.addWidget(QLabel("Timeout"), 1, 0)
+        layout.addWidget(self.timeout_spinbox, 1, 1)
+
+        self.parallel_spinbox = QSpinBox()
+        self.parallel_spinbox.setRange(1, 512)
+        self.parallel_spinbox.setValue(parallel)
+        self.parallel_spinbox.setToolTip(
+            "Number of robots pinged at the same time.\n"
+            "Higher number will speed up the status check."
+        )
+        layout.addWidget(QLabel("Parallel probes"), 2, 0)
+        layout.addWidget(self.parallel_spinbox, 2, 1)
 
-    def update_semaphore(self, ThreadCount):
-        """
-        Updates the semaphore of the worker based on the given ThreadCount.
+        buttons_layout = QHBoxLayout()
+        self.ok_button = QPushButton("OK")
+        self.ok_button.clicked.connect(self.accept)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.ok_button)
+        buttons_layout.addWidget(self.cancel_button)
+        layout.addLayout(buttons_layout, 3, 0, 1, 2)
 
-        :param ThreadCount: An integer representing the number of simultaneous backups allowed.
-        :return: None
-        """
-        self.semaphore = threading.Semaphore(
-            ThreadCount
-        )  # Default limit to 10 simultaneous backups
+    def values(self):
+        return (
+            self.count_spinbox.value(),
+            self.timeout_spinbox.value(),
+            self.parallel_spinbox.value(),
+        )
 
-    def start_backup(self, robot_name, ftp_host, main_folder, selected_extensions):
-        """
-        Starts the backup process for a robot.
 
-        Parameters:
-            self (object): The instance of the class.
-            robot_name (str): The name of the robot to backup.
-            ftp_host (str): The FTP host to connect to for backing up.
-            main_folder (str): The main folder where backups are stored.
-            selected_extensions (list): The list of selected file extensions to backup.
+class TransferRetrySettingsDialog(QDialog):
+    def __init__(self, retries, backoff, host_timeout=HOST_TIMEOUT):
+        super().__init__()
+        self.setWindowTitle("Transfer Retry Settings")
+        layout = QGridLayout(self)
+
+        self.retries_spinbox = QSpinBox()
+        self.retries_spinbox.setRange(0, 20)
+        self.retries_spinbox.setValue(retries)
+        self.retries_spinbox.setToolTip(
+            "Number of reconnects after a dropped connection before the backup of a robot fails.\n"
+            "Finished files are kept and a partly downloaded file is resumed."
+        )
+        layout.addWidget(QLabel("Retries per robot"), 0, 0)
+        layout.addWidget(self.retries_spinbox, 0, 1)
+
+        self.backoff_spinbox = QDoubleSpinBox()
+        self.backoff_spinbox.setRange(0.0, 300.0)
+        self.backoff_spinbox.setSingleStep(0.5)
+        self.backoff_spinbox.setSuffix(" s")
+        self.backoff_spinbox.setValue(backoff)
+        self.backoff_spinbox.setToolTip(
+            "Wait before the first reconnect, doubled for every further attempt."
+        )
+        layout.addWidget(QLabel("Backoff"), 1, 0)
+        layout.addWidget(self.backoff_spinbox, 1, 1)
+
+        self.host_timeout_spinbox = QSpinBox()
+        self.host_timeout_spinbox.setRange(1, 24 * 60)
+        self.host_timeout_spinbox.setSuffix(" min")
+        self.host_timeout_spinbox.setValue(max(1, round(host_timeout / 60)))
+        self.host_timeout_spinbox.setToolTip(
+            "Time the asyncio transfer engine gives the backup of one robot before it is cancelled."
+        )
+        layout.addWidget(QLabel("Robot timeout"), 2, 0)
+        layout.addWidget(self.host_timeout_spinbox, 2, 1)
 
-        Returns:
-            None
-        """
-        try:
-            thread = threading.Thread(
-                target=self.backup_robot,
-                args=(robot_name, ftp_host, main_folder, selected_extensions),
-            )
-            thread.daemon = True
-            thread.start()
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error starting backup: {str(e)}")
+        buttons_layout = QHBoxLayout()
+        self.ok_button = QPushButton("OK")
+        self.ok_button.clicked.connect(self.accept)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.ok_button)
+        buttons_layout.addWidget(self.cancel_button)
+        layout.addLayout(buttons_layout, 3, 0, 1, 2)
 
-    def queue_backup(self, robot_name, ftp_host, main_folder, selected_extensions):
-        """
-        Queues a backup for a robot.
+    def values(self):
+        return (
+            self.retries_spinbox.value(),
+            self.backoff_spinbox.value(),
+            self.host_timeout_spinbox.value() * 60,
+        )
 
-        Args:
-            robot_name (str): The name of the robot to backup.
-            ftp_host (str): The FTP host to connect to for backing up.
-            main_folder (str): The main folder where backups are stored.
-            selected_extensions (list): The list of selected file extensions to backup.
 
-        Raises:
-            Exception: If there is an error queuing the backup.
+class RunReportDialog(QDialog):
+    """
+    Shows the slowest robots and cells of a run, see RunTelemetry.summary.
+    """
+
+    ROBOT_COLUMNS = [
+        ("Robot", "robot"),
+        ("Cell", "group"),
+        ("Status", "status"),
+        ("Total s", "duration_s"),
+        ("Connect s", "connect_s"),
+        ("Listing s", "listing_s"),
+        ("Transfer s", "transfer_s"),
+        ("Files", "files"),
+        ("MB", "bytes"),
+        ("Retries", "retries"),
+    ]
+    CELL_COLUMNS = [
+        ("Cell", "group"),
+        ("Robots", "robots"),
+        ("Failed", "failed"),
+        ("Mean s", "duration_s"),
+        ("Mean connect s", "connect_s"),
+        ("MB", "bytes"),
+        ("Retries", "retries"),
+    ]
+
+    def __init__(self, summary):
+        super().__init__()
+        self.setWindowTitle("Run Report")
+        self.setMinimumSize(760, 520)
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Slowest robots"))
+        layout.addWidget(self.create_table(self.ROBOT_COLUMNS, summary["slowest_robots"]))
+        layout.addWidget(QLabel("Slowest cells"))
+        layout.addWidget(self.create_table(self.CELL_COLUMNS, summary["slowest_cells"]))
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        layout.addWidget(close_button)
+
+    def create_table(self, columns, records):
+        table = QTableWidget(len(records), len(columns))
+        table.setHorizontalHeaderLabels([title for title, key in columns])
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        for row, record in enumerate(records):
+            for column, (title, key) in enumerate(columns):
+                value = record[key]
+                if key == "bytes":
+                    value = f"{value / 1e6:.1f}"
+                elif isinstance(value, float):
+                    value = f"{value:.1f}"
+                item = QTableWidgetItem(str(value))
+                if record.get("status") == "Terminated" or record.get("failed"):
+                    item.setForeground(QColor("#F2613F"))
+                table.setItem(row, column, item)
+        table.resizeColumnsToContents()
+        return table
+
+
+class GroupLimitsDialog(QDialog):
+    """
+    Edits the limits per robot group of a project. Max Backups caps the simultaneous
+    backups of the group, Max MB/s the bandwidth its backups share, 0 for no limit.
+    The Default row applies to every group without limits of its own.
+    """
+
+    def __init__(self, groups, limits):
+        super().__init__()
+        self.setWindowTitle("Cell Limits")
+        self.setMinimumSize(480, 300)
+        layout = QVBoxLayout(self)
 
-        Returns:
-            None
-        """
-        try:
-            self.mutex.lock()
-            self.queue.append((robot_name, ftp_host, main_folder, selected_extensions))
-            self.mutex.unlock()
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error queuing backup: {str(e)}")
+        names = ["DEFAULT"] + sorted(groups)
+        names += sorted(group for group in limits if group not in names)
+        self.table = QTableWidget(len(names), 4)
+        self.table.setHorizontalHeaderLabels(["Group", "Robots", "Max Backups", "Max MB/s"])
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        for row, group in enumerate(names):
+            max_backups, bytes_per_second = limits.get(group, (0, 0))
+            name_item = QTableWidgetItem("Default" if group == "DEFAULT" else group)
+            name_item.setData(Qt.UserRole, group)
+            name_item.setFlags(Qt.ItemIsEnabled)
+            self.table.setItem(row, 0, name_item)
+            count_item = QTableWidgetItem(str(groups.get(group, "")))
+            count_item.setFlags(Qt.ItemIsEnabled)
+            self.table.setItem(row, 1, count_item)
+
+            backups_spinbox = QSpinBox()
+            backups_spinbox.setRange(0, 1000)
+            backups_spinbox.setSpecialValueText("No limit")
+            backups_spinbox.setValue(max_backups)
+            self.table.setCellWidget(row, 2, backups_spinbox)
+
+            bandwidth_spinbox = QDoubleSpinBox()
+            bandwidth_spinbox.setRange(0.0, 10000.0)
+            bandwidth_spinbox.setSingleStep(0.5)
+            bandwidth_spinbox.setSpecialValueText("No limit")
+            bandwidth_spinbox.setValue(bytes_per_second / 1e6)
+            self.table.setCellWidget(row, 3, bandwidth_spinbox)
+        layout.addWidget(self.table)
+
+        buttons_layout = QHBoxLayout()
+        self.ok_button = QPushButton("OK")
+        self.ok_button.clicked.connect(self.accept)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.ok_button)
+        buttons_layout.addWidget(self.cancel_button)
+        layout.addLayout(buttons_layout)
 
-    def start_next_backup(self):
+    def limits(self):
         """
-        Starts the next backup process.
+        :return: A dictionary of group -> (max backups, bytes per second) for every
+            group with a limit.
+        """
+        limits = {}
+        for row in range(self.table.rowCount()):
+            group = self.table.item(row, 0).data(Qt.UserRole)
+            max_backups = self.table.cellWidget(row, 2).value()
+            bytes_per_second = int(self.table.cellWidget(row, 3).value() * 1e6)
+            if max_backups or bytes_per_second:
+                limits[group] = (max_backups, bytes_per_second)
+        return limits
 
-        This function retrieves the next backup host from the queue and starts the backup process.
 
-        Parameters:
-            self (object): The instance of the class.
+class ScheduleDialog(QDialog):
+    COLUMNS = ("Name", "Start Times", "Window (min)", "Extensions", "Incremental", "Enabled")
 
-        Returns:
-            None
+    def __init__(self, jobs):
+        super().__init__()
+        self.setWindowTitle("Backup Schedule")
+        self.setMinimumSize(640, 300)
+        self.last_runs = {}
+        layout = QVBoxLayout(self)
 
-        Raises:
-            Exception: If there is an error starting the next backup.
-        """
+        self.jobs_table = QTableWidget(0, len(self.COLUMNS))
+        self.jobs_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.jobs_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.jobs_table.setToolTip(
+            "Start Times: daily times such as 06:00, 14:00, 22:00\n"
+            "Window: the start of the robots is spread over this many minutes\n"
+            "Extensions: All, or a list such as .tp .va .sv"
+        )
+        layout.addWidget(self.jobs_table)
+        for job in jobs:
+            self.addJobRow(job)
+
+        buttons_layout = QHBoxLayout()
+        self.add_button = QPushButton("Add Job")
+        self.add_button.clicked.connect(
+            lambda: self.addJobRow(ScheduledJob("Shift", ["06:00", "14:00", "22:00"]))
+        )
+        self.remove_button = QPushButton("Remove Job")
+        self.remove_button.clicked.connect(
+            lambda: self.jobs_table.removeRow(self.jobs_table.currentRow())
+        )
+        self.ok_button = QPushButton("OK")
+        self.ok_button.clicked.connect(self.validateAndAccept)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.add_button)
+        buttons_layout.addWidget(self.remove_button)
+        buttons_layout.addWidget(self.ok_button)
+        buttons_layout.addWidget(self.cancel_button)
+        layout.addLayout(buttons_layout)
+
+    def addJobRow(self, job):
+        row = self.jobs_table.rowCount()
+        self.jobs_table.insertRow(row)
+        extensions = "All" if job.extensions == "." else " ".join(job.extensions)
+        for column, text in enumerate(
+            (job.name, ", ".join(job.times), str(job.window_minutes), extensions)
+        ):
+            self.jobs_table.setItem(row, column, QTableWidgetItem(text))
+        for column, checked in ((4, job.incremental), (5, job.enabled)):
+            item = QTableWidgetItem()
+            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if checked else Qt.Unchecked)
+            self.jobs_table.setItem(row, column, item)
+        self.last_runs[job.name] = job.last_run
+
+    def validateAndAccept(self):
         try:
-            next_host = self.get_next_backup()
-            if next_host:
-                self.start_backup(*next_host)
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error starting next backup: {str(e)}")
+            self.jobs()
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return
+        self.accept()
 
-    def get_next_backup(self):
+    def jobs(self):
         """
-        A description of the function that tries to get the next backup from the queue.
+        :return: The jobs in the table as ScheduledJob objects.
+        :raises ValueError: If a row is invalid.
+        """
+        jobs = []
+        for row in range(self.jobs_table.rowCount()):
+            cells = [self.jobs_table.item(row, column) for column in range(4)]
+            name, times, window, extensions = (
+                cell.text().strip() if cell else "" for cell in cells
+            )
+            if not name:
+                raise ValueError(f"Job in row {row + 1} needs a name.")
+            start_times = [part.strip() for part in times.split(",") if part.strip()]
+            for start_time in start_times:
+                if not re.match(r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$", start_time):
+                    raise ValueError(f"Invalid start time '{start_time}' in job {name}.")
+            if not start_times:
+                raise ValueError(f"Job {name} needs at least one start time.")
+            if not window.isdigit():
+                raise ValueError(f"Invalid window '{window}' in job {name}.")
+            if extensions.lower() in ("", "all", "*.*"):
+                extensions = "."
+            else:
+                extensions = [
+                    ext if ext.startswith(".") else "." + ext
+                    for ext in extensions.replace(",", " ").split()
+                ]
+            jobs.append(
+                ScheduledJob(
+                    name,
+                    [
+                        "{:02d}:{:02d}".format(*map(int, start_time.split(":")))
+                        for start_time in start_times
+                    ],
+                    int(window),
+                    extensions,
+                    self.jobs_table.item(row, 4).checkState() == Qt.Checked,
+                    self.jobs_table.item(row, 5).checkState() == Qt.Checked,
+                    self.last_runs.get(name),
+                )
+            )
+        return jobs
 
-        This function attempts to retrieve the next backup host from the queue.
-        It locks the mutex before accessing the queue to ensure thread safety.
-        If the queue is not empty, it removes the first item from the queue and returns it as the next host.
-        After retrieving the host, it unlocks the mutex.
-        If an exception is encountered during this process, the function logs an error using the logger.
 
-        Returns:
-            The next host if available, None otherwise.
-        """
+class RestoreRevisionDialog(QDialog):
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+        self.setWindowTitle("Restore Revision")
+        self.setMinimumSize(450, 350)
+        layout = QHBoxLayout(self)
+
+        self.revision_list = QListWidget()
+        self.revision_list.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.revision_list.setFixedWidth(80)
+        for revision in reversed(store.revisions()):
+            self.revision_list.addItem(f"Rev{revision}")
+        self.revision_list.currentTextChanged.connect(self.show_backups)
+        layout.addWidget(self.revision_list)
+
+        right_layout = QVBoxLayout()
+        self.backup_list = QListWidget()
+        self.backup_list.setSelectionMode(QAbstractItemView.MultiSelection)
+        right_layout.addWidget(self.backup_list)
+        buttons_layout = QHBoxLayout()
+        self.restore_button = QPushButton("Restore")
+        self.restore_button.setToolTip(
+            "Copy the selected backups to a folder of your choice."
+        )
+        self.restore_button.clicked.connect(self.restore_selected)
+        self.close_button = QPushButton("Close")
+        self.close_button.clicked.connect(self.reject)
+        buttons_layout.addWidget(self.restore_button)
+        buttons_layout.addWidget(self.close_button)
+        right_layout.addLayout(buttons_layout)
+        layout.addLayout(right_layout)
+
+        self.revision_list.setCurrentRow(0)
+
+    def show_backups(self, revision_text):
+        self.backup_list.clear()
+        if not revision_text:
+            return
+        revision = int(revision_text[3:])
+        for backup_name in self.store.backups(revision):
+            manifest = self.store.load_manifest(
+                self.store.manifest_path(revision, backup_name)
+            )
+            size = sum(size for digest, size in manifest["files"].values())
+            item = QListWidgetItem(
+                f"{backup_name}  ({len(manifest['files'])} files, {size / 1048576:.1f} MB)"
+            )
+            item.setData(Qt.UserRole, backup_name)
+            self.backup_list.addItem(item)
+
+    def restore_selected(self):
+        selected_items = self.backup_list.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, "Error", "Please select backups first.")
+            return
+        destination = QFileDialog.getExistingDirectory(
+            self, "Restore To", "", QFileDialog.ShowDirsOnly
+        )
+        if not destination:
+            return
+        revision = int(self.revision_list.currentItem().text()[3:])
         try:
-            self.mutex.lock()
-            if self.queue:
-                next_host = self.queue.pop(0)
-                self.mutex.unlock()
-                return next_host
-            self.mutex.unlock()
+            for item in selected_items:
+                self.store.restore(revision, item.data(Qt.UserRole), destination)
         except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error getting next backup: {str(e)}")
-        return None
+            QMessageBox.warning(self, "Error", f"Failed to restore backup: {e}")
+            return
+        QMessageBox.information(
+            self,
+            "Restore Revision",
+            f"Restored {len(selected_items)} backups to {destination}.",
+        )
 
-    def terminate_all_threads(self):
-        """
-        Terminate all active threads.
 
-        This function terminates all active threads in the current object.
-        It iterates over each thread in the `active_threads` list, terminates the thread,
-        and waits for it to terminate. After terminating all threads,
-        the `active_threads` list is cleared.
+ping_seed_lock = threading.Lock()
+ping_seed_id = 0
 
-        Parameters:
-            self (object): The current object.
 
-        Returns:
-            None
-        """
-        for thread in self.active_threads:
-            thread.terminate()  # Terminate the thread
-            thread.join()  # Wait for the thread to terminate
-        self.active_threads.clear()  # Clear the list of active threads
+def ping_once(ip_address, timeout):
+    """
+    Sends one ICMP echo request and waits for its reply.
 
-    def backup_robot(self, robot_name, ftp_host, main_folder, selected_extensions):
-        """
-        Backup robot files from an FTP server.
+    pythonping matches replies by ICMP identifier only, which ping() derives from the
+    process id or picks at random without a lock. Parallel probes therefore get their
+    own identifier and a random payload, so the reply meant for one robot is never
+    taken for another's.
 
-        Args:
-            robot_name (str): The name of the robot to backup.
+    :return: True if the robot answered within timeout.
+    """
+    global ping_seed_id
+    with ping_seed_lock:
+        ping_seed_id = ping_seed_id % 0xFFFF + 1
+        seed_id = ping_seed_id
+    communicator = executor.Communicator(
+        ip_address,
+        payload_provider.Repeat(os.urandom(PING_PAYLOAD_SIZE), 1),
+        timeout,
+        0,
+        seed_id=seed_id,
+    )
+    communicator.run(match_payloads=True)
+    return communicator.responses.success()
+
+
+class ReachabilitySweeper(QObject):
+    """
+    Probes the robots of a project for reachability in parallel.
+
+    Each sweep runs on a background thread with at most max_in_flight pings outstanding,
+    and every result is emitted as soon as it arrives so the status column fills in live.
+    """
+
+    status_signal = pyqtSignal(int, int, bool)  # sweep id, row, online
+    finished_signal = pyqtSignal(int)  # sweep id
+
+    def __init__(self, max_in_flight=PING_PARALLEL, count=PING_COUNT, timeout=PING_TIMEOUT):
+        super().__init__()
+        self.logger = logging.getLogger(__name__)
+        self.max_in_flight = max_in_flight
+        self.count = count
+        self.timeout = timeout
+        self.sweep_id = 0
+        self.cancel_event = threading.Event()
+
+    def configure(self, count, timeout, max_in_flight):
+        """
+        Updates the probe settings used by the following sweeps.
+
+        :param count: Number of echo requests sent before a robot is reported offline.
+        :param timeout: Seconds to wait for each echo reply.
+        :param max_in_flight: Maximum number of robots probed at the same time.
+        :return: None
+        """
+        self.count = max(1, int(count))
+        self.timeout = max(0.1, float(timeout))
+        self.max_in_flight = max(1, int(max_in_flight))
+
+    def sweep(self, targets):
+        """
+        Starts a sweep over the given robots, cancelling any sweep still running.
+
+        :param targets: A list of (row, ip_address) tuples.
+        :return: The id of the new sweep, carried by every signal it emits.
+        """
+        self.cancel()
+        self.sweep_id += 1
+        self.cancel_event = threading.Event()
+        thread = threading.Thread(
+            target=self.run_sweep,
+            args=(self.sweep_id, list(targets), self.cancel_event),
+        )
+        thread.daemon = True
+        thread.start()
+        return self.sweep_id
+
+    def cancel(self):
+        """
+        Cancels the running sweep. Probes already in flight finish but are not reported.
+        """
+        self.cancel_event.set()
+
+    def run_sweep(self, sweep_id, targets, cancel_event):
+        try:
+            if targets:
+                workers = min(self.max_in_flight, len(targets))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = {
+                        pool.submit(self.probe, ip_address, cancel_event): row
+                        for row, ip_address in targets
+                    }
+                    for future in as_completed(futures):
+                        if cancel_event.is_set():
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            break
+                        self.status_signal.emit(
+                            sweep_id, futures[future], future.result()
+                        )
+        except Exception as e:
+            self.logger.error(f"Error during status sweep: {str(e)}")
+        finally:
+            self.finished_signal.emit(sweep_id)
+
+    def probe(self, ip_address, cancel_event):
+        """
+        Pings a single robot, returning as soon as one echo reply arrives.
+
+        :param ip_address: The IP address of the robot.
+        :param cancel_event: Event set when the sweep is cancelled.
+        :return: True if the robot answered, False otherwise.
+        """
+        try:
+            for _ in range(self.count):
+                if cancel_event.is_set():
+                    return False
+                if ping_once(ip_address, self.timeout):
+                    return True
+        except Exception as e:
+            self.logger.error(f"Error occurred while pinging {ip_address}: {e}")
+        return False
+
+
+class FTPConnectionPool:
+    """
+    Keeps the logged-in FTP session of a robot open after a backup phase, so the
+    next phase, a retry or the next backup of the robot skips the TCP connect and
+    login. A session is checked with NOOP before reuse and closed after
+    FTP_IDLE_TIMEOUT seconds without use. Safe to use from any thread.
+    """
+
+    def __init__(self, idle_timeout=FTP_IDLE_TIMEOUT, timeout=10):
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.idle = {}  # Host -> (FTP, time.monotonic() of the release)
+        self.lock = threading.Lock()
+        self.reaper = None
+        self.reaper_stop = None
+
+    def acquire(self, ftp_host):
+        """
+        :param ftp_host: The address of the robot.
+        :return: (FTP, connect time) for a new session, (FTP, None) for a reused one.
+        """
+        with self.lock:
+            ftp, released = self.idle.pop(ftp_host, (None, 0))
+        if ftp is not None:
+            try:
+                ftp.voidcmd("NOOP")
+                return ftp, None
+            except Exception:
+                self.close(ftp)  # Closed by the controller meanwhile
+        connect_started = time.monotonic()
+        ftp = FTP(timeout=self.timeout)
+        try:
+            ftp.connect(*split_host(ftp_host))
+            ftp.login()  # Add your credentials if needed
+        except Exception:
+            self.close(ftp)
+            raise
+        ftp.set_pasv(True)
+        return ftp, time.monotonic() - connect_started
+
+    def release(self, ftp_host, ftp, reusable=True):
+        """
+        Hands a session back. It is kept for reuse if reusable, closed otherwise, e.g.
+        after the connection failed or a transfer was aborted half-way.
+        """
+        if not reusable:
+            self.close(ftp)
+            return
+        with self.lock:
+            replaced = self.idle.get(ftp_host)
+            self.idle[ftp_host] = (ftp, time.monotonic())
+            if self.reaper is None:
+                self.reaper_stop = threading.Event()
+                self.reaper = threading.Thread(
+                    target=self.evict_idle, args=(self.reaper_stop,), name="ExodusFTPReaper"
+                )
+                self.reaper.daemon = True
+                self.reaper.start()
+        if replaced:
+            self.close(replaced[0])  # One idle session per robot is enough
+
+    def evict_idle(self, stop):
+        # Runs while sessions are idle. It ends with the last one or when close_all sets
+        # stop, the next release starts a new one
+        while not stop.wait(min(self.idle_timeout, 5.0)):
+            now = time.monotonic()
+            with self.lock:
+                expired = [
+                    ftp_host
+                    for ftp_host, (ftp, released) in self.idle.items()
+                    if now - released > self.idle_timeout
+                ]
+                sessions = [self.idle.pop(ftp_host)[0] for ftp_host in expired]
+                finished = not self.idle
+                if finished and self.reaper is threading.current_thread():
+                    self.reaper = None
+            for ftp in sessions:
+                self.close(ftp, polite=True)
+            if finished:
+                return
+
+    def close_all(self):
+        with self.lock:
+            sessions = [ftp for ftp, released in self.idle.values()]
+            self.idle.clear()
+            if self.reaper is not None:
+                self.reaper_stop.set()
+                self.reaper = None
+        for ftp in sessions:
+            self.close(ftp, polite=True)
+
+    @staticmethod
+    def close(ftp, polite=False):
+        try:
+            if polite:
+                ftp.quit()
+            else:
+                ftp.close()
+        except Exception:
+            ftp.close()
+
+
+class Worker(QObject):
+    # List of (robot name, progress, file name, error) tuples, one per changed robot
+    progress_signal = pyqtSignal(list)
+
+    def __init__(self):
+        super().__init__()
+        exe_dir = os.path.dirname(sys.executable)
+        log_file_path = os.path.join(exe_dir, "Exodus_log.dmp")
+        logging.basicConfig(
+            filename=log_file_path,
+            level=logging.DEBUG,
+            format="%(asctime)s - %(levelname)s - %(message)s",
+        )
+        self.logger = logging.getLogger(__name__)
+        self.logger.info(f"Started From {os.environ.get("COMPUTERNAME", "")}")
+        self.group_queues = {}  # Group -> deque of backups waiting
+        self.group_order = deque()  # Groups with waiting backups, served round-robin
+        self.queued_jobs = 0
+        self.group_active = Counter()  # Group -> running backups
+        self.group_limits = {}  # Group -> (max backups, bytes per second), 0 = no limit
+        self.transfer_stats = TransferStats()
+        self.telemetry = RunTelemetry()
+        self.connections = FTPConnectionPool()
+        self.buckets = {}  # Group -> TokenBucket
+        self.queue_condition = threading.Condition()
+        self.pool_size = 10
+        self.worker_count = 0
+        self.active_jobs = 0
+        self.pending_folders = Counter()  # Backup folder -> queued and running backups
+        self.mlsd_support = {}  # FTP host -> whether MLSD is understood
+        self.mdtm_support = {}  # FTP host -> whether MDTM is understood
+        self.rest_support = {}  # FTP host -> whether REST is understood
+        self.retries = TRANSFER_RETRIES
+        self.retry_backoff = RETRY_BACKOFF
+        self.host_timeout = HOST_TIMEOUT
+        self.use_async = False
+        self.async_engine = AsyncBackupEngine(self)
+        self.progress_lock = threading.Lock()
+        self.pending_progress = {}  # Robot name -> latest progress since the last snapshot
+        self.progress_thread = None
+        self.progress_stop = threading.Event()
+
+    def set_engine(self, use_async):
+        """
+        Selects the transfer engine used for the following backups.
+
+        :param use_async: True to run backups on the asyncio engine, False for the thread pool.
+        :return: None
+        """
+        self.use_async = bool(use_async)
+
+    def report_progress(self, robot_name, progress, file_name, error):
+        """
+        Records the progress of a robot. Only the latest state of every robot is kept
+        and sent to the GUI with the next snapshot, so the GUI load does not grow
+        with the number of files transferred. Safe to call from any thread.
+
+        :param robot_name: The name of the robot.
+        :param progress: The progress in percent.
+        :param file_name: The last file transferred, or "Completed" / "Terminated".
+        :param error: The error of a terminated backup.
+        :return: None
+        """
+        if file_name in ("Completed", "Terminated"):
+            self.telemetry.robot_finished(robot_name, file_name, error)
+        with self.progress_lock:
+            self.pending_progress[robot_name] = (robot_name, progress, file_name, error)
+            if self.progress_thread is None:
+                self.progress_stop.clear()
+                self.progress_thread = threading.Thread(
+                    target=self.progress_loop, name="ExodusProgress"
+                )
+                self.progress_thread.daemon = True
+                self.progress_thread.start()
+
+    def progress_loop(self):
+        # Runs while there is progress to send. An interval without any, or
+        # terminate_all_threads, ends it and the next report_progress starts a new one
+        while True:
+            stopped = self.progress_stop.wait(PROGRESS_INTERVAL)
+            with self.progress_lock:
+                finished = stopped or not self.pending_progress
+                if finished:
+                    self.progress_thread = None
+            self.flush_progress()
+            if finished:
+                return
+
+    def flush_progress(self):
+        """
+        Sends the progress recorded since the last snapshot with one signal.
+        """
+        with self.progress_lock:
+            if not self.pending_progress:
+                return
+            snapshot = list(self.pending_progress.values())
+            self.pending_progress = {}
+        self.progress_signal.emit(snapshot)
+
+    def set_retry_policy(self, retries, backoff, host_timeout=HOST_TIMEOUT):
+        """
+        Sets how often a dropped robot session is reconnected and resumed.
+
+        :param retries: Number of reconnects before the backup is terminated.
+        :param backoff: Seconds before the first reconnect, doubled for every further one.
+        :param host_timeout: Seconds the asyncio engine gives the backup of one robot.
+        :return: None
+        """
+        self.retries = max(0, int(retries))
+        self.retry_backoff = max(0.0, float(backoff))
+        self.host_timeout = max(1.0, float(host_timeout))
+
+    def retry_delay(self, attempt):
+        return self.retry_backoff * 2**attempt
+
+    def set_pool_size(self, ThreadCount):
+        """
+        Sets the number of long-lived worker threads that run backups.
+
+        The pool can be resized at any time. Growing it starts new workers as soon as
+        there are queued backups for them, shrinking it lets surplus workers exit once
+        their current backup is finished.
+
+        :param ThreadCount: An integer representing the number of simultaneous backups allowed.
+        :return: None
+        """
+        with self.queue_condition:
+            self.pool_size = max(1, int(ThreadCount))
+            self.spawn_workers()
+            self.queue_condition.notify_all()
+        if self.use_async:
+            self.async_engine.wake()
+
+    def spawn_workers(self):
+        """
+        Starts workers until the pool size or the number of backups waiting is reached.
+        Must be called with queue_condition held.
+        """
+        if self.use_async:
+            return
+        demand = self.queued_jobs + self.active_jobs
+        while self.worker_count < min(self.pool_size, demand):
+            self.worker_count += 1
+            thread = threading.Thread(
+                target=self.worker_loop, name=f"ExodusWorker-{self.worker_count}"
+            )
+            thread.daemon = True
+            thread.start()
+
+    def worker_loop(self):
+        """
+        Main loop of a pool worker: takes the next backup from the queue and runs it,
+        sleeping while the queue is empty and exiting when the pool has been shrunk.
+        """
+        while True:
+            with self.queue_condition:
+                job = None
+                while self.worker_count <= self.pool_size:
+                    job = self.take_job()
+                    if job:
+                        break
+                    self.queue_condition.wait()
+                if job is None:
+                    self.worker_count -= 1
+                    return
+                self.active_jobs += 1
+            try:
+                self.backup_robot(*job)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error running backup: {str(e)}")
+                # Every backup ends with a final state, callers wait for it
+                self.report_progress(job[0], 0, "Terminated", str(e))
+            finally:
+                with self.queue_condition:
+                    self.active_jobs -= 1
+                    self.job_finished(job)
+                    self.queue_condition.notify_all()
+
+    def queue_backup(
+        self,
+        robot_name,
+        ftp_host,
+        main_folder,
+        selected_extensions,
+        previous_folder=None,
+        group=None,
+    ):
+        """
+        Queues a backup for a robot. It is picked up by the next free pool worker
+        once its group is below its concurrency limit.
+
+        Args:
+            robot_name (str): The name of the robot to backup.
             ftp_host (str): The FTP host to connect to for backing up.
             main_folder (str): The main folder where backups are stored.
             selected_extensions (list): The list of selected file extensions to backup.
+            previous_folder (str): The previous backup of the robot for an incremental backup.
+            group (str): The VLAN or subnet of the robot, see robot_group.
+
+        Raises:
+            Exception: If there is an error queuing the backup.
 
         Returns:
             None
         """
         try:
-            self.semaphore.acquire()  # Acquire semaphore slot
-            now = datetime.now().strftime("%Y-%m-%d_%HH_%MM")
-            robot_folder = main_folder + "\\" + robot_name + "_" + now
-            robot_MD = robot_folder + "\\md"
-            with FTP(ftp_host, timeout=10) as ftp:
-                ftp.login()  # Add your credentials if needed
-                ftp.set_pasv(True)
+            with self.queue_condition:
+                if group not in self.group_queues:
+                    self.group_queues[group] = deque()
+                    self.group_order.append(group)
+                self.group_queues[group].append(
+                    (
+                        robot_name,
+                        ftp_host,
+                        main_folder,
+                        selected_extensions,
+                        previous_folder,
+                        group,
+                    )
+                )
+                self.queued_jobs += 1
+                self.pending_folders[main_folder] += 1
+                self.spawn_workers()
+                self.queue_condition.notify()
+            if self.use_async:
+                self.async_engine.wake()
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error queuing backup: {str(e)}")
+
+    def set_group_limits(self, limits):
+        """
+        Sets the concurrency and bandwidth limits per robot group.
+
+        :param limits: A dictionary of group -> (max backups, bytes per second), 0 for
+            no limit. The DEFAULT entry applies to every group without its own entry.
+        :return: None
+        """
+        with self.queue_condition:
+            self.group_limits = dict(limits)
+            self.queue_condition.notify_all()
+        if self.use_async:
+            self.async_engine.wake()
+
+    def limit_of(self, group):
+        return self.group_limits.get(group) or self.group_limits.get("DEFAULT", (0, 0))
+
+    def bucket_for(self, group):
+        """
+        :return: The TokenBucket shared by the backups of a group, None without a
+            bandwidth limit.
+        """
+        rate = self.limit_of(group)[1]
+        if not rate:
+            return None
+        with self.queue_condition:
+            bucket = self.buckets.get(group)
+            if bucket is None or bucket.rate != rate:
+                bucket = self.buckets[group] = TokenBucket(rate)
+            return bucket
+
+    def take_job(self):
+        """
+        Takes the next backup whose group is below its concurrency limit, serving the
+        groups round-robin so one large cell does not hold up the others.
+        Must be called with queue_condition held.
+
+        :return: The backup job, None if no group may start another backup.
+        """
+        for _ in range(len(self.group_order)):
+            group = self.group_order[0]
+            self.group_order.rotate(-1)
+            max_backups = self.limit_of(group)[0]
+            if max_backups and self.group_active[group] >= max_backups:
+                continue
+            jobs = self.group_queues[group]
+            job = jobs.popleft()
+            if not jobs:
+                del self.group_queues[group]
+                self.group_order.remove(group)
+            self.queued_jobs -= 1
+            self.group_active[group] += 1
+            return job
+        return None
+
+    def job_finished(self, job, started=True):
+        # Must be called with queue_condition held
+        self.pending_folders[job[2]] -= 1
+        if self.pending_folders[job[2]] <= 0:
+            del self.pending_folders[job[2]]
+        if started:
+            self.group_active[job[5]] -= 1
+
+    def has_pending(self, main_folder):
+        """
+        :return: True while backups into main_folder are queued or running.
+        """
+        with self.queue_condition:
+            return self.pending_folders[main_folder] > 0
+
+    def active_count(self):
+        """
+        :return: The number of backups running right now.
+        """
+        if self.use_async:
+            return self.async_engine.active_count()
+        with self.queue_condition:
+            return self.active_jobs
+
+    def get_next_backup(self):
+        """
+        Takes the next backup from the queue without waiting.
+
+        Returns:
+            The next host if available, None otherwise.
+        """
+        with self.queue_condition:
+            return self.take_job()
+
+    def terminate_all_threads(self):
+        """
+        Drops all queued backups and lets idle workers exit.
+        Threaded backups already running are finished, asyncio backups are cancelled.
+
+        Returns:
+            None
+        """
+        with self.queue_condition:
+            for jobs in self.group_queues.values():
+                for job in jobs:
+                    self.job_finished(job, started=False)
+            self.group_queues.clear()
+            self.group_order.clear()
+            self.queued_jobs = 0
+            self.pool_size = 0
+            self.queue_condition.notify_all()
+        self.async_engine.cancel()
+        self.connections.close_all()
+        self.progress_stop.set()
+
+    def backup_robot(
+        self,
+        robot_name,
+        ftp_host,
+        main_folder,
+        selected_extensions,
+        previous_folder=None,
+        group=None,
+    ):
+        """
+        Backup robot files from an FTP server.
+
+        Args:
+            robot_name (str): The name of the robot to backup.
+            ftp_host (str): The FTP host to connect to for backing up.
+            main_folder (str): The main folder where backups are stored.
+            selected_extensions (list): The list of selected file extensions to backup.
+            previous_folder (str): The previous backup of the robot, unchanged files
+                are linked from it instead of downloaded.
+            group (str): The VLAN or subnet of the robot, its bandwidth limit applies.
+
+        Returns:
+            None
+        """
+        now = datetime.now().strftime("%Y-%m-%d_%HH_%MM")
+        robot_folder = main_folder + "\\" + robot_name + "_" + now
+        robot_MD = robot_md_folder(robot_folder)
+        previous = load_backup_manifest(previous_folder) if previous_folder else {}
+        manifest = None
+        self.telemetry.robot_started(robot_name, ftp_host, group)
+        for attempt in range(self.retries + 1):
+            ftp = None
+            reusable = False
+            try:
+                ftp, connect_time = self.connections.acquire(ftp_host)
+                if connect_time is not None:
+                    self.transfer_stats.add_session(connect_time)
+                    self.telemetry.add(robot_name, "connect_s", connect_time)
                 # Create individual folder for robot within the main folder
                 # Create main folder with current date and time on desktop
                 os.makedirs(robot_folder, exist_ok=True)
-                # Download files from the robot to its folder
-                total_files = self.count_files(ftp, "/md:", selected_extensions)
-                self.progress_signal.emit(
-                    robot_name, 0, "", ""
-                )  # Signal to update scheduled list
+                # Walk the robot once, then download what the manifest lists.
+                # A reconnect keeps the manifest and resumes from the checkpoint
+                if manifest is None:
+                    listing_started = time.monotonic()
+                    manifest = self.build_manifest(
+                        ftp, "/md:", selected_extensions, with_modify=bool(previous)
+                    )
+                    self.telemetry.add(
+                        robot_name, "listing_s", time.monotonic() - listing_started
+                    )
+                    self.report_progress(
+                        robot_name, 0, "", ""
+                    )  # Signal to update scheduled list
                 os.makedirs(robot_MD, exist_ok=True)
-                self.download_directory(
+                self.download_manifest(
                     ftp,
                     "/md:",
+                    manifest,
                     str(robot_MD),
-                    total_files,
                     robot_name,
-                    selected_extensions,
+                    previous,
+                    robot_folder,
+                    self.bucket_for(group),
                 )  # Adjust path as needed
-                self.progress_signal.emit(robot_name, 100, "Completed", "")
-        except Exception as e:
-            if os.path.exists(robot_folder):
-                shutil.rmtree(robot_folder)  # Delete the main folder for the robot
-            self.progress_signal.emit(robot_name, 0, "Terminated", str(e))
-            if self.logger:
-                self.logger.error(f"Error backing up {robot_name}: {str(e)}")
-                # Iterate through active threads and terminate the one related to the current robot
-                for thread in threading.enumerate():
-                    if thread.name == robot_name:
-                        thread.terminate()  # Terminate the thread for the specific robot
-                        self.progress_signal.emit(robot_name, 0, "Terminated", str(e))
-                        break
-            print(f"Error backing up {robot_name}: {str(e)}")
-        finally:
-            self.semaphore.release()  # Release semaphore slot
-
-    def count_files(self, ftp, path, selected_extensions):
+                reusable = True
+                finish_backup(robot_folder, robot_name, ftp_host, manifest)
+                self.report_progress(robot_name, 100, "Completed", "")
+                return
+            except RETRYABLE_ERRORS as e:
+                error = e
+                # A refused transfer leaves the session usable for the retry. A broken
+                # connection does not, nor does an unexpected reply, after which the
+                # control channel may be out of step
+                reusable = isinstance(e, error_temp)
+                self.transfer_stats.add_error()
+                self.telemetry.add(robot_name, "retries", 1)
+                if attempt == self.retries or self.pool_size == 0:
+                    break
+                delay = self.retry_delay(attempt)
+                if self.logger:
+                    self.logger.warning(
+                        f"Connection to {robot_name} lost ({str(e)}), "
+                        f"retry {attempt + 1}/{self.retries} in {delay:g} s"
+                    )
+                time.sleep(delay)
+            except Exception as e:
+                error = e
+                break
+            finally:
+                if ftp is not None:
+                    self.connections.release(ftp_host, ftp, reusable)
+
+        # Finished files are kept with their checkpoint
+        discard_empty_backup(robot_folder)
+        message = str(error) or "Connection closed by controller"  # ftplib EOFError
+        self.report_progress(robot_name, 0, "Terminated", message)
+        if self.logger:
+            self.logger.error(f"Error backing up {robot_name}: {message}")
+        print(f"Error backing up {robot_name}: {message}")
+
+    def build_manifest(self, ftp, path, selected_extensions, with_modify=False):
         """
-        Counts the number of files in the given FTP directory that have selected extensions.
+        Walks the remote tree once and lists every file to back up.
 
-        :param ftp: An instance of FTP class for the FTP connection.
-        :type ftp: ftplib.FTP
-        :param path: The path of the directory to count files in.
-        :type path: str
-        :param selected_extensions: A list of file extensions to count.
-        :type selected_extensions: List[str]
-        :return: The number of files in the directory with selected extensions.
-        :rtype: int
+        :param ftp: The FTP connection object.
+        :param path: The remote root directory, e.g. "/md:".
+        :param selected_extensions: "." for all files, otherwise the list of extensions.
+        :param with_modify: Ask MDTM for files whose listing had no modify time.
+        :return: A list of ManifestEntry tuples, grouped by directory.
         """
+        manifest = []
         ftp.cwd(path)
-        items = ftp.nlst()
-        file_count = 0
-        for item in items:
-            if self.is_file(ftp, item, selected_extensions) and any(
-                ext in item for ext in selected_extensions
-            ):
-                file_count += 1
-        ftp.cwd("..")
-        return file_count
+        self.walk_directory(ftp, (), selected_extensions, manifest, with_modify)
+        manifest.sort(key=lambda entry: entry.parts)
+        return manifest
+
+    def walk_directory(self, ftp, parts, selected_extensions, manifest, with_modify):
+        for entry in self.list_directory(ftp):
+            if entry.is_dir:
+                ftp.cwd(entry.name)
+                self.walk_directory(
+                    ftp,
+                    parts + (entry.name,),
+                    selected_extensions,
+                    manifest,
+                    with_modify,
+                )
+                ftp.cwd("..")
+            elif matches_extension(entry.name, selected_extensions):
+                modify = entry.modify
+                if modify is None and with_modify:
+                    modify = self.modify_time(ftp, entry.name)
+                manifest.append(ManifestEntry(parts, entry.name, entry.size, modify))
 
-    def download_directory(
-        self, ftp, path, local_path, total_files, robot_name, selected_extensions
+    def modify_time(self, ftp, name):
+        """
+        Asks the controller for the modify time of a file with MDTM.
+
+        :return: The time as sent by the controller, or None if MDTM is not supported.
+        """
+        if not self.mdtm_support.get(ftp.host, True):
+            return None
+        try:
+            return ftp.sendcmd(f"MDTM {name}")[4:].strip()
+        except error_perm:
+            self.mdtm_support[ftp.host] = False
+            return None
+
+    def download_manifest(
+        self,
+        ftp,
+        path,
+        manifest,
+        local_path,
+        robot_name,
+        previous=None,
+        checkpoint_folder=None,
+        bucket=None,
     ):
         """
-        Downloads a directory from an FTP server and saves it locally.
+        Downloads the files of a manifest, changing directory only when it changes.
 
         Args:
             ftp (FTP): The FTP connection object.
-            path (str): The remote directory path to download.
+            path (str): The remote root directory the manifest was built from.
+            manifest (list): The ManifestEntry tuples returned by build_manifest.
             local_path (str): The local directory path to save the downloaded files.
-            total_files (int): The total number of files to download.
             robot_name (str): The name of the robot performing the download.
-            selected_extensions (List[str]): The list of file extensions to download.
+            previous (dict): The manifest of the previous backup for an incremental
+                backup, see load_backup_manifest.
+            checkpoint_folder (str): The backup folder holding the checkpoint. Files it
+                lists are skipped and a partly downloaded file is resumed with REST.
+            bucket (TokenBucket): The bandwidth limit of the robot's group, if any.
 
         Returns:
             None
         """
-        ftp.cwd(path)
-        items = ftp.nlst()
-        completed_files = 0
-        for item in items:
-            local_file_path = os.path.join(local_path, item)
-            if self.is_file(ftp, item, selected_extensions):
-                with open(local_file_path, "wb") as f:
-                    ftp.retrbinary(f"RETR {item}", f.write, blocksize=64 * 1024)
-                completed_files += 1
-                progress = int((completed_files / total_files) * 100)
-                self.progress_signal.emit(
-                    robot_name, progress, item, ""
-                )  # Emit progress signal
+        progress = ManifestProgress(manifest)
+        completed = load_checkpoint(checkpoint_folder) if checkpoint_folder else set()
+        current_parts = None
+        for entry in manifest:
+            if manifest_key(entry) in completed:
+                progress.file_done(entry)
+                continue
+            if previous:
+                os.makedirs(os.path.join(local_path, *entry.parts), exist_ok=True)
+                local_file_path = os.path.join(local_path, *entry.parts, entry.name)
+                if reuse_unchanged_file(entry, previous, local_file_path):
+                    progress.file_done(entry)
+                    if checkpoint_folder:
+                        record_checkpoint(checkpoint_folder, entry)
+                    self.report_progress(
+                        robot_name, progress.percent(), entry.name, ""
+                    )
+                    continue
+            if entry.parts != current_parts:
+                ftp.cwd(path)
+                for part in entry.parts:
+                    ftp.cwd(part)
+                current_parts = entry.parts
+                os.makedirs(os.path.join(local_path, *entry.parts), exist_ok=True)
+            local_file_path = os.path.join(local_path, *entry.parts, entry.name)
+            transfer_started = time.monotonic()
+            self.retrieve_file(ftp, entry, local_file_path, progress, bucket)
+            self.telemetry.file_done(
+                robot_name,
+                manifest_key(entry),
+                os.path.getsize(local_file_path),
+                time.monotonic() - transfer_started,
+            )
+            progress.file_done(entry)
+            if checkpoint_folder:
+                record_checkpoint(checkpoint_folder, entry)
+            self.report_progress(
+                robot_name, progress.percent(), entry.name, ""
+            )  # Emit progress signal
+
+    def retrieve_file(self, ftp, entry, local_file_path, progress, bucket=None):
+        """
+        Downloads one file of the current remote directory, continuing a partly
+        downloaded copy with REST where the controller supports it.
 
-            else:
-                # Skip creating a directory for files with extensions
-                if "." not in item:
-                    subdirectory = os.path.join(local_path, item)
-                    os.makedirs(subdirectory, exist_ok=True)
-                    self.download_directory(
-                        ftp,
-                        item,
-                        subdirectory,
-                        total_files,
-                        robot_name,
-                        selected_extensions,
+        :param ftp: The FTP connection object.
+        :param entry: The ManifestEntry of the file.
+        :param local_file_path: Where the file is saved.
+        :param progress: The ManifestProgress of the backup.
+        :param bucket: The TokenBucket of the robot's group, None for no bandwidth limit.
+        :return: None
+        """
+        detach_linked_file(local_file_path)
+        offset = 0
+        if self.rest_support.get(ftp.host, True):
+            offset = resume_offset(entry, local_file_path)
+        with open(local_file_path, "ab" if offset else "wb") as f:
+
+            def write_block(block):
+                f.write(block)
+                progress.add_bytes(len(block))
+                self.transfer_stats.add_bytes(len(block))
+                if bucket:
+                    delay = bucket.reserve(len(block))
+                    if delay:
+                        time.sleep(delay)  # Not reading the socket slows the sender down
+
+            if offset:
+                try:
+                    progress.add_bytes(offset)
+                    ftp.retrbinary(
+                        f"RETR {entry.name}", write_block, blocksize=64 * 1024, rest=offset
                     )
-        ftp.cwd("..")
+                    return
+                except error_perm:
+                    # REST refused, download the whole file again
+                    self.rest_support[ftp.host] = False
+                    progress.add_bytes(-f.tell())
+                    f.seek(0)
+                    f.truncate()
+            ftp.retrbinary(f"RETR {entry.name}", write_block, blocksize=64 * 1024)
+
+    def list_directory(self, ftp):
+        """
+        Lists the current remote directory with a single request.
+
+        MLSD is used where the controller supports it (remembered per host), otherwise
+        LIST is parsed. Only if the LIST format is not understood are names without an
+        extension probed with CWD.
+
+        :param ftp: The FTP connection object.
+        :return: A list of RemoteEntry tuples.
+        """
+        if self.mlsd_support.get(ftp.host, True):
+            try:
+                entries = []
+                for name, facts in ftp.mlsd():
+                    entry = entry_from_mlsd(name, facts)
+                    if entry:
+                        entries.append(entry)
+                self.mlsd_support[ftp.host] = True
+                return entries
+            except error_perm:
+                self.mlsd_support[ftp.host] = False
+
+        lines = []
+        ftp.retrlines("LIST", lines.append)
+        entries = [entry for entry in map(parse_list_line, lines) if entry]
+        if entries or not lines:
+            return entries
+
+        # Unknown LIST format
+        return [
+            RemoteEntry(item, not self.is_file(ftp, item, "."), None, None)
+            for item in ftp.nlst()
+        ]
 
     def is_file(self, ftp, item, selected_extensions):
         """
@@ -1921,15 +4364,7 @@ class Worker(QObject):
         :return: True if the item is a file based on the selected extensions, False otherwise.
         """
         if "." in item:
-            if selected_extensions == ".":
-                return True
-            else:
-                extension = item.split(".")[1]
-                extension = "." + extension
-                if extension in selected_extensions:
-                    return True
-                else:
-                    return False
+            return matches_extension(item, selected_extensions)
         else:
             try:
                 # Only navigate to directory if it doesn't have an extension
@@ -1940,7 +4375,1724 @@ class Worker(QObject):
                 return True
 
 
+class AsyncFTPClient:
+    """
+    Minimal FTP client on asyncio streams, covering the commands a Fanuc controller
+    backup needs (login, CWD, MLSD, LIST, NLST, RETR). Errors are raised as the ftplib exception
+    types so they read the same in the Status tab as the threaded engine's.
+    """
+
+    def __init__(self, host, port=21, timeout=10):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        await self.read_reply(expect="2")
+
+    async def login(self, user="anonymous", passwd="anonymous@"):
+        code, text = await self.command(f"USER {user}", expect="23")
+        if code == "331":
+            await self.command(f"PASS {passwd}", expect="2")
+
+    async def cwd(self, path):
+        await self.command(f"CWD {path}")
+
+    async def nlst(self):
+        lines = []
+        data = await self.transfer("NLST")
+        for line in data.decode("latin-1").splitlines():
+            if line:
+                lines.append(line)
+        return lines
+
+    async def mlsd(self):
+        data = await self.transfer("MLSD")
+        return [
+            parse_mlsd_line(line)
+            for line in data.decode("latin-1").splitlines()
+            if line
+        ]
+
+    async def list(self):
+        data = await self.transfer("LIST")
+        return [line for line in data.decode("latin-1").splitlines() if line]
+
+    async def retrbinary(
+        self, name, callback, blocksize=64 * 1024, rest=None, bucket=None
+    ):
+        await self.transfer(f"RETR {name}", callback, blocksize, rest, bucket)
+
+    async def noop(self):
+        await self.command("NOOP")
+
+    async def quit(self):
+        try:
+            await self.command("QUIT")
+        except Exception:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+    async def command(self, cmd, expect="2"):
+        self.writer.write((cmd + "\r\n").encode("latin-1"))
+        await asyncio.wait_for(self.writer.drain(), self.timeout)
+        return await self.read_reply(expect)
+
+    async def read_reply(self, expect="2"):
+        line = await self.read_line()
+        code = line[:3]
+        text = line
+        if line[3:4] == "-":
+            while True:
+                line = await self.read_line()
+                text += "\n" + line
+                if line[:3] == code and line[3:4] == " ":
+                    break
+        if code[:1] not in expect:
+            if code[:1] == "4":
+                raise error_temp(text)
+            if code[:1] == "5":
+                raise error_perm(text)
+            raise error_reply(text)
+        return code, text
+
+    async def read_line(self):
+        line = await asyncio.wait_for(self.reader.readline(), self.timeout)
+        if not line:
+            raise EOFError("Connection closed by controller")
+        return line.decode("latin-1").rstrip("\r\n")
+
+    async def transfer(
+        self, cmd, callback=None, blocksize=64 * 1024, rest=None, bucket=None
+    ):
+        """
+        Runs a command over a passive data connection.
+
+        :param cmd: The FTP command, e.g. "RETR FILE.TP" or "NLST".
+        :param callback: Called with every received block, if None the data is returned.
+        :param blocksize: Maximum number of bytes read at once.
+        :param rest: Byte offset to restart the transfer at, sent with REST.
+        :param bucket: TokenBucket that paces the transfer, None for no limit.
+        :return: The received data when no callback is given.
+        """
+        await self.command("TYPE I")
+        code, text = await self.command("PASV")
+        match = re.search(r"(\d+),(\d+),(\d+),(\d+),(\d+),(\d+)", text)
+        if not match:
+            raise error_reply(text)
+        port = int(match.group(5)) * 256 + int(match.group(6))
+        # Like ftplib, ignore the address in the reply and use the control host
+        data_reader, data_writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, port), self.timeout
+        )
+        chunks = []
+        started = False
+        try:
+            if rest is not None:
+                await self.command(f"REST {rest}", expect="3")
+            await self.command(cmd, expect="1")
+            started = True
+            while True:
+                block = await asyncio.wait_for(
+                    data_reader.read(blocksize), self.timeout
+                )
+                if not block:
+                    break
+                if callback:
+                    callback(block)
+                else:
+                    chunks.append(block)
+                if bucket:
+                    delay = bucket.reserve(len(block))
+                    if delay:
+                        await asyncio.sleep(delay)
+        except BaseException:
+            if started:
+                # The 226 / 426 reply of the broken transfer is still unread, the
+                # control connection is out of step and cannot be reused
+                self.close()
+            raise
+        finally:
+            data_writer.close()
+            with contextlib.suppress(Exception):
+                await asyncio.wait_for(data_writer.wait_closed(), self.timeout)
+        await self.read_reply(expect="2")
+        return b"".join(chunks)
+
+
+class AsyncFTPConnectionPool:
+    """
+    The FTPConnectionPool of the asyncio engine. Only used from the event loop thread.
+    """
+
+    def __init__(self, idle_timeout=FTP_IDLE_TIMEOUT, timeout=10):
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.idle = {}  # Host -> (AsyncFTPClient, time.monotonic() of the release)
+
+    async def acquire(self, ftp_host):
+        """
+        :return: (AsyncFTPClient, connect time) for a new session, (client, None) for
+            a reused one.
+        """
+        ftp, released = self.idle.pop(ftp_host, (None, 0))
+        if ftp is not None:
+            try:
+                await ftp.noop()
+                return ftp, None
+            except Exception:
+                ftp.close()
+        connect_started = time.monotonic()
+        ftp = AsyncFTPClient(*split_host(ftp_host), timeout=self.timeout)
+        try:
+            await ftp.connect()
+            await ftp.login()
+        except BaseException:
+            ftp.close()
+            raise
+        return ftp, time.monotonic() - connect_started
+
+    def release(self, ftp_host, ftp, reusable=True):
+        if not reusable or ftp.writer is None:
+            ftp.close()
+            return
+        replaced = self.idle.get(ftp_host)
+        if replaced:
+            replaced[0].close()
+        self.idle[ftp_host] = (ftp, time.monotonic())
+        asyncio.get_running_loop().call_later(self.idle_timeout + 1, self.evict_idle)
+
+    def evict_idle(self):
+        now = time.monotonic()
+        for ftp_host, (ftp, released) in list(self.idle.items()):
+            if now - released > self.idle_timeout:
+                del self.idle[ftp_host]
+                asyncio.ensure_future(ftp.quit())
+
+    def close_all(self):
+        for ftp, released in self.idle.values():
+            ftp.close()
+        self.idle.clear()
+
+
+class AsyncBackupEngine:
+    """
+    Runs the queued backups of a Worker as coroutines on a single event loop thread,
+    so hundreds of controller FTP sessions cost one thread instead of one each.
+
+    The number of sessions follows Worker.pool_size, each host gets its own
+    timeout, and running backups can be cancelled. Progress is reported through
+    Worker.report_progress exactly like the threaded engine.
+    """
+
+    def __init__(self, worker, command_timeout=10):
+        self.worker = worker
+        self.logger = worker.logger
+        self.command_timeout = command_timeout
+        self.loop = None
+        self.tasks = {}
+        self.robot_folders = {}
+        self.connections = AsyncFTPConnectionPool(timeout=command_timeout)
+
+    def start(self):
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self.loop.run_forever, name="ExodusAsyncEngine"
+            )
+            thread.daemon = True
+            thread.start()
+
+    def wake(self):
+        """
+        Asks the event loop to start queued backups while there are free sessions.
+        Safe to call from any thread.
+        """
+        self.start()
+        self.loop.call_soon_threadsafe(self.dispatch)
+
+    def cancel(self, robot_name=None):
+        """
+        Cancels the running backup of one robot, or of all robots if none is given.
+        Safe to call from any thread.
+        """
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.cancel_tasks, robot_name)
+
+    def cancel_tasks(self, robot_name):
+        for task, name in list(self.tasks.items()):
+            if robot_name is None or name == robot_name:
+                task.cancel()
+        if robot_name is None:
+            self.connections.close_all()
+
+    def active_count(self):
+        return len(self.tasks)
+
+    async def blocking(self, func, *args):
+        # Checkpoint and manifest files are written on the default executor, a slow
+        # backup share must not stall the transfers of every other robot
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def dispatch(self):
+        while len(self.tasks) < self.worker.pool_size:
+            job = self.worker.get_next_backup()
+            if job is None:
+                break
+            task = self.loop.create_task(self.run_job(job))
+            self.tasks[task] = job[0]
+
+    async def run_job(self, job):
+        try:
+            await asyncio.wait_for(self.backup_robot(*job), self.worker.host_timeout)
+        except asyncio.TimeoutError:
+            self.worker.transfer_stats.add_error()
+            self.report_failure(job, "Backup timed out")
+        except asyncio.CancelledError:
+            self.report_failure(job, "Backup cancelled")
+        except Exception as e:
+            self.report_failure(job, str(e))
+        finally:
+            self.tasks.pop(asyncio.current_task(), None)
+            with self.worker.queue_condition:
+                self.worker.job_finished(job)
+            self.dispatch()
+
+    def report_failure(self, job, error):
+        robot_name = job[0]
+        robot_folder = self.robot_folders.pop(robot_name, None)
+        if robot_folder:
+            discard_empty_backup(robot_folder)  # Finished files are kept with their checkpoint
+        self.worker.report_progress(robot_name, 0, "Terminated", error)
+        if self.logger:
+            self.logger.error(f"Error backing up {robot_name}: {error}")
+        print(f"Error backing up {robot_name}: {error}")
+
+    async def backup_robot(
+        self,
+        robot_name,
+        ftp_host,
+        main_folder,
+        selected_extensions,
+        previous_folder=None,
+        group=None,
+    ):
+        """
+        Backup robot files from an FTP server, the asyncio counterpart of
+        Worker.backup_robot.
+
+        Args:
+            robot_name (str): The name of the robot to backup.
+            ftp_host (str): The FTP host to connect to for backing up.
+            main_folder (str): The main folder where backups are stored.
+            selected_extensions (list): The list of selected file extensions to backup.
+            previous_folder (str): The previous backup of the robot for an incremental backup.
+            group (str): The VLAN or subnet of the robot, its bandwidth limit applies.
+
+        Returns:
+            None
+        """
+        now = datetime.now().strftime("%Y-%m-%d_%HH_%MM")
+        robot_folder = main_folder + "\\" + robot_name + "_" + now
+        robot_MD = robot_md_folder(robot_folder)
+        previous = (
+            await self.blocking(load_backup_manifest, previous_folder)
+            if previous_folder
+            else {}
+        )
+        self.robot_folders[robot_name] = robot_folder
+        manifest = None
+        telemetry = self.worker.telemetry
+        telemetry.robot_started(robot_name, ftp_host, group)
+        for attempt in range(self.worker.retries + 1):
+            ftp = None
+            reusable = False
+            try:
+                ftp, connect_time = await self.connections.acquire(ftp_host)
+                if connect_time is not None:
+                    self.worker.transfer_stats.add_session(connect_time)
+                    telemetry.add(robot_name, "connect_s", connect_time)
+                os.makedirs(robot_folder, exist_ok=True)
+                if manifest is None:
+                    listing_started = time.monotonic()
+                    manifest = await self.build_manifest(
+                        ftp, "/md:", selected_extensions, with_modify=bool(previous)
+                    )
+                    telemetry.add(
+                        robot_name, "listing_s", time.monotonic() - listing_started
+                    )
+                    self.worker.report_progress(robot_name, 0, "", "")
+                os.makedirs(robot_MD, exist_ok=True)
+                await self.download_manifest(
+                    ftp,
+                    "/md:",
+                    manifest,
+                    str(robot_MD),
+                    robot_name,
+                    previous,
+                    robot_folder,
+                    self.worker.bucket_for(group),
+                )
+                reusable = True
+                await self.blocking(
+                    finish_backup, robot_folder, robot_name, ftp_host, manifest
+                )
+                break
+            except RETRYABLE_ERRORS as e:
+                self.worker.transfer_stats.add_error()
+                telemetry.add(robot_name, "retries", 1)
+                reusable = isinstance(e, error_temp)  # See Worker.backup_robot
+                if attempt == self.worker.retries:
+                    raise
+                delay = self.worker.retry_delay(attempt)
+                if self.logger:
+                    self.logger.warning(
+                        f"Connection to {robot_name} lost ({str(e)}), "
+                        f"retry {attempt + 1}/{self.worker.retries} in {delay:g} s"
+                    )
+                if ftp is not None:
+                    self.connections.release(ftp_host, ftp, reusable)
+                    ftp = None
+                await asyncio.sleep(delay)
+            finally:
+                if ftp is not None:
+                    self.connections.release(ftp_host, ftp, reusable)
+        self.robot_folders.pop(robot_name, None)
+        self.worker.report_progress(robot_name, 100, "Completed", "")
+
+    async def build_manifest(self, ftp, path, selected_extensions, with_modify=False):
+        manifest = []
+        await ftp.cwd(path)
+        await self.walk_directory(ftp, (), selected_extensions, manifest, with_modify)
+        manifest.sort(key=lambda entry: entry.parts)
+        return manifest
+
+    async def walk_directory(self, ftp, parts, selected_extensions, manifest, with_modify):
+        for entry in await self.list_directory(ftp):
+            if entry.is_dir:
+                await ftp.cwd(entry.name)
+                await self.walk_directory(
+                    ftp,
+                    parts + (entry.name,),
+                    selected_extensions,
+                    manifest,
+                    with_modify,
+                )
+                await ftp.cwd("..")
+            elif matches_extension(entry.name, selected_extensions):
+                modify = entry.modify
+                if modify is None and with_modify:
+                    modify = await self.modify_time(ftp, entry.name)
+                manifest.append(ManifestEntry(parts, entry.name, entry.size, modify))
+
+    async def modify_time(self, ftp, name):
+        mdtm_support = self.worker.mdtm_support
+        if not mdtm_support.get(ftp.host, True):
+            return None
+        try:
+            code, text = await ftp.command(f"MDTM {name}")
+            return text[4:].strip()
+        except error_perm:
+            mdtm_support[ftp.host] = False
+            return None
+
+    async def download_manifest(
+        self,
+        ftp,
+        path,
+        manifest,
+        local_path,
+        robot_name,
+        previous=None,
+        checkpoint_folder=None,
+        bucket=None,
+    ):
+        progress = ManifestProgress(manifest)
+        completed = (
+            await self.blocking(load_checkpoint, checkpoint_folder)
+            if checkpoint_folder
+            else set()
+        )
+        current_parts = None
+        for entry in manifest:
+            if manifest_key(entry) in completed:
+                progress.file_done(entry)
+                continue
+            if previous:
+                os.makedirs(os.path.join(local_path, *entry.parts), exist_ok=True)
+                local_file_path = os.path.join(local_path, *entry.parts, entry.name)
+                if await self.blocking(
+                    reuse_unchanged_file, entry, previous, local_file_path
+                ):
+                    progress.file_done(entry)
+                    if checkpoint_folder:
+                        await self.blocking(record_checkpoint, checkpoint_folder, entry)
+                    self.worker.report_progress(
+                        robot_name, progress.percent(), entry.name, ""
+                    )
+                    continue
+            if entry.parts != current_parts:
+                await ftp.cwd(path)
+                for part in entry.parts:
+                    await ftp.cwd(part)
+                current_parts = entry.parts
+                os.makedirs(os.path.join(local_path, *entry.parts), exist_ok=True)
+            local_file_path = os.path.join(local_path, *entry.parts, entry.name)
+            transfer_started = time.monotonic()
+            await self.retrieve_file(ftp, entry, local_file_path, progress, bucket)
+            self.worker.telemetry.file_done(
+                robot_name,
+                manifest_key(entry),
+                os.path.getsize(local_file_path),
+                time.monotonic() - transfer_started,
+            )
+            progress.file_done(entry)
+            if checkpoint_folder:
+                await self.blocking(record_checkpoint, checkpoint_folder, entry)
+            self.worker.report_progress(
+                robot_name, progress.percent(), entry.name, ""
+            )
+
+    async def retrieve_file(self, ftp, entry, local_file_path, progress, bucket=None):
+        # Same resume rules as Worker.retrieve_file
+        rest_support = self.worker.rest_support
+        detach_linked_file(local_file_path)
+        offset = 0
+        if rest_support.get(ftp.host, True):
+            offset = resume_offset(entry, local_file_path)
+        with open(local_file_path, "ab" if offset else "wb") as f:
+
+            def write_block(block):
+                f.write(block)
+                progress.add_bytes(len(block))
+                self.worker.transfer_stats.add_bytes(len(block))
+
+            if offset:
+                try:
+                    progress.add_bytes(offset)
+                    await ftp.retrbinary(
+                        entry.name,
+                        write_block,
+                        blocksize=64 * 1024,
+                        rest=offset,
+                        bucket=bucket,
+                    )
+                    return
+                except error_perm:
+                    # REST refused, download the whole file again
+                    rest_support[ftp.host] = False
+                    progress.add_bytes(-f.tell())
+                    f.seek(0)
+                    f.truncate()
+            await ftp.retrbinary(
+                entry.name, write_block, blocksize=64 * 1024, bucket=bucket
+            )
+
+    async def list_directory(self, ftp):
+        # Same strategy as Worker.list_directory: MLSD, then parsed LIST, then NLST
+        mlsd_support = self.worker.mlsd_support
+        if mlsd_support.get(ftp.host, True):
+            try:
+                entries = []
+                for name, facts in await ftp.mlsd():
+                    entry = entry_from_mlsd(name, facts)
+                    if entry:
+                        entries.append(entry)
+                mlsd_support[ftp.host] = True
+                return entries
+            except error_perm:
+                mlsd_support[ftp.host] = False
+
+        lines = await ftp.list()
+        entries = [entry for entry in map(parse_list_line, lines) if entry]
+        if entries or not lines:
+            return entries
+
+        # Unknown LIST format
+        return [
+            RemoteEntry(item, not await self.is_file(ftp, item, "."), None, None)
+            for item in await ftp.nlst()
+        ]
+
+    async def is_file(self, ftp, item, selected_extensions):
+        if "." in item:
+            return matches_extension(item, selected_extensions)
+        try:
+            # Only navigate to directory if it doesn't have an extension
+            await ftp.cwd(item)
+            await ftp.cwd("..")
+            return False
+        except (error_perm, error_temp, error_reply):
+            return True
+
+
+class BackupStore:
+    """
+    Deduplicating store for archived backups, kept in Archive/Store.
+
+    Every file is saved once under objects/, named after its SHA-256 hash, and each
+    archived robot backup is a small JSON manifest under manifests/RevN/ that maps
+    its relative paths to those objects. Archived revisions can be listed and
+    restored to a normal folder.
+    """
+
+    def __init__(self, archive_folder):
+        self.root = os.path.join(archive_folder, "Store")
+        self.objects = os.path.join(self.root, "objects")
+        self.manifests = os.path.join(self.root, "manifests")
+
+    @classmethod
+    def from_manifest(cls, manifest_path):
+        # manifest_path is Archive/Store/manifests/RevN/backup.json
+        archive_folder = manifest_path
+        for _ in range(4):
+            archive_folder = os.path.dirname(archive_folder)
+        return cls(archive_folder)
+
+    def object_path(self, digest):
+        return os.path.join(self.objects, digest[:2], digest)
+
+    def manifest_path(self, revision, backup_name):
+        return os.path.join(self.manifests, f"Rev{revision}", backup_name + ".json")
+
+    def revisions(self):
+        """
+        :return: The revision numbers held in the store, in ascending order.
+        """
+        if not os.path.isdir(self.manifests):
+            return []
+        return sorted(
+            int(folder[3:])
+            for folder in os.listdir(self.manifests)
+            if folder.startswith("Rev") and folder[3:].isdigit()
+        )
+
+    def backups(self, revision):
+        """
+        :return: The names of the backups archived in a revision.
+        """
+        rev_folder = os.path.join(self.manifests, f"Rev{revision}")
+        if not os.path.isdir(rev_folder):
+            return []
+        return sorted(
+            os.path.splitext(name)[0]
+            for name in os.listdir(rev_folder)
+            if name.endswith(".json")
+        )
+
+    def load_manifest(self, manifest_path):
+        with open(manifest_path, "r") as f:
+            return json.load(f)
+
+    def put_file(self, path):
+        """
+        Adds a file to the store. A new object is moved in, a duplicate is left in place.
+
+        :param path: The file to add.
+        :return: The SHA-256 hex digest of the file.
+        """
+        digest = file_sha256(path)
+        target = self.object_path(digest)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(path, target)
+        return digest
+
+    def archive_folder(self, folder_path, revision):
+        """
+        Moves a backup folder into the store as part of a revision.
+
+        :param folder_path: The backup folder, e.g. ROBOT_2024-01-01_22H_00M.
+        :param revision: The revision number it is archived under.
+        :return: The path of the manifest written for the backup.
+        """
+        files = {}
+        for dirpath, dirnames, filenames in os.walk(folder_path):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                relative = os.path.relpath(path, folder_path).replace(os.sep, "/")
+                size = os.path.getsize(path)
+                files[relative] = [self.put_file(path), size]
+        name = os.path.basename(folder_path)
+        manifest_path = self.manifest_path(revision, name)
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(manifest_path, "w") as f:
+            json.dump({"backup": name, "revision": revision, "files": files}, f)
+        shutil.rmtree(folder_path)
+        return manifest_path
+
+    def remove_revision(self, revision):
+        rev_folder = os.path.join(self.manifests, f"Rev{revision}")
+        if os.path.isdir(rev_folder):
+            shutil.rmtree(rev_folder)
+
+    def collect_garbage(self):
+        """
+        Deletes the objects no manifest refers to any more.
+
+        :return: The number of objects deleted.
+        """
+        referenced = set()
+        for revision in self.revisions():
+            for backup_name in self.backups(revision):
+                manifest = self.load_manifest(self.manifest_path(revision, backup_name))
+                referenced.update(digest for digest, size in manifest["files"].values())
+        removed = 0
+        if not os.path.isdir(self.objects):
+            return removed
+        for dirpath, dirnames, filenames in os.walk(self.objects):
+            for filename in filenames:
+                if filename not in referenced:
+                    os.remove(os.path.join(dirpath, filename))
+                    removed += 1
+        return removed
+
+    def restore(self, revision, backup_name, destination):
+        """
+        Copies an archived backup out of the store into a normal folder.
+
+        :param revision: The revision number.
+        :param backup_name: The name of the archived backup.
+        :param destination: The folder the backup folder is created in.
+        :return: The path of the restored backup folder.
+        """
+        manifest = self.load_manifest(self.manifest_path(revision, backup_name))
+        restored = os.path.join(destination, backup_name)
+        for relative, (digest, size) in manifest["files"].items():
+            target = os.path.join(restored, *relative.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(self.object_path(digest), target)
+        return restored
+
+
+class ArchiveMaintenance:
+    """
+    Background upkeep of a project archive after a rotation. Older revisions are
+    moved into the deduplicated store (the newest stays a plain folder, incremental
+    backups link from it) and revisions beyond the retention limit are deleted.
+    """
+
+    lock = threading.Lock()  # One maintenance run at a time
+
+    def __init__(self, archive_folder, keep_revisions=0, dedup=False, logger=None):
+        self.archive_folder = archive_folder
+        self.keep_revisions = keep_revisions
+        self.dedup = dedup
+        self.logger = logger
+
+    def start(self):
+        thread = threading.Thread(target=self.run, name="ExodusArchiveMaintenance")
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def run(self):
+        if not self.lock.acquire(blocking=False):
+            return  # The running maintenance already covers this archive
+        try:
+            latest_rev = read_archive_index(self.archive_folder)
+            if self.dedup:
+                self.deduplicate(latest_rev)
+            if self.keep_revisions:
+                self.prune(latest_rev - self.keep_revisions)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error maintaining archive: {str(e)}")
+            print(f"Error maintaining archive: {str(e)}")
+        finally:
+            self.lock.release()
+
+    def folder_revisions(self):
+        return sorted(
+            int(folder[3:])
+            for folder in os.listdir(self.archive_folder)
+            if folder.startswith("Rev") and folder[3:].isdigit()
+        )
+
+    def deduplicate(self, latest_rev):
+        store = BackupStore(self.archive_folder)
+        for rev_number in self.folder_revisions():
+            if rev_number >= latest_rev:
+                continue
+            rev_folder = os.path.join(self.archive_folder, f"Rev{rev_number}")
+            for folder in os.listdir(rev_folder):
+                folder_path = os.path.join(rev_folder, folder)
+                if os.path.isdir(folder_path):
+                    store.archive_folder(folder_path, rev_number)
+            shutil.rmtree(rev_folder)
+
+    def prune(self, last_removed_rev):
+        store = BackupStore(self.archive_folder)
+        for rev_number in self.folder_revisions():
+            if rev_number <= last_removed_rev:
+                shutil.rmtree(os.path.join(self.archive_folder, f"Rev{rev_number}"))
+        pruned_store = False
+        for rev_number in store.revisions():
+            if rev_number <= last_removed_rev:
+                store.remove_revision(rev_number)
+                pruned_store = True
+        if pruned_store:
+            store.collect_garbage()
+
+
+def read_project(project_file_path):
+    """
+    Reads a project file, either an .ini file or a ProjectStore.
+
+    :param project_file_path: The project .ini or .exodb file.
+    :return: A tuple of (backup directory as configured, [(robot name, IP address)],
+        {robot name: VLAN}).
+    """
+    if is_project_store(project_file_path):
+        if not os.path.exists(project_file_path):
+            raise FileNotFoundError(f"Project file does not exist: {project_file_path}")
+        return ProjectStore(project_file_path).load()
+    config = configparser.ConfigParser()
+    if not config.read(project_file_path):
+        raise FileNotFoundError(f"Project file does not exist: {project_file_path}")
+    backup_directory = config.get("General", "BackupDirectory", fallback="")
+    robots = [(name.upper(), ip) for name, ip in config.items("Robots")]
+    vlans = {}
+    if config.has_section("Vlans"):
+        vlans = {name.upper(): vlan for name, vlan in config.items("Vlans")}
+    return backup_directory, robots, vlans
+
+
+def load_project(project_file_path):
+    """
+    Reads a project file.
+
+    :param project_file_path: The project .ini or .exodb file.
+    :return: A tuple of (backup directory, [(robot name, IP address)], {robot name: VLAN}).
+        The backup directory already includes the project folder.
+    """
+    backup_directory, robots, vlans = read_project(project_file_path)
+    project_name = os.path.splitext(os.path.basename(project_file_path))[0]
+    backup_directory = backup_directory + "\\" + project_name
+    return backup_directory, robots, vlans
+
+
+def is_project_store(project_file_path):
+    return project_file_path.lower().endswith(PROJECT_STORE_EXTENSION)
+
+
+class ProjectStore:
+    """
+    A project kept in a single SQLite file instead of an .ini file, for plants with
+    thousands of robots. Besides name, IP address and VLAN it records the cell,
+    controller type, last status check and last backup of every robot, indexed by
+    name, VLAN and status so they can be queried without reading the whole project.
+    Every call opens its own connection, a store can be used from any thread.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS general (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS robots (
+            name TEXT PRIMARY KEY,
+            ip TEXT NOT NULL,
+            vlan TEXT,
+            cell TEXT,
+            controller TEXT NOT NULL DEFAULT 'Fanuc',
+            status TEXT,
+            last_seen TEXT,
+            last_backup TEXT,
+            last_backup_bytes INTEGER,
+            position INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS robots_vlan ON robots (vlan);
+        CREATE INDEX IF NOT EXISTS robots_status ON robots (status);
+        CREATE INDEX IF NOT EXISTS robots_cell ON robots (cell);
+        CREATE TABLE IF NOT EXISTS group_limits (
+            name TEXT PRIMARY KEY,
+            max_backups INTEGER NOT NULL,
+            bytes_per_second INTEGER NOT NULL
+        );
+    """
+    VERSION = 2  # 2: robots_cell index
+
+    def __init__(self, path):
+        self.path = path
+        with self.connect() as db:
+            version = db.execute("PRAGMA user_version").fetchone()[0]
+            if version < self.VERSION:
+                # A new file, or one of an older version, the schema only adds what is missing
+                db.executescript(self.SCHEMA)
+                db.execute(f"PRAGMA user_version = {self.VERSION}")
+
+    @contextlib.contextmanager
+    def connect(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:  # Commits, or rolls back on an exception
+                yield db
+        finally:
+            db.close()
+
+    def get(self, key, fallback=""):
+        with self.connect() as db:
+            row = db.execute("SELECT value FROM general WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else fallback
+
+    def load(self):
+        """
+        :return: A tuple of (backup directory, [(robot name, IP address)],
+            {robot name: VLAN}), like read_project.
+        """
+        with self.connect() as db:
+            general = db.execute(
+                "SELECT value FROM general WHERE key = 'BackupDirectory'"
+            ).fetchone()
+            rows = db.execute("SELECT name, ip, vlan FROM robots ORDER BY position").fetchall()
+        robots = [(row["name"], row["ip"]) for row in rows]
+        vlans = {row["name"]: row["vlan"] for row in rows if row["vlan"]}
+        return general["value"] if general else "", robots, vlans
+
+    def robots(self, vlan=None, status=None, cell=None):
+        """
+        :param vlan: Only the robots of this VLAN.
+        :param status: Only the robots with this status, "Online" or "Offline".
+        :param cell: Only the robots of this cell, see robot_group.
+        :return: The robots as dictionaries with the columns of the robots table.
+        """
+        filters = {"vlan": vlan, "status": status, "cell": cell}
+        where = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        query = "SELECT * FROM robots"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        with self.connect() as db:
+            rows = db.execute(
+                query + " ORDER BY position",
+                [value for value in filters.values() if value is not None],
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def save_project(self, backup_directory, robots, vlans, group_limits):
+        """
+        Replaces the settings and robots of the project. Status and last backup of
+        the robots that stay in the project are kept.
+
+        :param backup_directory: The backup directory as configured.
+        :param robots: A dictionary of robot name -> IP address, in project order.
+        :param vlans: A dictionary of robot name -> VLAN.
+        :param group_limits: A dictionary of group -> (max backups, bytes per second).
+        """
+        with self.connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO general (key, value) VALUES ('BackupDirectory', ?)",
+                (backup_directory,),
+            )
+            # Robots left at position -1 are no longer in the project
+            db.execute("UPDATE robots SET position = -1")
+            db.executemany(
+                "INSERT INTO robots (name, ip, vlan, cell, position) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET ip = excluded.ip, vlan = excluded.vlan, "
+                "cell = excluded.cell, position = excluded.position",
+                [
+                    (name, ip, vlans.get(name), robot_group(ip, vlans.get(name)), position)
+                    for position, (name, ip) in enumerate(robots.items())
+                ],
+            )
+            db.execute("DELETE FROM robots WHERE position = -1")
+            db.execute("DELETE FROM group_limits")
+            db.executemany(
+                "INSERT INTO group_limits (name, max_backups, bytes_per_second) "
+                "VALUES (?, ?, ?)",
+                [(group,) + tuple(limit) for group, limit in group_limits.items()],
+            )
+
+    def group_limits(self):
+        with self.connect() as db:
+            rows = db.execute("SELECT * FROM group_limits").fetchall()
+        return {
+            row["name"].upper(): (row["max_backups"], row["bytes_per_second"])
+            for row in rows
+        }
+
+    def set_group_limits(self, limits):
+        with self.connect() as db:
+            db.execute("DELETE FROM group_limits")
+            db.executemany(
+                "INSERT INTO group_limits (name, max_backups, bytes_per_second) "
+                "VALUES (?, ?, ?)",
+                [(group,) + tuple(limit) for group, limit in limits.items()],
+            )
+
+    def set_status(self, statuses):
+        """
+        :param statuses: (robot name, True if online) of the robots checked.
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        with self.connect() as db:
+            db.executemany(
+                "UPDATE robots SET status = ?, "
+                "last_seen = CASE WHEN ? THEN ? ELSE last_seen END WHERE name = ?",
+                [
+                    ("Online" if is_online else "Offline", is_online, now, robot_name)
+                    for robot_name, is_online in statuses
+                ],
+            )
+
+    def record_backups(self, records):
+        """
+        :param records: The robot records of a RunTelemetry, the completed ones are
+            stored as the last backup of their robot.
+        """
+        with self.connect() as db:
+            db.executemany(
+                "UPDATE robots SET last_backup = ?, last_backup_bytes = ? WHERE name = ?",
+                [
+                    (record["started"], record["bytes"], record["robot"])
+                    for record in records
+                    if record["status"] == "Completed"
+                ],
+            )
+
+    def import_ini(self, ini_file_path):
+        backup_directory, robots, vlans = read_project(ini_file_path)
+        self.save_project(
+            backup_directory, dict(robots), vlans, load_group_limits(ini_file_path)
+        )
+
+    def export_ini(self, ini_file_path):
+        backup_directory, robots, vlans = self.load()
+        config = configparser.ConfigParser()
+        config["General"] = {"BackupDirectory": backup_directory}
+        config["Robots"] = dict(robots)
+        if vlans:
+            config["Vlans"] = vlans
+        limits = self.group_limits()
+        if limits:
+            config["GroupLimits"] = {
+                group: f"{max_backups}, {bytes_per_second}"
+                for group, (max_backups, bytes_per_second) in limits.items()
+            }
+        with open(ini_file_path, "w") as configfile:
+            config.write(configfile)
+
+
+def convert_project(project_file_path):
+    """
+    Converts an .ini project to a ProjectStore next to it, or a ProjectStore back to
+    an .ini project.
+
+    :return: The path of the converted project.
+    """
+    base = os.path.splitext(project_file_path)[0]
+    if is_project_store(project_file_path):
+        ProjectStore(project_file_path).export_ini(base + ".ini")
+        return base + ".ini"
+    ProjectStore(base + PROJECT_STORE_EXTENSION).import_ini(project_file_path)
+    return base + PROJECT_STORE_EXTENSION
+
+
+def record_project_run(project_file_path, telemetry=None, statuses=None):
+    """
+    Keeps the last backup and status of the robots in a ProjectStore project, .ini
+    projects have no room for them.
+
+    :param telemetry: The RunTelemetry of a backup run.
+    :param statuses: (robot name, True if online) of a status check.
+    """
+    if not is_project_store(project_file_path):
+        return
+    store = ProjectStore(project_file_path)
+    if telemetry is not None:
+        store.record_backups(telemetry.records())
+    if statuses:
+        store.set_status(statuses)
+
+
+class ConcurrencyController(QObject):
+    """
+    Auto mode of the simultaneous backup count. Every AUTO_INTERVAL the throughput,
+    dropped sessions and login latency of the running backups are measured and the
+    pool of the worker is resized additive increase / multiplicative decrease style:
+    AUTO_STEP more backups while throughput keeps growing, back one step when it
+    stops growing, and halved when sessions drop or logins slow down, the signs of
+    an overloaded network or controller.
+    """
+
+    limit_changed = pyqtSignal(int)
+
+    def __init__(self, worker, minimum=1, maximum=180):
+        super().__init__()
+        self.worker = worker
+        self.logger = worker.logger
+        self.minimum = minimum
+        self.maximum = maximum
+        self.lock = threading.Lock()
+        self.thread = None
+        self.active = False
+        self.limit = AUTO_CONCURRENCY
+
+    def start(self, initial):
+        """
+        Starts measuring a new run at the given simultaneous backup count.
+
+        :param initial: The backup count to start with, usually the last settled one.
+        :return: None
+        """
+        with self.lock:
+            self.limit = min(self.maximum, max(self.minimum, int(initial)))
+            self.last_throughput = None
+            self.last_change = 0
+            self.best_login = None
+            self.throughput_at = {}  # Backup count -> best throughput seen without congestion
+            self.worker.transfer_stats.take()
+            self.active = True
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self.run, name="ExodusAutoConcurrency"
+                )
+                self.thread.daemon = True
+                self.thread.start()
+        self.worker.set_pool_size(self.limit)
+
+    def stop(self):
+        with self.lock:
+            self.active = False
+
+    def settled(self):
+        """
+        :return: The backup count with the best throughput of the run, the current
+            one if nothing could be measured.
+        """
+        with self.lock:
+            if not self.throughput_at:
+                return self.limit
+            return max(self.throughput_at, key=self.throughput_at.get)
+
+    def run(self):
+        while True:
+            time.sleep(AUTO_INTERVAL)
+            with self.lock:
+                if not self.active:
+                    continue
+                limit = self.adjust(*self.worker.transfer_stats.take())
+                if limit == self.limit:
+                    continue
+                if self.logger:
+                    self.logger.info(f"Auto concurrency {self.limit} -> {limit}")
+                self.limit = limit
+            self.worker.set_pool_size(limit)
+            self.limit_changed.emit(limit)
+
+    def adjust(self, transferred, sessions, errors, login_time):
+        """
+        Picks the backup count for the next interval. Must be called with lock held.
+
+        :return: The new simultaneous backup count.
+        """
+        throughput = transferred / AUTO_INTERVAL
+        if login_time is not None:
+            if self.best_login is None or login_time < self.best_login:
+                self.best_login = login_time
+        congested = errors > AUTO_MAX_ERROR_RATE * max(sessions, 1) or (
+            login_time is not None
+            and login_time > max(AUTO_MAX_LATENCY * self.best_login, AUTO_LATENCY_FLOOR)
+        )
+        if congested:
+            self.last_change = 0
+            self.last_throughput = None
+            return max(self.minimum, self.limit // 2)
+
+        self.throughput_at[self.limit] = max(
+            throughput, self.throughput_at.get(self.limit, 0)
+        )
+        busy = self.worker.active_count() >= self.limit
+        with self.worker.queue_condition:
+            waiting = self.worker.queued_jobs
+        last_throughput, self.last_throughput = self.last_throughput, throughput
+        if self.last_change > 0 and last_throughput and throughput < 1.05 * last_throughput:
+            # The last step did not pay off, the network or the controllers are saturated
+            self.last_change = -self.last_change
+            return max(self.minimum, self.limit + self.last_change)
+        if busy and waiting:
+            # Only grow while every session is in use and robots are still waiting
+            self.last_change = min(AUTO_STEP, self.maximum - self.limit)
+            return self.limit + self.last_change
+        self.last_change = 0
+        return self.limit
+
+
+class ScheduledJob:
+    """
+    A recurring backup of a project, started every day at the given times. The start
+    of the robots is spread evenly over window_minutes so a cell's uplink does not
+    see every FTP session open in the same second.
+    """
+
+    def __init__(
+        self,
+        name,
+        times,
+        window_minutes=30,
+        extensions=".",
+        incremental=True,
+        enabled=True,
+        last_run=None,
+    ):
+        self.name = name
+        self.times = times  # ["06:00", "14:00", "22:00"]
+        self.window_minutes = window_minutes
+        self.extensions = extensions
+        self.incremental = incremental
+        self.enabled = enabled
+        self.last_run = last_run
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["name"],
+            data["times"],
+            data.get("window_minutes", 30),
+            data.get("extensions", "."),
+            data.get("incremental", True),
+            data.get("enabled", True),
+            data.get("last_run"),
+        )
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "times": self.times,
+            "window_minutes": self.window_minutes,
+            "extensions": self.extensions,
+            "incremental": self.incremental,
+            "enabled": self.enabled,
+            "last_run": self.last_run,
+        }
+
+    def next_run_time(self, after):
+        """
+        :param after: A datetime.
+        :return: The first start time later than after, None if the job has no times.
+        """
+        candidates = []
+        for day in range(2):
+            date = (after + timedelta(days=day)).date()
+            for start_time in self.times:
+                hour, minute = (int(part) for part in start_time.split(":"))
+                when = datetime(date.year, date.month, date.day, hour, minute)
+                if when > after:
+                    candidates.append(when)
+        return min(candidates, default=None)
+
+
+def schedule_file(project_file_path):
+    # Kept next to the project, Plant.ini -> Plant.schedule.json
+    return os.path.splitext(project_file_path)[0] + ".schedule.json"
+
+
+def load_schedule(project_file_path):
+    try:
+        with open(schedule_file(project_file_path), "r") as f:
+            return [ScheduledJob.from_dict(job) for job in json.load(f)["jobs"]]
+    except (OSError, ValueError, KeyError):
+        return []
+
+
+def save_schedule(project_file_path, jobs):
+    path = schedule_file(project_file_path)
+    with open(path + ".tmp", "w") as f:
+        json.dump({"jobs": [job.to_dict() for job in jobs]}, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+class BackupScheduler(QObject):
+    """
+    Starts the scheduled jobs of the loaded projects. A single thread waits on a heap
+    of due times, both for job starts and for the staggered start of every robot,
+    which is handed to Worker.queue_backup when its slot comes up.
+    """
+
+    run_started = pyqtSignal(str, str, list)  # project file, job name, robot names
+
+    def __init__(self, worker):
+        super().__init__()
+        self.worker = worker
+        self.logger = worker.logger
+        self.jobs = {}  # Project file -> [ScheduledJob]
+        self.staggered = Counter()  # Project file -> robots waiting for their start slot
+        self.heap = []
+        self.sequence = 0
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def set_jobs(self, project_file_path, jobs, save=True):
+        """
+        Replaces the jobs of a project and schedules their next runs.
+
+        :param project_file_path: The project .ini or .exodb file.
+        :param jobs: A list of ScheduledJob.
+        :param save: Also write the jobs to the schedule file of the project.
+        :return: None
+        """
+        if save:
+            save_schedule(project_file_path, jobs)
+        now = datetime.now()
+        with self.condition:
+            self.jobs[project_file_path] = jobs
+            for job in jobs:
+                self.push_job(project_file_path, job, now)
+            self.condition.notify()
+            if self.thread is None and jobs:
+                self.thread = threading.Thread(target=self.run, name="ExodusScheduler")
+                self.thread.daemon = True
+                self.thread.start()
+
+    def load_project(self, project_file_path):
+        jobs = load_schedule(project_file_path)
+        if jobs and project_file_path not in self.jobs:
+            self.set_jobs(project_file_path, jobs, save=False)
+
+    def load_folder(self, folder):
+        # Schedules of every project saved in the folder
+        if not os.path.isdir(folder):
+            return
+        for name in os.listdir(folder):
+            if name.lower().endswith((".ini", PROJECT_STORE_EXTENSION)):
+                project_file_path = os.path.join(folder, name)
+                if os.path.exists(schedule_file(project_file_path)):
+                    self.load_project(project_file_path)
+
+    def is_running(self, project_file_path):
+        """
+        :return: True while robots of a scheduled run wait for their start slot.
+        """
+        with self.condition:
+            return self.staggered[project_file_path] > 0
+
+    def push(self, when, kind, project_file_path, payload):
+        # Must be called with condition held
+        heapq.heappush(
+            self.heap, (when.timestamp(), self.sequence, kind, project_file_path, payload)
+        )
+        self.sequence += 1
+
+    def push_job(self, project_file_path, job, after):
+        # Must be called with condition held
+        when = job.next_run_time(after) if job.enabled else None
+        if when:
+            self.push(when, "job", project_file_path, job)
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.heap or self.heap[0][0] > time.time():
+                    timeout = self.heap[0][0] - time.time() if self.heap else None
+                    self.condition.wait(timeout)
+                when, sequence, kind, project_file_path, payload = heapq.heappop(
+                    self.heap
+                )
+                if kind == "robot":
+                    self.staggered[project_file_path] -= 1
+                elif payload not in self.jobs.get(project_file_path, []):
+                    continue  # The jobs of the project have been edited meanwhile
+            try:
+                if kind == "robot":
+                    self.worker.queue_backup(*payload)
+                else:
+                    self.start_job(project_file_path, payload)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error running schedule: {str(e)}")
+
+    def start_job(self, project_file_path, job):
+        now = datetime.now()
+        backup_directory, robots, vlans = load_project(project_file_path)
+        latest_folder = os.path.join(backup_directory, LATEST_FOLDER)
+        if self.is_running(project_file_path) or self.worker.has_pending(latest_folder):
+            # The previous run of the project is still busy, the archive cannot rotate yet
+            with self.condition:
+                retry = now + timedelta(minutes=SCHEDULE_RETRY_MINUTES)
+                self.push(retry, "job", project_file_path, job)
+            return
+        try:
+            settings = load_app_settings()["Settings"]
+            archive = os.path.join(backup_directory, "Archive")
+            os.makedirs(backup_directory, exist_ok=True)
+            rotate_backups(backup_directory, archive)
+            ArchiveMaintenance(
+                archive,
+                settings.getint("KeepRevisions", fallback=0),
+                settings.getboolean("DedupArchive", fallback=False),
+                self.logger,
+            ).start()
+            previous_backups = find_previous_backups(archive) if job.incremental else {}
+
+            robots = [(robot_name, ip) for robot_name, ip in robots if ip]
+            spacing = job.window_minutes * 60 / max(len(robots), 1)
+            self.worker.set_group_limits(load_group_limits(project_file_path))
+            self.worker.telemetry.begin_run()
+            with self.condition:
+                for index, (robot_name, ip_address) in enumerate(robots):
+                    self.push(
+                        now + timedelta(seconds=index * spacing),
+                        "robot",
+                        project_file_path,
+                        (
+                            robot_name,
+                            ip_address,
+                            latest_folder,
+                            job.extensions,
+                            previous_backups.get(robot_name),
+                            robot_group(ip_address, vlans.get(robot_name)),
+                        ),
+                    )
+                self.staggered[project_file_path] += len(robots)
+                self.condition.notify()
+
+            job.last_run = now.isoformat(timespec="seconds")
+            save_schedule(project_file_path, self.jobs.get(project_file_path, [job]))
+            if self.logger:
+                self.logger.info(
+                    f"Scheduled backup {job.name} of {project_file_path} started, "
+                    f"{len(robots)} robots over {job.window_minutes} min"
+                )
+            self.run_started.emit(
+                project_file_path, job.name, [robot_name for robot_name, ip in robots]
+            )
+        finally:
+            with self.condition:
+                if job in self.jobs.get(project_file_path, []):
+                    self.push_job(project_file_path, job, now)
+
+
+class HeadlessBackup:
+    """
+    Runs the backups of a project from the command line, with the same Worker and
+    archive rotation as the GUI but without a QApplication. Progress signals are
+    delivered with Qt.DirectConnection, so no Qt event loop is needed.
+    """
+
+    def __init__(self, args):
+        self.args = args
+        self.logger = logging.getLogger(__name__)
+        self.results = {}
+        self.results_lock = threading.Lock()
+        self.all_done = threading.Event()
+        self.expected = 0
+        self.concurrency = args.concurrency
+        self.report = None
+
+    def select_robots(self, robots, vlans):
+        """
+        :return: The (robot name, IP address) pairs matching the name and VLAN filters.
+        """
+        selected = []
+        for robot_name, ip_address in robots:
+            if not ip_address:
+                continue
+            if self.args.name and not any(
+                fnmatch.fnmatch(robot_name, pattern.upper()) for pattern in self.args.name
+            ):
+                continue
+            # VLANs are compared upper case, like robot_group does
+            if self.args.vlan and (vlans.get(robot_name) or "").upper() not in {
+                vlan.upper() for vlan in self.args.vlan
+            }:
+                continue
+            selected.append((robot_name, ip_address))
+        return selected
+
+    def online_robots(self, robots, settings):
+        """
+        Sweeps the robots like the Main tab status check.
+
+        :return: The subset of robots that answered.
+        """
+        sweeper = ReachabilitySweeper()
+        sweeper.configure(
+            settings.getint("PingCount", fallback=PING_COUNT),
+            settings.getfloat("PingTimeout", fallback=PING_TIMEOUT),
+            settings.getint("PingParallel", fallback=PING_PARALLEL),
+        )
+        online_rows = set()
+
+        def record_status(sweep_id, row, is_online):
+            if is_online:
+                online_rows.add(row)
+
+        sweeper.status_signal.connect(record_status, Qt.DirectConnection)
+        sweeper.run_sweep(1, list(enumerate(ip for name, ip in robots)), threading.Event())
+        return [robot for row, robot in enumerate(robots) if row in online_rows]
+
+    def record_progress(self, snapshot):
+        with self.results_lock:
+            for robot_name, progress, file_name, error in snapshot:
+                if file_name in ("Completed", "Terminated"):
+                    self.results[robot_name] = (file_name, error)
+                    if not self.args.quiet:
+                        print(
+                            f"{robot_name}: {file_name} {error}".rstrip(),
+                            file=sys.stderr,
+                            flush=True,
+                        )
+            if len(self.results) >= self.expected:
+                self.all_done.set()
+
+    def run(self):
+        """
+        :return: The process exit code, 0 if every selected robot was backed up,
+            1 if any backup failed and 2 if the project could not be used.
+        """
+        args = self.args
+        started = datetime.now()
+        try:
+            backup_directory, robots, vlans = load_project(args.project)
+        except Exception as e:
+            print(f"Error reading project: {str(e)}", file=sys.stderr)
+            return 2
+
+        settings = load_app_settings()["Settings"]
+        selected = self.select_robots(robots, vlans)
+        offline = []
+        if args.online_only and selected:
+            online = self.online_robots(selected, settings)
+            offline = [robot for robot in selected if robot not in online]
+            selected = online
+        if not selected:
+            print("No robots match the selection.", file=sys.stderr)
+            self.write_summary(started, backup_directory, [], offline, vlans)
+            return 2
+
+        archive = os.path.join(backup_directory, "Archive")
+        latest_folder = os.path.join(backup_directory, LATEST_FOLDER)
+        os.makedirs(backup_directory, exist_ok=True)
+        rotate_backups(backup_directory, archive)
+        previous_backups = find_previous_backups(archive) if args.incremental else {}
+
+        worker = Worker()
+        worker.set_engine(
+            args.async_engine or settings.getboolean("AsyncEngine", fallback=False)
+        )
+        worker.set_retry_policy(
+            settings.getint("TransferRetries", fallback=TRANSFER_RETRIES),
+            settings.getfloat("RetryBackoff", fallback=RETRY_BACKOFF),
+            args.host_timeout * 60
+            if args.host_timeout
+            else settings.getfloat("HostTimeout", fallback=HOST_TIMEOUT),
+        )
+        worker.set_group_limits(load_group_limits(args.project))
+        worker.progress_signal.connect(self.record_progress, Qt.DirectConnection)
+        self.expected = len(selected)
+        auto_concurrency = None
+        if args.concurrency == "auto":
+            auto_concurrency = ConcurrencyController(worker)
+            auto_concurrency.start(
+                settings.getint("AutoConcurrency", fallback=AUTO_CONCURRENCY)
+            )
+        else:
+            worker.set_pool_size(args.concurrency)
+        extensions = args.extensions if args.extensions else "."
+        # stdout is kept for the summary, messages of the backup go to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            for robot_name, ip_address in selected:
+                worker.queue_backup(
+                    robot_name,
+                    ip_address,
+                    latest_folder,
+                    extensions,
+                    previous_backups.get(robot_name),
+                    robot_group(ip_address, vlans.get(robot_name)),
+                )
+            if not self.all_done.wait(args.timeout * 60 if args.timeout else None):
+                print(
+                    f"Backups still running after {args.timeout} min, giving up",
+                    file=sys.stderr,
+                )
+                worker.terminate_all_threads()
+                with self.results_lock:
+                    for robot_name, ip_address in selected:
+                        self.results.setdefault(robot_name, ("Terminated", "Timed out"))
+        try:
+            self.report = worker.telemetry.write_report(
+                os.path.join(backup_directory, REPORTS_FOLDER)
+            )
+        except Exception as e:
+            print(f"Error writing run report: {str(e)}", file=sys.stderr)
+        statuses = [(robot_name, False) for robot_name, ip_address in offline]
+        if args.online_only:
+            statuses += [(robot_name, True) for robot_name, ip_address in selected]
+        try:
+            record_project_run(args.project, telemetry=worker.telemetry, statuses=statuses)
+        except Exception as e:
+            print(f"Error saving last backups: {str(e)}", file=sys.stderr)
+        if auto_concurrency:
+            self.concurrency = auto_concurrency.settled()
+            auto_concurrency.stop()
+            config = load_app_settings()
+            config["Settings"]["AutoConcurrency"] = str(self.concurrency)
+            save_app_settings(config)
+
+        ArchiveMaintenance(
+            archive,
+            settings.getint("KeepRevisions", fallback=0),
+            settings.getboolean("DedupArchive", fallback=False),
+            self.logger,
+        ).run()
+        self.write_summary(started, backup_directory, selected, offline, vlans)
+        failed = [name for name, (status, error) in self.results.items() if status != "Completed"]
+        return 1 if failed else 0
+
+    def write_summary(self, started, backup_directory, selected, offline, vlans):
+        robots = []
+        for robot_name, ip_address in selected:
+            status, error = self.results.get(robot_name, ("Terminated", "No result"))
+            robots.append(
+                {
+                    "name": robot_name,
+                    "ip": ip_address,
+                    "vlan": vlans.get(robot_name),
+                    "status": "Completed" if status == "Completed" else "Failed",
+                    "error": error,
+                }
+            )
+        for robot_name, ip_address in offline:
+            robots.append(
+                {
+                    "name": robot_name,
+                    "ip": ip_address,
+                    "vlan": vlans.get(robot_name),
+                    "status": "Offline",
+                    "error": "",
+                }
+            )
+        finished = datetime.now()
+        summary = {
+            "project": os.path.abspath(self.args.project),
+            "backup_directory": backup_directory,
+            "started": started.isoformat(timespec="seconds"),
+            "finished": finished.isoformat(timespec="seconds"),
+            "duration_s": round((finished - started).total_seconds(), 1),
+            "completed": sum(robot["status"] == "Completed" for robot in robots),
+            "failed": sum(robot["status"] == "Failed" for robot in robots),
+            "offline": len(offline),
+            "concurrency": self.concurrency,
+            "report": self.report,
+            "robots": robots,
+        }
+        if self.args.summary:
+            with open(self.args.summary, "w") as f:
+                json.dump(summary, f, indent=2)
+        else:
+            print(json.dumps(summary, indent=2))
+
+
+def concurrency_arg(value):
+    if value.lower() == "auto":
+        return "auto"
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number or 'auto': {value}")
+    if count < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return count
+
+
+def parse_cli_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="Exodus",
+        description="Back up the robots of an Exodus project without the GUI.",
+    )
+    parser.add_argument("project", help="Project .ini or .exodb file")
+    parser.add_argument(
+        "--name",
+        action="append",
+        metavar="PATTERN",
+        help="Only robots whose name matches the pattern, e.g. 'AB123R*'. Repeatable.",
+    )
+    parser.add_argument(
+        "--vlan",
+        action="append",
+        metavar="VLAN",
+        help="Only robots imported from this VLAN. Repeatable.",
+    )
+    parser.add_argument(
+        "--online-only", action="store_true", help="Skip robots that do not answer a ping"
+    )
+    parser.add_argument(
+        "--extensions",
+        nargs="+",
+        metavar="EXT",
+        help="Extensions to back up, e.g. .tp .va .sv (default: all files)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=concurrency_arg,
+        default=10,
+        help="Simultaneous backups, or 'auto' to tune them from the measured "
+        "throughput (default: 10)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Link files unchanged since the last backup instead of downloading them",
+    )
+    parser.add_argument(
+        "--async-engine", action="store_true", help="Use the asyncio transfer engine"
+    )
+    parser.add_argument(
+        "--host-timeout",
+        type=int,
+        metavar="MINUTES",
+        help="Cancel the backup of a single robot after MINUTES with --async-engine "
+        "(default: the Transfer Retry Settings, 30)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=240,
+        metavar="MINUTES",
+        help="Give up on backups still running after MINUTES, 0 for no limit (default: 240)",
+    )
+    parser.add_argument(
+        "--summary", metavar="FILE", help="Write the JSON summary to FILE instead of stdout"
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="Do not print a line per finished robot"
+    )
+    args = parser.parse_args(argv)
+    if args.extensions:
+        args.extensions = [
+            ext if ext.startswith(".") else "." + ext for ext in args.extensions
+        ]
+    return args
+
+
+def run_cli(argv):
+    return HeadlessBackup(parse_cli_args(argv)).run()
+
+
 if __name__ == "__main__":
+    # Workbook imports read in child processes, which the frozen executable starts
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1:
+        # Headless run, e.g. Exodus.py Project.ini --online-only --summary run.json
+        if not any(
+            substring in os.environ.get("COMPUTERNAME", "") for substring in ["MSVN"]
+        ):
+            print("System not valid", file=sys.stderr)
+            sys.exit(2)
+        sys.exit(run_cli(sys.argv[1:]))
+
     username = getpass.getuser()
     app = QApplication(sys.argv)
 
@@ -0,0 +1,390 @@
+# Backup benchmark for Exodus
+#
+# Starts simulated Fanuc controllers on the local machine and times full backup runs
+# through Worker at the simultaneous backup counts of the GUI, e.g.
+#
+#   python ExodusBenchmark.py --robots 60 --latency 5 --loss 0.01 --disconnects 0.002
+#   python ExodusBenchmark.py --levels 10 50 --async-engine --json run.json
+#
+# Requires pyftpdlib (pip install pyftpdlib), which is not needed by Exodus itself.
+#
+# pyftpdlib 1.5.9
+#    - License: MIT License
+#    - Copyright (c) 2007 Giampaolo Rodola
+
+import os
+import sys
+import argparse
+import contextlib
+import importlib.util
+import json
+import logging
+import multiprocessing
+import random
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from PyQt5.QtCore import Qt
+
+import Exodus
+
+RTO = 0.3  # Seconds a lost segment stalls a session, the minimum TCP retransmission timeout
+
+# Typical controller content, (file name pattern, count, smallest size, largest size)
+FANUC_LAYOUT = [
+    ("PNS{:04d}.TP", 0.45, 1000, 60000),
+    ("PNS{:04d}.LS", 0.45, 2000, 90000),
+    ("NUMREG{}.VA", 0.02, 1000, 40000),
+    ("SYSVARS{}.SV", 0.03, 5000, 400000),
+    ("FRAME{}.DG", 0.03, 500, 20000),
+    ("IOCONFIG{}.IO", 0.02, 500, 10000),
+]
+FANUC_FILES = [
+    ("ERRALL.LS", 60000),
+    ("SYSFRAME.SV", 20000),
+    ("SYSMAST.SV", 30000),
+    ("SYSSERVO.SV", 120000),
+    ("POSREG.VA", 30000),
+    ("SUMMARY.DG", 15000),
+]
+
+
+def make_fanuc_tree(root, file_count, seed=1):
+    """
+    Writes a flat /md: tree laid out like the memory device of a Fanuc controller.
+
+    :param root: The FTP root of the simulated controllers.
+    :param file_count: Number of files in /md:.
+    :param seed: Seed of the file sizes, so runs are comparable.
+    :return: (number of files, total bytes)
+    """
+    md = os.path.join(root, "md:")
+    os.makedirs(md, exist_ok=True)
+    rnd = random.Random(seed)
+    files = list(FANUC_FILES)
+    remaining = max(0, file_count - len(files))
+    for pattern, share, smallest, largest in FANUC_LAYOUT:
+        for index in range(max(1, round(remaining * share))):
+            files.append((pattern.format(index), rnd.randint(smallest, largest)))
+    total = 0
+    for name, size in files:
+        with open(os.path.join(md, name), "wb") as f:
+            f.write(os.urandom(size))
+        total += size
+    return len(files), total
+
+
+def serve_robots(root, count, faults, counters, ports, stop):
+    """
+    Runs the simulated controllers, started in a process of its own so they do not
+    share the interpreter of the measured backups.
+
+    :param root: The FTP root with the /md: tree.
+    :param count: Number of controllers, one server with its own port each.
+    :param faults: Dictionary of latency, loss, disconnects and bandwidth.
+    :param counters: Shared (commands, data connections, disconnects) counters.
+    :param ports: Queue that receives the list of ports once the servers listen.
+    :param stop: Event that stops the servers.
+    :return: None
+    """
+    from pyftpdlib.authorizers import DummyAuthorizer
+    from pyftpdlib.handlers import FTPHandler, ThrottledDTPHandler
+    from pyftpdlib.ioloop import IOLoop
+    from pyftpdlib.log import config_logging
+    from pyftpdlib.servers import ThreadedFTPServer
+
+    config_logging(level=logging.ERROR)
+    commands, data_connections, disconnects = counters
+
+    def stall():
+        # Loss is modelled as the stall of a retransmission, the session itself survives
+        if faults["loss"] and random.random() < faults["loss"]:
+            time.sleep(RTO)
+
+    class RobotDTPHandler(ThrottledDTPHandler):
+        ac_out_buffer_size = 16384
+        write_limit = faults["bandwidth"]
+
+        def send(self, data):
+            stall()
+            sent = super().send(data)
+            drop_at = self.cmd_channel.drop_at
+            if drop_at is not None and self.tot_bytes_sent >= drop_at:
+                self.cmd_channel.drop_at = None
+                with disconnects.get_lock():
+                    disconnects.value += 1
+                # The controller drops the whole session, once the current send is done
+                self.cmd_channel.ioloop.call_later(0, self.cmd_channel.close)
+            return sent
+
+    class RobotHandler(FTPHandler):
+        dtp_handler = RobotDTPHandler
+        use_sendfile = False
+        drop_at = None
+
+        def pre_process_command(self, line, cmd, arg):
+            with commands.get_lock():
+                commands.value += 1
+            if cmd in ("PASV", "EPSV", "PORT", "EPRT"):
+                with data_connections.get_lock():
+                    data_connections.value += 1
+            time.sleep(faults["latency"])
+            stall()
+            return super().pre_process_command(line, cmd, arg)
+
+        def ftp_RETR(self, file):
+            if faults["disconnects"] and random.random() < faults["disconnects"]:
+                self.drop_at = random.randint(0, max(0, os.path.getsize(file) - 1))
+            return super().ftp_RETR(file)
+
+    authorizer = DummyAuthorizer()
+    authorizer.add_anonymous(root, perm="elr")
+    RobotHandler.authorizer = authorizer
+    RobotHandler.banner = "FANUC FTP server ready."
+
+    servers = []
+    for _ in range(count):
+        server = ThreadedFTPServer(("127.0.0.1", 0), RobotHandler, ioloop=IOLoop())
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append(server)
+    ports.put([server.address[1] for server in servers])
+    stop.wait()
+    for server in servers:
+        server.close_all()
+
+
+class BenchmarkRun:
+    """
+    Backs up every simulated controller once at the given simultaneous backup count
+    and collects the figures of the run. The Worker is shared by the runs of all
+    levels, its threads live as long as the benchmark.
+    """
+
+    def __init__(self, worker, hosts, threads, timeout, trace_memory):
+        self.worker = worker
+        self.hosts = hosts
+        self.threads = threads
+        self.timeout = timeout
+        self.trace_memory = trace_memory
+        self.results = {}
+        self.lock = threading.Lock()
+        self.all_done = threading.Event()
+
+    def record_progress(self, snapshot):
+        with self.lock:
+            for robot_name, progress, file_name, error in snapshot:
+                if file_name in ("Completed", "Terminated"):
+                    self.results[robot_name] = file_name
+            if len(self.results) >= len(self.hosts):
+                self.all_done.set()
+
+    def run(self, counters):
+        """
+        :param counters: The shared counters of the simulated controllers.
+        :return: A dictionary with the figures of the run.
+        """
+        commands, data_connections, disconnects = counters
+        start_counts = [counter.value for counter in counters]
+        folder = tempfile.mkdtemp(prefix="ExodusBenchmark_")
+        worker = self.worker
+        worker.transfer_stats.take()  # Figures of the previous level
+        worker.progress_signal.connect(self.record_progress, Qt.DirectConnection)
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        worker.set_pool_size(self.threads)
+        for index, host in enumerate(self.hosts):
+            worker.queue_backup(f"R{index:03d}", host, folder, ".")
+        self.all_done.wait(self.timeout)
+        elapsed = time.perf_counter() - started
+        transferred, sessions, errors, login_time = worker.transfer_stats.take()
+        worker.terminate_all_threads()
+        worker.progress_signal.disconnect(self.record_progress)
+        peak = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+        shutil.rmtree(folder, ignore_errors=True)
+
+        with self.lock:
+            # Robots without a final state when the timeout expired count as failed
+            timed_out = len(self.hosts) - len(self.results)
+            completed = sum(status == "Completed" for status in self.results.values())
+        return {
+            "threads": self.threads,
+            "robots": len(self.hosts),
+            "completed": completed,
+            "failed": len(self.hosts) - completed,
+            "timed_out": timed_out,
+            "wall_s": round(elapsed, 2),
+            "mb_per_s": round(transferred / elapsed / 1e6, 2),
+            "bytes": transferred,
+            "sessions": sessions,
+            "retries": errors,
+            "commands": commands.value - start_counts[0],
+            "data_connections": data_connections.value - start_counts[1],
+            "disconnects": disconnects.value - start_counts[2],
+            "mean_login_ms": round(login_time * 1000, 1) if login_time else None,
+            "peak_mb": round(peak / 1e6, 1) if peak is not None else None,
+        }
+
+
+def print_report(rows, file_count, total_bytes):
+    print(f"{file_count} files, {total_bytes / 1e6:.1f} MB per robot")
+    header = (
+        f"{'Threads':>7} {'Robots':>6} {'Failed':>6} {'Wall s':>8} {'MB/s':>7} "
+        f"{'Cmds/robot':>10} {'Data conn':>9} {'Retries':>7} {'Login ms':>8} {'Peak MB':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['threads']:>7} {row['robots']:>6} {row['failed']:>6} "
+            f"{row['wall_s']:>8.2f} {row['mb_per_s']:>7.2f} "
+            f"{row['commands'] / row['robots']:>10.1f} {row['data_connections']:>9} "
+            f"{row['retries']:>7} {str(row['mean_login_ms'] or '-'):>8} "
+            f"{str(row['peak_mb'] or '-'):>7}"
+        )
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="ExodusBenchmark",
+        description="Time Exodus backups against simulated Fanuc controllers.",
+    )
+    parser.add_argument(
+        "--robots", type=int, default=60, help="Simulated controllers (default: 60)"
+    )
+    parser.add_argument(
+        "--files", type=int, default=150, help="Files in /md: of every controller (default: 150)"
+    )
+    parser.add_argument(
+        "--levels",
+        type=int,
+        nargs="+",
+        default=Exodus.THREAD_COUNTS,
+        help="Simultaneous backup counts to run, levels above --robots are skipped "
+        "(default: the choices of the GUI)",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Milliseconds added to every command"
+    )
+    parser.add_argument(
+        "--loss",
+        type=float,
+        default=0.0,
+        help=f"Probability that a command or data block stalls for {RTO:g} s",
+    )
+    parser.add_argument(
+        "--disconnects",
+        type=float,
+        default=0.0,
+        help="Probability that a controller drops the session during a download",
+    )
+    parser.add_argument(
+        "--bandwidth",
+        type=int,
+        default=0,
+        help="KB/s of every controller, 0 for no limit (default: 0)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=Exodus.TRANSFER_RETRIES,
+        help=f"Reconnects per robot (default: {Exodus.TRANSFER_RETRIES})",
+    )
+    parser.add_argument(
+        "--async-engine", action="store_true", help="Use the asyncio transfer engine"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600,
+        help="Seconds a level may run, robots still running then count as failed "
+        "(default: 600)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Do not trace memory, tracing slows the backups down a little",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the simulation")
+    parser.add_argument("--json", metavar="FILE", help="Also write the results as JSON")
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show the messages of the backups"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    if importlib.util.find_spec("pyftpdlib") is None:
+        print("The benchmark needs pyftpdlib: pip install pyftpdlib", file=sys.stderr)
+        return 2
+
+    args = parse_args(argv)
+    random.seed(args.seed)
+    root = tempfile.mkdtemp(prefix="ExodusRobots_")
+    file_count, total_bytes = make_fanuc_tree(root, args.files, args.seed)
+    faults = {
+        "latency": args.latency / 1000,
+        "loss": args.loss,
+        "disconnects": args.disconnects,
+        "bandwidth": args.bandwidth * 1024,
+    }
+    counters = tuple(multiprocessing.Value("q", 0) for _ in range(3))
+    ports = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    servers = multiprocessing.Process(
+        target=serve_robots,
+        args=(root, args.robots, faults, counters, ports, stop),
+        daemon=True,
+    )
+    servers.start()
+    rows = []
+    try:
+        hosts = [f"127.0.0.1:{port}" for port in ports.get(timeout=60)]
+        levels = [level for level in args.levels if level <= args.robots]
+        if not args.no_memory:
+            tracemalloc.start()
+        output = sys.stdout if args.verbose else open(os.devnull, "w")
+        worker = Exodus.Worker()
+        worker.set_engine(args.async_engine)
+        worker.set_retry_policy(args.retries, 0.5)
+        for threads in levels:
+            # Worker prints every file, only the report goes to stdout
+            with contextlib.redirect_stdout(output):
+                row = BenchmarkRun(
+                    worker, hosts, threads, args.timeout, not args.no_memory
+                ).run(counters)
+            rows.append(row)
+            print(
+                f"{threads} threads: {row['wall_s']} s, {row['mb_per_s']} MB/s"
+                + (f", {row['timed_out']} robots timed out" if row["timed_out"] else ""),
+                file=sys.stderr,
+                flush=True,
+            )
+    finally:
+        stop.set()
+        servers.join(10)
+        shutil.rmtree(root, ignore_errors=True)
+
+    print_report(rows, file_count, total_bytes)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "files": file_count,
+                    "bytes_per_robot": total_bytes,
+                    "faults": faults,
+                    "async_engine": args.async_engine,
+                    "runs": rows,
+                },
+                f,
+                indent=2,
+            )
+    return 0 if all(row["failed"] == 0 for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
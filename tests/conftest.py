@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
+
+
+@pytest.fixture
+def exodus_home(tmp_path, monkeypatch):
+    # Settings, projects and caches go to a temporary folder instead of C:\Users\...
+    import Exodus
+
+    home = tmp_path / "Exodus"
+    home.mkdir()
+    monkeypatch.setattr(Exodus, "exodus_home", lambda: str(home))
+    monkeypatch.chdir(tmp_path)
+    return home
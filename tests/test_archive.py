@@ -0,0 +1,81 @@
+import configparser
+
+from Exodus import ARCHIVE_INDEX, LATEST_FOLDER, REPORTS_FOLDER, rotate_backups
+
+
+def make_backup(folder, name="R1_2024-01-15_09H_30M"):
+    backup = folder / name / "md"
+    backup.mkdir(parents=True)
+    (backup / "PROG.TP").write_text("PROG")
+    return folder / name
+
+
+def index_revision(archive):
+    config = configparser.ConfigParser()
+    config.read(archive / ARCHIVE_INDEX)
+    return config.getint("Archive", "LatestRevision")
+
+
+def test_nothing_to_archive(tmp_path):
+    archive = tmp_path / "Archive"
+    assert rotate_backups(str(tmp_path), str(archive)) is None
+    assert (tmp_path / LATEST_FOLDER).is_dir()
+    assert list(archive.iterdir()) == []
+
+
+def test_latest_is_renamed_to_next_revision(tmp_path):
+    archive = tmp_path / "Archive"
+    make_backup(tmp_path / LATEST_FOLDER)
+    assert rotate_backups(str(tmp_path), str(archive)) == 1
+    assert (archive / "Rev1" / "R1_2024-01-15_09H_30M" / "md" / "PROG.TP").exists()
+    assert list((tmp_path / LATEST_FOLDER).iterdir()) == []
+    assert index_revision(archive) == 1
+
+    make_backup(tmp_path / LATEST_FOLDER, "R1_2024-01-16_09H_30M")
+    assert rotate_backups(str(tmp_path), str(archive)) == 2
+    assert (archive / "Rev2" / "R1_2024-01-16_09H_30M").is_dir()
+    assert index_revision(archive) == 2
+
+
+def test_stray_robot_folders_are_adopted(tmp_path):
+    archive = tmp_path / "Archive"
+    make_backup(tmp_path)
+    make_backup(tmp_path, "R2_2024-01-15_09H_31M")
+    (tmp_path / REPORTS_FOLDER).mkdir()
+    (tmp_path / "Notes").mkdir()
+    (tmp_path / "R3_old").mkdir()
+    (tmp_path / "robots.txt").write_text("R1")
+
+    assert rotate_backups(str(tmp_path), str(archive)) == 1
+    assert sorted(p.name for p in (archive / "Rev1").iterdir()) == [
+        "R1_2024-01-15_09H_30M",
+        "R2_2024-01-15_09H_31M",
+    ]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "Archive",
+        LATEST_FOLDER,
+        "Notes",
+        "R3_old",
+        REPORTS_FOLDER,
+        "robots.txt",
+    ]
+
+
+def test_only_other_folders_archive_nothing(tmp_path):
+    (tmp_path / REPORTS_FOLDER).mkdir()
+    (tmp_path / "Notes").mkdir()
+    assert rotate_backups(str(tmp_path), str(tmp_path / "Archive")) is None
+    assert (tmp_path / "Notes").is_dir()
+
+
+def test_taken_revision_is_skipped(tmp_path):
+    archive = tmp_path / "Archive"
+    (archive / "Rev1").mkdir(parents=True)
+    (archive / "Rev2").mkdir()
+    make_backup(tmp_path / LATEST_FOLDER)
+    # Without an index the archive is scanned, a stale index is stepped past
+    assert rotate_backups(str(tmp_path), str(archive)) == 3
+    (archive / "Rev4").mkdir()
+    make_backup(tmp_path / LATEST_FOLDER)
+    assert rotate_backups(str(tmp_path), str(archive)) == 5
+    assert index_revision(archive) == 5
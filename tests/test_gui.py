@@ -0,0 +1,18 @@
+import sys
+
+import Exodus
+
+
+def test_toggle_logger(qapp, exodus_home, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "executable", str(tmp_path / "Exodus.exe"))
+    window = Exodus.FTPBackup()
+    capsys.readouterr()
+
+    window.logger_action.trigger()
+    assert window.logger is not None
+    assert "Logger turned on" in window.status_bar.currentMessage()
+    assert "Error occurred" not in capsys.readouterr().out
+
+    window.logger_action.trigger()
+    assert window.logger is None
+    assert window.status_bar.currentMessage() == "Logger turned off"
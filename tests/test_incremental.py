@@ -0,0 +1,70 @@
+import os
+
+from Exodus import (
+    ManifestEntry,
+    load_backup_manifest,
+    reuse_unchanged_file,
+    robot_md_folder,
+    write_backup_manifest,
+)
+
+MODIFY = "20240115093000"
+
+
+def previous_backup(tmp_path, content=b"PROG"):
+    # A finished backup of one file below md/SUB
+    folder = tmp_path / "R1_2024-01-15_09H_30M"
+    md = tmp_path / robot_md_folder(folder.name) / "SUB"
+    md.mkdir(parents=True)
+    (md / "PROG.TP").write_bytes(content)
+    entry = ManifestEntry(("SUB",), "PROG.TP", len(content), MODIFY)
+    write_backup_manifest(str(folder), "R1", "10.0.0.5", [entry])
+    return load_backup_manifest(str(folder)), entry
+
+
+def test_unchanged_file_is_linked(tmp_path):
+    previous, entry = previous_backup(tmp_path)
+    target = tmp_path / "PROG.TP"
+    assert reuse_unchanged_file(entry, previous, str(target))
+    assert target.read_bytes() == b"PROG"
+    assert os.stat(target).st_nlink == 2
+
+
+def test_leftover_file_is_replaced(tmp_path):
+    previous, entry = previous_backup(tmp_path)
+    target = tmp_path / "PROG.TP"
+    target.write_bytes(b"PR")  # Interrupted download
+    assert reuse_unchanged_file(entry, previous, str(target))
+    assert target.read_bytes() == b"PROG"
+
+
+def test_changed_file_is_downloaded(tmp_path):
+    previous, entry = previous_backup(tmp_path)
+    target = str(tmp_path / "PROG.TP")
+    assert not reuse_unchanged_file(entry._replace(size=5), previous, target)
+    assert not reuse_unchanged_file(
+        entry._replace(modify="20240116093000"), previous, target
+    )
+    assert not reuse_unchanged_file(entry._replace(name="OTHER.TP"), previous, target)
+    assert not os.path.exists(target)
+
+
+def test_file_without_facts_is_downloaded(tmp_path):
+    previous, entry = previous_backup(tmp_path)
+    target = str(tmp_path / "PROG.TP")
+    assert not reuse_unchanged_file(entry._replace(modify=None), previous, target)
+    assert not reuse_unchanged_file(entry._replace(size=None), previous, target)
+
+
+def test_missing_or_altered_copy_is_downloaded(tmp_path):
+    previous, entry = previous_backup(tmp_path)
+    source = previous["SUB/PROG.TP"][2]
+    with open(source, "wb") as f:
+        f.write(b"TRUNC")
+    assert not reuse_unchanged_file(entry, previous, str(tmp_path / "PROG.TP"))
+    os.remove(source)
+    assert not reuse_unchanged_file(entry, previous, str(tmp_path / "PROG.TP"))
+
+
+def test_missing_manifest_reuses_nothing(tmp_path):
+    assert load_backup_manifest(str(tmp_path / "R1_2024-01-15_09H_30M")) == {}
@@ -0,0 +1,91 @@
+from Exodus import (
+    ManifestEntry,
+    ManifestProgress,
+    RemoteEntry,
+    parse_list_line,
+    parse_mlsd_line,
+)
+
+
+def entry(name, size):
+    return ManifestEntry((), name, size, None)
+
+
+def test_progress_counts_bytes():
+    progress = ManifestProgress([entry("A.TP", 300), entry("B.TP", 100)])
+    progress.add_bytes(150)
+    assert progress.percent() == 37
+    progress.add_bytes(150)
+    progress.file_done(entry("A.TP", 300))
+    assert progress.percent() == 75
+    progress.file_done(entry("B.TP", 100))
+    assert progress.percent() == 100
+
+
+def test_progress_settles_on_listed_size():
+    manifest = [entry("A.TP", 100), entry("B.TP", 100)]
+    progress = ManifestProgress(manifest)
+    # A restarted transfer counted part of the file twice
+    progress.add_bytes(80)
+    progress.add_bytes(100)
+    progress.file_done(manifest[0])
+    assert progress.done_bytes == 100
+    assert progress.percent() == 50
+
+    # A resumed file is done without all of its bytes passing add_bytes
+    progress.add_bytes(10)
+    progress.file_done(manifest[1])
+    assert progress.done_bytes == 200
+
+
+def test_progress_counts_files_without_sizes():
+    manifest = [entry("A.TP", 100), entry("B.TP", None), entry("C.TP", None)]
+    progress = ManifestProgress(manifest)
+    assert progress.total_bytes == 0
+    progress.add_bytes(100)
+    assert progress.percent() == 0
+    progress.file_done(manifest[0])
+    assert progress.percent() == 33
+
+
+def test_progress_empty_manifest():
+    assert ManifestProgress([]).percent() == 0
+
+
+def test_parse_list_line_unix():
+    parsed = parse_list_line("-rw-r--r--   1 owner group     1024 Jan 12 10:15 PROG.TP")
+    assert parsed == RemoteEntry("PROG.TP", False, 1024, "Jan 12 10:15")
+
+    parsed = parse_list_line("drwxr-xr-x   2 owner group        0 Feb  3  2023 SUB DIR")
+    assert parsed == RemoteEntry("SUB DIR", True, 0, "Feb  3  2023")
+
+    # Links are listed under their own name, not the target
+    parsed = parse_list_line("lrwxrwxrwx 1 owner 7 Mar  1 08:00 LINK.VA -> OTHER.VA")
+    assert parsed.name == "LINK.VA"
+
+
+def test_parse_list_line_dos():
+    parsed = parse_list_line("01-15-24  09:30AM                 2048 SYSTEM.VA")
+    assert parsed == RemoteEntry("SYSTEM.VA", False, 2048, "01-15-24  09:30AM")
+
+    parsed = parse_list_line("01-15-2024  21:30       <DIR>          MD")
+    assert parsed == RemoteEntry("MD", True, None, "01-15-2024  21:30")
+
+
+def test_parse_list_line_skips_unknown_and_dot_entries():
+    assert parse_list_line("total 42") is None
+    assert parse_list_line("") is None
+    assert parse_list_line("drwxr-xr-x 2 owner group 0 Jan 12 10:15 .") is None
+    assert parse_list_line("drwxr-xr-x 2 owner group 0 Jan 12 10:15 ..") is None
+
+
+def test_parse_mlsd_line():
+    name, facts = parse_mlsd_line(
+        "Type=file;Size=1024;Modify=20240115093000; PROG.TP\r\n"
+    )
+    assert name == "PROG.TP"
+    assert facts == {"type": "file", "size": "1024", "modify": "20240115093000"}
+
+    name, facts = parse_mlsd_line("type=dir; SUB DIR")
+    assert name == "SUB DIR"
+    assert facts == {"type": "dir"}
@@ -0,0 +1,106 @@
+from Exodus import (
+    IP_ADDRESS_REGEX,
+    PROJECT_ROBOT_NAME,
+    merge_imported_robots,
+    validate_robot_rows,
+)
+
+
+def test_valid_rows():
+    robots, errors = validate_robot_rows(
+        [(" ab123r01b01 ", " 10.0.0.1 "), ("123R1", "10.0.0.2"), ("1234r2", "10.0.0.3")]
+    )
+    assert errors == []
+    assert list(robots.items()) == [
+        ("AB123R01B01", "10.0.0.1"),
+        ("123R1", "10.0.0.2"),
+        ("1234R2", "10.0.0.3"),
+    ]
+
+
+def test_every_error_is_reported():
+    robots, errors = validate_robot_rows(
+        [("bad", "10.0.0.1"), ("123R1", "300.1.1.1"), ("x", ""), ("124R1", "10.0.0.4")]
+    )
+    assert robots == {"124R1": "10.0.0.4"}
+    assert errors == [
+        "Row 1: Invalid name: 'BAD'.",
+        "Row 2: Invalid IP address: '300.1.1.1'.",
+        "Row 3: Invalid name: 'X'.",
+        "Row 3: Invalid IP address: ''.",
+    ]
+
+
+def test_rows_keep_their_number_after_blank_rows():
+    robots, errors = validate_robot_rows(
+        [("", ""), ("123R1", "10.0.0.1"), (None, None), ("  ", " "), ("bad", "10.0.0.2")]
+    )
+    assert robots == {"123R1": "10.0.0.1"}
+    assert errors == ["Row 5: Invalid name: 'BAD'."]
+
+
+def test_duplicates_only_clash_with_valid_rows_above():
+    robots, errors = validate_robot_rows(
+        [
+            ("123R1", "999.0.0.1"),  # Invalid, does not claim the name
+            ("123R1", "10.0.0.1"),
+            ("123r1", "10.0.0.2"),
+            ("124R1", "10.0.0.1"),
+            ("125R1", "10.0.0.3"),
+            ("126R1", "10.0.0.2"),  # The duplicate above did not claim the address
+        ]
+    )
+    assert robots == {"123R1": "10.0.0.1", "125R1": "10.0.0.3", "126R1": "10.0.0.2"}
+    assert errors == [
+        "Row 1: Invalid IP address: '999.0.0.1'.",
+        "Row 3: Duplicate name: '123R1'.",
+        "Row 4: Duplicate IP address: '10.0.0.1'.",
+    ]
+
+
+def valid_name(name):
+    return bool(PROJECT_ROBOT_NAME.match(name))
+
+
+def valid_ip(ip):
+    return bool(IP_ADDRESS_REGEX.match(ip))
+
+
+def test_merge_adds_new_robots():
+    added, duplicates, conflicts = merge_imported_robots(
+        [("123R1", "10.0.0.1")],
+        [
+            ("124r1", " 10.0.0.2 ", "VLAN10", "A.xlsx - Sheet1"),
+            ("125R1", "10.0.0.3", None, "A.xlsx - Sheet1"),
+        ],
+        valid_name,
+        valid_ip,
+    )
+    assert added == [("124R1", "10.0.0.2", "VLAN10"), ("125R1", "10.0.0.3", None)]
+    assert duplicates == 0
+    assert conflicts == []
+
+
+def test_merge_counts_duplicates_and_reports_conflicts():
+    added, duplicates, conflicts = merge_imported_robots(
+        [("123r1", "10.0.0.1")],
+        [
+            ("123R1", "10.0.0.1", None, "A.xlsx"),  # Already in the project
+            ("124R1", "10.0.0.2", None, "A.xlsx"),
+            ("124R1", "10.0.0.2", None, "B.xlsx"),  # Same robot in two workbooks
+            ("124R1", "10.0.0.9", None, "B.xlsx"),
+            ("125R1", "10.0.0.1", None, "B.xlsx"),
+            ("bad", "10.0.0.5", None, "B.xlsx"),
+            ("126R1", None, None, "B.xlsx"),
+        ],
+        valid_name,
+        valid_ip,
+    )
+    assert added == [("124R1", "10.0.0.2", None)]
+    assert duplicates == 2
+    assert conflicts == [
+        "124R1 (B.xlsx): 10.0.0.9 differs from 10.0.0.2 (A.xlsx)",
+        "125R1 (B.xlsx): 10.0.0.1 is already used by 123R1 (project)",
+        "BAD (B.xlsx): invalid name",
+        "126R1 (B.xlsx): invalid IP address ''",
+    ]
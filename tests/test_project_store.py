@@ -0,0 +1,88 @@
+import sqlite3
+
+from Exodus import ProjectStore
+
+
+def indexes(path):
+    with sqlite3.connect(path) as db:
+        return {
+            row[0]
+            for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+
+
+def user_version(path):
+    with sqlite3.connect(path) as db:
+        return db.execute("PRAGMA user_version").fetchone()[0]
+
+
+def test_new_store(tmp_path):
+    path = str(tmp_path / "Plant.exodb")
+    store = ProjectStore(path)
+    assert user_version(path) == ProjectStore.VERSION
+    assert {"robots_vlan", "robots_status", "robots_cell"} <= indexes(path)
+    assert store.load() == ("", [], {})
+
+
+def test_current_store_is_not_rebuilt(tmp_path):
+    path = str(tmp_path / "Plant.exodb")
+    ProjectStore(path)
+    with sqlite3.connect(path) as db:
+        db.execute("DROP INDEX robots_vlan")
+    ProjectStore(path)
+    assert "robots_vlan" not in indexes(path)
+
+
+def test_older_store_is_migrated(tmp_path):
+    path = str(tmp_path / "Plant.exodb")
+    ProjectStore(path).save_project("D:\\Backups", {"R1": "10.0.0.5"}, {}, {})
+    with sqlite3.connect(path) as db:
+        db.execute("DROP INDEX robots_cell")
+        db.execute("PRAGMA user_version = 1")
+    store = ProjectStore(path)
+    assert "robots_cell" in indexes(path)
+    assert user_version(path) == ProjectStore.VERSION
+    assert store.load() == ("D:\\Backups", [("R1", "10.0.0.5")], {})
+
+
+def test_save_project_keeps_status_of_remaining_robots(tmp_path):
+    store = ProjectStore(str(tmp_path / "Plant.exodb"))
+    store.save_project(
+        "D:\\Backups",
+        {"R1": "10.0.0.5", "R2": "10.0.0.6", "R3": "10.0.1.7"},
+        {"R3": "vlan20"},
+        {"VLAN20": (2, 0)},
+    )
+    store.set_status([("R1", True), ("R2", False), ("R3", True)])
+
+    # R2 leaves the project, R4 joins, R1 moves to the end with a new address
+    store.save_project(
+        "E:\\Backups", {"R3": "10.0.1.7", "R4": "10.0.0.8", "R1": "10.0.0.9"}, {}, {}
+    )
+    assert store.load() == (
+        "E:\\Backups",
+        [("R3", "10.0.1.7"), ("R4", "10.0.0.8"), ("R1", "10.0.0.9")],
+        {},
+    )
+    robots = {robot["name"]: robot for robot in store.robots()}
+    assert set(robots) == {"R1", "R3", "R4"}
+    assert robots["R1"]["status"] == "Online"
+    assert robots["R1"]["last_seen"] is not None
+    assert robots["R4"]["status"] is None
+    assert [robot["position"] for robot in store.robots()] == [0, 1, 2]
+    assert store.group_limits() == {}
+
+
+def test_robot_filters(tmp_path):
+    store = ProjectStore(str(tmp_path / "Plant.exodb"))
+    store.save_project(
+        "D:\\Backups",
+        {"R1": "10.0.0.5", "R2": "10.0.0.6", "R3": "10.0.1.7"},
+        {"R3": "vlan20"},
+        {},
+    )
+    store.set_status([("R1", True), ("R2", False)])
+    assert [r["name"] for r in store.robots(cell="10.0.0.0/24")] == ["R1", "R2"]
+    assert [r["name"] for r in store.robots(vlan="vlan20")] == ["R3"]
+    assert [r["name"] for r in store.robots(cell="VLAN20")] == ["R3"]
+    assert [r["name"] for r in store.robots(status="Offline")] == ["R2"]
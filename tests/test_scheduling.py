@@ -0,0 +1,185 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import Exodus
+from Exodus import (
+    AUTO_INTERVAL,
+    BackupScheduler,
+    ConcurrencyController,
+    ScheduledJob,
+    TokenBucket,
+    TransferStats,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(Exodus.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_token_bucket_paces_to_rate(clock):
+    bucket = TokenBucket(1000)
+    assert bucket.reserve(600) == 0.0  # Up to one second of burst
+    assert bucket.reserve(600) == pytest.approx(0.2)
+    clock[0] += 0.2
+    assert bucket.reserve(0) == 0.0
+
+
+def test_token_bucket_burst_is_capped(clock):
+    bucket = TokenBucket(1000)
+    bucket.reserve(1000)
+    clock[0] += 60  # An idle group does not save up more than one second
+    assert bucket.reserve(1000) == 0.0
+    assert bucket.reserve(500) == pytest.approx(0.5)
+
+
+def test_token_bucket_is_shared(clock):
+    # Two transfers of a group together wait as long as one transfer of both sizes
+    bucket = TokenBucket(1000)
+    bucket.reserve(1000)
+    assert bucket.reserve(300) == pytest.approx(0.3)
+    assert bucket.reserve(300) == pytest.approx(0.6)
+
+
+class FakeWorker:
+    logger = None
+
+    def __init__(self):
+        self.started = []
+
+    def queue_backup(self, robot_name, *args):
+        self.started.append(("robot", robot_name))
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def start_scheduler(worker):
+    scheduler = BackupScheduler(worker)
+    scheduler.start_job = lambda project, job: worker.started.append(("job", job.name))
+    thread = threading.Thread(target=scheduler.run, daemon=True)
+    thread.start()
+    return scheduler
+
+
+def test_scheduler_runs_entries_in_due_order():
+    worker = FakeWorker()
+    scheduler = start_scheduler(worker)
+    now = datetime.now()
+    night = ScheduledJob("Night", ["22:00"])
+    edited = ScheduledJob("Edited", ["23:00"])
+    with scheduler.condition:
+        scheduler.jobs["A.ini"] = [night]
+        scheduler.push(now - timedelta(seconds=1), "robot", "A.ini", ("R2",))
+        scheduler.push(now - timedelta(seconds=3), "robot", "A.ini", ("R1",))
+        scheduler.push(now - timedelta(seconds=1), "robot", "A.ini", ("R3",))
+        scheduler.push(now - timedelta(seconds=2), "job", "A.ini", edited)
+        scheduler.push(now - timedelta(seconds=2), "job", "A.ini", night)
+        scheduler.push(now + timedelta(hours=1), "robot", "A.ini", ("R9",))
+        scheduler.staggered["A.ini"] = 4
+        scheduler.condition.notify()
+
+    assert wait_until(lambda: len(worker.started) == 4)
+    time.sleep(0.05)
+    # Equal due times keep the order they were pushed in, a job no longer in the
+    # project is dropped and R9 is not due yet
+    assert worker.started == [
+        ("robot", "R1"),
+        ("job", "Night"),
+        ("robot", "R2"),
+        ("robot", "R3"),
+    ]
+    assert scheduler.is_running("A.ini")
+
+
+def test_scheduler_wakes_for_an_earlier_entry():
+    worker = FakeWorker()
+    scheduler = start_scheduler(worker)
+    now = datetime.now()
+    with scheduler.condition:
+        scheduler.push(now + timedelta(hours=1), "robot", "A.ini", ("R9",))
+        scheduler.staggered["A.ini"] = 1
+        scheduler.condition.notify()
+    time.sleep(0.05)
+    with scheduler.condition:
+        scheduler.push(now, "robot", "A.ini", ("R1",))
+        scheduler.staggered["A.ini"] += 1
+        scheduler.condition.notify()
+    assert wait_until(lambda: worker.started == [("robot", "R1")])
+
+
+class FakePool:
+    logger = None
+
+    def __init__(self):
+        self.transfer_stats = TransferStats()
+        self.queue_condition = threading.Condition()
+        self.queued_jobs = 50
+        self.active = 0
+        self.pool_size = 0
+
+    def active_count(self):
+        return self.active
+
+    def set_pool_size(self, size):
+        self.pool_size = size
+
+
+@pytest.fixture
+def controller():
+    controller = ConcurrencyController(FakePool(), maximum=20)
+    controller.start(10)
+    yield controller
+    controller.stop()
+
+
+def step(controller, throughput, sessions=10, errors=0, login_time=0.1, busy=True):
+    # One measuring interval of the run thread
+    controller.worker.active = controller.limit if busy else controller.limit - 1
+    with controller.lock:
+        controller.limit = controller.adjust(
+            throughput * AUTO_INTERVAL, sessions, errors, login_time
+        )
+    return controller.limit
+
+
+def test_auto_concurrency_grows_while_throughput_grows(controller):
+    assert controller.worker.pool_size == 10
+    assert step(controller, 1000) == 12
+    assert step(controller, 1200) == 14
+    # Less than 5 % more, the last step is taken back
+    assert step(controller, 1220) == 12
+    assert controller.settled() == 14
+
+
+def test_auto_concurrency_halves_on_congestion(controller):
+    assert step(controller, 1000) == 12
+    assert step(controller, 1000, sessions=10, errors=1) == 6
+    assert step(controller, 1000, login_time=0.4) == 8  # Below the latency floor
+    assert step(controller, 1000, login_time=1.0) == 4  # Logins ten times slower
+    assert step(controller, 1000, errors=5) == 2
+    assert step(controller, 1000, errors=5) == 1
+    assert step(controller, 1000, errors=5) == 1
+
+
+def test_auto_concurrency_holds_without_demand(controller):
+    assert step(controller, 1000, busy=False) == 10
+    controller.worker.queued_jobs = 0
+    assert step(controller, 1000) == 10
+
+
+def test_auto_concurrency_stops_at_maximum(controller):
+    # Throughput grows with every backup added
+    for _ in range(6):
+        step(controller, 100 * controller.limit)
+    assert controller.limit == 20
+    assert step(controller, 1e9) == 20
@@ -0,0 +1,101 @@
+import time
+
+from PyQt5.QtCore import Qt
+
+import Exodus
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def make_worker():
+    worker = Exodus.Worker()
+    worker.snapshots = []
+    worker.progress_signal.connect(worker.snapshots.append, Qt.DirectConnection)
+    return worker
+
+
+def test_progress_thread_ends_when_idle(qapp, monkeypatch):
+    monkeypatch.setattr(Exodus, "PROGRESS_INTERVAL", 0.02)
+    worker = make_worker()
+    worker.report_progress("R1", 10, "PROG.TP", "")
+    worker.report_progress("R1", 20, "SYSTEM.VA", "")
+    thread = worker.progress_thread
+    assert thread is not None
+    thread.join(5)
+    assert not thread.is_alive()
+    assert worker.progress_thread is None
+    assert worker.snapshots == [[("R1", 20, "SYSTEM.VA", "")]]
+
+    # Started again by the next progress
+    worker.report_progress("R2", 50, "PROG.TP", "")
+    assert worker.progress_thread is not None
+    assert wait_until(lambda: len(worker.snapshots) == 2)
+    assert worker.snapshots[1] == [("R2", 50, "PROG.TP", "")]
+
+
+def test_terminate_stops_progress_thread(qapp, monkeypatch):
+    monkeypatch.setattr(Exodus, "PROGRESS_INTERVAL", 60)
+    worker = make_worker()
+    worker.report_progress("R1", 10, "PROG.TP", "")
+    thread = worker.progress_thread
+    worker.terminate_all_threads()
+    thread.join(5)
+    assert not thread.is_alive()
+    # The last progress is still delivered
+    assert worker.snapshots == [[("R1", 10, "PROG.TP", "")]]
+
+
+class FakeFTP:
+    def __init__(self):
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+def test_reaper_ends_with_last_idle_session():
+    pool = Exodus.FTPConnectionPool(idle_timeout=0.05)
+    ftp = FakeFTP()
+    pool.release("10.0.0.5", ftp)
+    reaper = pool.reaper
+    reaper.join(5)
+    assert not reaper.is_alive()
+    assert ftp.closed
+    assert pool.idle == {}
+    assert pool.reaper is None
+
+    # Started again by the next release
+    pool.release("10.0.0.5", FakeFTP())
+    assert pool.reaper is not None and pool.reaper.is_alive()
+
+
+def test_close_all_stops_reaper():
+    pool = Exodus.FTPConnectionPool(idle_timeout=60)
+    sessions = [FakeFTP(), FakeFTP()]
+    pool.release("10.0.0.5", sessions[0])
+    pool.release("10.0.0.6", sessions[1])
+    reaper = pool.reaper
+    pool.close_all()
+    reaper.join(5)
+    assert not reaper.is_alive()
+    assert all(ftp.closed for ftp in sessions)
+    assert pool.reaper is None
+
+
+def test_terminate_closes_idle_sessions(qapp):
+    worker = make_worker()
+    ftp = FakeFTP()
+    worker.connections.release("10.0.0.5", ftp)
+    reaper = worker.connections.reaper
+    worker.terminate_all_threads()
+    reaper.join(5)
+    assert not reaper.is_alive()
+    assert ftp.closed